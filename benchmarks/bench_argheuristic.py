@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Throughput of the Lang & Lapata argument heuristic (--heuristic-rules) on
+every verb of a parsed corpus
+
+argheuristic.find_args used to build a tree of RelationTreeNode, with a
+Relation per edge, for every predicate, and to apply the rules to it with
+list membership tests. This former implementation is kept here as the
+reference for the compiled rules over the relations of each tree, which
+are built once and shared by the predicates of the tree. Both must find the
+same arguments.
+
+    PYTHONPATH=src python benchmarks/bench_argheuristic.py [data/framenet_parsed]
+"""
+
+import argparse
+import pathlib
+
+from argheuristic import (SentenceRelations, build_relation_tree, find_args,
+                          rule1_pos, rule2_relations, rule4_relations)
+from benchutil import measure, print_table
+from conllparsedreader import ConllParsedReader
+import options
+
+
+def legacy_find_args(predicate_node):
+    tree = build_relation_tree(predicate_node)
+
+    for elem in tree:
+        if elem.node.pos in rule1_pos:
+            elem.discard()
+
+    for elem in tree:
+        if elem.relation in rule2_relations:
+            elem.discard()
+
+    candidate = None
+    best_position = -1
+    for elem in tree:
+        if (elem.node.deprel == "SBJ" and
+                elem.node.begin_word < tree.node.begin_word and
+                elem.node.begin_word > best_position):
+            candidate, best_position = elem, elem.node.begin
+    if candidate is not None and tree.node.is_in(candidate.node.father):
+        candidate.keep()
+
+    def rule4(tree):
+        for elem1 in tree.children:
+            if elem1.relation in rule4_relations:
+                for elem2 in elem1:
+                    elem2.discard()
+            else:
+                rule4(elem1)
+    rule4(tree)
+
+    for elem in tree:
+        if any([x.deprel == "VC" for x in elem.node.children]):
+            elem.discard()
+
+    for elem in tree.children:
+        if (elem.node != tree.node.father and
+                elem.node.begin_word > tree.node.begin_word):
+            elem.keep()
+
+    for elem in tree:
+        elem.discard()
+
+    arg_list = [x for x in tree if x.status == "KEPT"]
+    for arg_node in arg_list:
+        for subnode in arg_node:
+            if subnode in arg_list:
+                arg_node.status = "DISCARDED"
+                break
+
+    return [x.node for x in tree if x.status == "KEPT"]
+
+
+def legacy(trees):
+    return [[arg.word_id for arg in legacy_find_args(node)]
+            for tree in trees for node in tree.preorder()
+            if node.pos in options.Options.predicate_pos]
+
+
+def compiled(trees):
+    result = []
+    for tree in trees:
+        relations = None
+        for node in tree.preorder():
+            if node.pos in options.Options.predicate_pos:
+                if relations is None:
+                    relations = SentenceRelations(tree)
+                result.append([arg.word_id
+                               for arg in find_args(node, relations)])
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', nargs='?', type=pathlib.Path,
+                        default=pathlib.Path('data/framenet_parsed'))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    reader = ConllParsedReader()
+    trees = [tree for filename in sorted(args.corpus.glob('*.conll'))
+             for _, _, tree in reader.sentence_trees(filename)]
+
+    legacy_time, legacy_args = measure(legacy, trees, repeat=args.repeat)
+    compiled_time, compiled_args = measure(compiled, trees,
+                                           repeat=args.repeat)
+
+    print('{} trees, {} predicates, {} arguments, same arguments: {}'.format(
+        len(trees), len(compiled_args), sum(map(len, compiled_args)),
+        legacy_args == compiled_args))
+    print('{:.0f} then {:.0f} predicates/s'.format(
+        len(compiled_args) / legacy_time, len(compiled_args) / compiled_time))
+    print_table('rules', [('legacy', legacy_time),
+                          ('compiled', compiled_time)])
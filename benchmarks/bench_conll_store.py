@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Time of the access to some sentences of the parse files of a corpus
+
+FNAllReader used to build the trees of every sentence of a parse file before
+reading its annotations. This is compared with ConllStore, which maps the
+file, loads the index of its sentences and only builds the trees of the
+sentences accessed, here a random sample of them.
+
+    PYTHONPATH=src python benchmarks/bench_conll_store.py [data/framenet_parsed]
+"""
+
+import argparse
+import pathlib
+import random
+
+from benchutil import measure, print_table
+from conllreader import SyntacticTreeBuilder, conll_blocks
+from conllstore import ConllStore
+
+
+def eager(filename, sentence_ids):
+    tree_dict = {sentence_id: SyntacticTreeBuilder('\n'.join(lines)).tree_list
+                 for sentence_id, lines in enumerate(conll_blocks(filename))}
+    return [tree_dict[sentence_id][0].flat() for sentence_id in sentence_ids]
+
+
+def lazy(filename, sentence_ids):
+    with ConllStore(filename) as store:
+        return [store[sentence_id][0].flat() for sentence_id in sentence_ids]
+
+
+def read_samples(read, samples):
+    for filename, sentence_ids in samples:
+        read(filename, sentence_ids)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', nargs='?', type=pathlib.Path,
+                        default=pathlib.Path('data/framenet_parsed'))
+    parser.add_argument('--fraction', type=float, default=0.1,
+                        help='fraction of the sentences accessed')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    samples = []
+    for filename in sorted(args.corpus.glob('*.conll')):
+        sentences = len(list(conll_blocks(filename)))
+        samples.append((filename, rng.sample(
+            range(sentences), max(1, int(sentences * args.fraction)))))
+    differences = sum(1 for filename, sentence_ids in samples
+                      if eager(filename, sentence_ids) !=
+                      lazy(filename, sentence_ids))
+    legacy, _ = measure(read_samples, eager, samples, repeat=args.repeat)
+    current, _ = measure(read_samples, lazy, samples, repeat=args.repeat)
+
+    print('{} files, {} sentences accessed, {} different files'.format(
+        len(samples), sum(len(ids) for _, ids in samples), differences))
+    print_table('trees', [('eager', legacy), ('store', current)])
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Time of the tokenization of the sentences of a parsed corpus
+
+SyntacticTreeBuilder used to drop the comment lines, join the sentence back,
+collapse its blank lines with regular expressions until nothing changed and
+split every line twice: this former normalizer is kept here as the reference
+for conllreader.conll_columns, and both must give the same columns. The time
+of the whole SyntacticTreeBuilder and ConllSentence construction is given
+too.
+
+    PYTHONPATH=src python benchmarks/bench_conll_tokenizer.py [data/framenet_parsed]
+"""
+
+import argparse
+import pathlib
+import re
+
+from benchutil import measure, print_table
+from conllreader import (ConllColumns, SyntacticTreeBuilder, conll_blocks,
+                         conll_columns)
+from conllsentence import ConllSentence, StringTable
+
+
+def legacy_columns(conll_tree):
+    columns = ConllColumns(*([] for _ in ConllColumns._fields))
+    filtered_lines = [line for line in conll_tree.splitlines()
+                      if not line.strip().startswith("#")]
+    filtered_text = "\n".join(filtered_lines)
+    cleaned_text = re.sub(r"\n\s+\n", "\n\n", filtered_text)
+    cleaned_text2 = re.sub(r"\n\n\n", "\n\n", cleaned_text)
+    while cleaned_text2 != cleaned_text:
+        cleaned_text = cleaned_text2
+        cleaned_text2 = re.sub(r"\n\n\n", "\n\n", cleaned_text)
+
+    for l in cleaned_text2.splitlines():
+        if not l or l.strip()[0] == "#":
+            continue
+        split_line = l.split("\t")
+        if len(split_line) == 11:
+            (word_id, form, lemma, cpos, pos, namedEntityType, features,
+             head, deprel, phead, pdeprel) = l.split("\t")
+        elif len(split_line) == 10:
+            (word_id, form, lemma, cpos, pos, features,
+             head, deprel, phead, pdeprel) = l.split("\t")
+            namedEntityType = '_'
+        else:
+            continue
+        word_id = int(word_id)
+        deprel = deprel if deprel not in ['-', '_'] else 'ROOT'
+        if deprel == 'root':
+            deprel = 'ROOT'
+        head = int(head) if head not in ['-', '_'] else None
+        if head is None and deprel == 'ROOT':
+            head = 0
+        pos = pos if pos != "_" else cpos
+        for column, value in zip(columns, (
+                word_id, form, lemma, cpos, pos, namedEntityType, features,
+                head, deprel, phead, pdeprel)):
+            column.append(value)
+    return columns
+
+
+def each(function, sentences):
+    for sentence in sentences:
+        function(sentence)
+
+
+def best_time(function, sentences, repeat):
+    return measure(each, function, sentences, repeat=repeat)[0]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', nargs='?', type=pathlib.Path,
+                        default=pathlib.Path('data/framenet_parsed'))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    blocks = [lines for filename in sorted(args.corpus.glob('*.conll'))
+              for lines in conll_blocks(filename)]
+    texts = ['\n'.join(lines) for lines in blocks]
+    differences = sum(1 for text in texts
+                      if conll_columns(text.splitlines()) !=
+                      legacy_columns(text))
+    strings = StringTable()
+    tokenizers = [
+        ('legacy', best_time(legacy_columns, texts, args.repeat)),
+        ('single-pass', best_time(
+            lambda text: conll_columns(text.splitlines()), texts, args.repeat)),
+    ]
+    builders = [
+        ('SyntacticTreeBuilder', best_time(SyntacticTreeBuilder, texts,
+                                           args.repeat)),
+        ('ConllSentence', best_time(
+            lambda lines: ConllSentence(lines, strings), blocks, args.repeat)),
+    ]
+
+    print('{} sentences, {} different columns'.format(len(texts),
+                                                      differences))
+    print_table('tokenizer', tokenizers)
+    print_table('builder', builders)
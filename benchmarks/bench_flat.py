@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Time of SyntacticTreeNode.flat on every node of a parsed corpus
+
+flat() used to print the subtree with its positions, parse this string back
+with a regular expression and sort the words: this former implementation is
+kept here as the reference, and both must give the same texts.
+
+    PYTHONPATH=src python benchmarks/bench_flat.py [data/framenet_parsed]
+"""
+
+import argparse
+import pathlib
+import re
+
+from benchutil import measure, print_table
+from conllreader import SyntacticTreeBuilder, conll_blocks
+
+LEGACY_PATTERN = re.compile(r'\(([^()\s]+(?:/\w+/\d+/\d+/\d+)\s+.*?\s(?=\(|\)))')
+
+
+def legacy_str2(node):
+    result = (f"({node.pos}/{node.deprel}/{node.position}/{node.begin}/"
+              f"{node.end}/{node.begin_word} {node.word}")
+    for child_node in node.children:
+        result += " " + legacy_str2(child_node)
+    return result + " )"
+
+
+def legacy_flat(node):
+    words = []
+    for match in LEGACY_PATTERN.findall(legacy_str2(node)):
+        parts = match.split()
+        words.append((int(parts[0].split('/')[5]), parts[1]))
+    return ' '.join(word for _, word in sorted(words, key=lambda x: x[0]))
+
+
+def all_nodes(corpus):
+    nodes = []
+    for filename in sorted(corpus.glob('*.conll')):
+        for lines in conll_blocks(filename):
+            nodes.extend(SyntacticTreeBuilder('\n'.join(lines)).nodes)
+    return nodes
+
+
+def flat_all(flat, nodes):
+    for node in nodes:
+        flat(node)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', nargs='?', type=pathlib.Path,
+                        default=pathlib.Path('data/framenet_parsed'))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    nodes = all_nodes(args.corpus)
+    differences = sum(1 for node in nodes
+                      if node.flat() != legacy_flat(node))
+    legacy, _ = measure(flat_all, legacy_flat, nodes, repeat=args.repeat)
+    current, _ = measure(flat_all, lambda node: node.flat(), nodes,
+                         repeat=args.repeat)
+
+    print('{} nodes, {} different texts'.format(len(nodes), differences))
+    print_table('flat', [('legacy', legacy), ('spans', current)])
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Time of the search of the node of every gold argument of a corpus
+
+headwordextractor.headword used to search the node whose words overlap the
+most with the argument in the whole tree. This search is compared with the
+lookup of the node by the span of the argument, which falls back to the
+search when the span is not aligned with the parse: both must give the same
+nodes, except when the words of the argument occur twice in the sentence.
+
+    PYTHONPATH=src python benchmarks/bench_headword.py [data/framenet_parsed]
+"""
+
+import argparse
+import pathlib
+
+from benchutil import measure, print_table
+from conllparsedreader import ConllParsedReader
+import framenetreader
+import paths
+
+
+def gold_args(corpus, language):
+    """The (argument, tree) pairs of the annotated files of the corpus"""
+    reader = ConllParsedReader()
+    pairs = []
+    for parse_file in sorted(corpus.glob('*.conll')):
+        annotation_file = (paths.Paths.framenet_fulltext(language) /
+                           (parse_file.stem + '.xml'))
+        if not annotation_file.exists():
+            continue
+        trees = {sentence_id: tree for sentence_id, _, tree
+                 in reader.sentence_trees(parse_file)}
+        for frame in framenetreader.FulltextReader(
+                annotation_file, False, language=language).frames:
+            tree = trees.get(frame.sentence_id)
+            if tree is None:
+                continue
+            pairs.extend((arg, tree) for arg in frame.args
+                         if arg.instanciated)
+    return pairs
+
+
+def closest_match(arg, tree):
+    return tree.closest_match_as_node(arg)
+
+
+def span_lookup(arg, tree):
+    node = tree.node_at_span(arg)
+    return tree.closest_match_as_node(arg) if node is None else node
+
+
+def find_all(find, pairs):
+    return [find(arg, tree) for arg, tree in pairs]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', nargs='?', type=pathlib.Path,
+                        default=pathlib.Path('data/framenet_parsed'))
+    parser.add_argument('--language', default='eng')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    pairs = gold_args(args.corpus, args.language)
+    fallbacks = sum(1 for arg, tree in pairs if tree.node_at_span(arg) is None)
+    legacy, legacy_nodes = measure(find_all, closest_match, pairs,
+                                   repeat=args.repeat)
+    current, current_nodes = measure(find_all, span_lookup, pairs,
+                                     repeat=args.repeat)
+
+    print('{} arguments, {} fallbacks, {} different nodes'.format(
+        len(pairs), fallbacks,
+        sum(1 for legacy_node, node in zip(legacy_nodes, current_nodes)
+            if legacy_node != node)))
+    print_table('search', [('lcs', legacy), ('span', current)])
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Cold-start time of the lexicons XML parsing against the number of processes
+
+Each measure is done in a fresh interpreter and without the snapshots of
+lexiconcache, so that every file is parsed.
+
+    PYTHONPATH=src python benchmarks/bench_parallel_loading.py --language eng
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+MEASURE = """
+import time
+import options
+options.Options.lexicon_cache = False
+import framenet, framenetcoreargs, paths, verbnetreader
+
+def measure(function):
+    t = time.perf_counter()
+    function()
+    return time.perf_counter() - t
+
+resources = {{
+    'verbnet': lambda: verbnetreader.VerbnetReader(
+        paths.Paths.verbnet_path({language!r}), {jobs}),
+    'framenet': lambda: framenet.FrameNetReader(
+        paths.Paths.framenet_path({language!r}), framenet.FrameNet(),
+        jobs={jobs}),
+    'framenet-index': lambda: framenet.FrameNetReader(
+        paths.Paths.framenet_path({language!r}), framenet.FrameNet(),
+        lazy=True, jobs={jobs}),
+    'core-args': lambda: framenetcoreargs.CoreArgsFinder().load_data_from_xml(
+        paths.Paths.framenet_frames({language!r}), {jobs}),
+}}
+print(measure(resources[{resource!r}]))
+"""
+
+RESOURCES = ['verbnet', 'framenet', 'framenet-index', 'core-args']
+
+
+def run_once(language, resource, jobs):
+    output = subprocess.run(
+        [sys.executable, '-c', MEASURE.format(
+            language=language, resource=resource, jobs=jobs)],
+        check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return float(output)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--language', choices=['eng', 'fre'], default='eng')
+    parser.add_argument('--resource', choices=RESOURCES, action='append',
+                        help='Resource to load (default: all of them)')
+    parser.add_argument('--jobs', type=int, action='append',
+                        help='Number of processes to measure (default: '
+                             'powers of two up to the number of cores)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    all_jobs = args.jobs
+    if not all_jobs:
+        all_jobs = [1]
+        while all_jobs[-1] * 2 <= (os.cpu_count() or 1):
+            all_jobs.append(all_jobs[-1] * 2)
+
+    print('{:<15} {:>5} {:>9} {:>8}'.format(
+        'resource', 'jobs', 'best (s)', 'speedup'))
+    for resource in args.resource or RESOURCES:
+        serial = None
+        for jobs in all_jobs:
+            best = min(run_once(args.language, resource, jobs)
+                       for _ in range(args.repeat))
+            if serial is None:
+                serial = best
+            print('{:<15} {:>5} {:>9.3f} {:>7.2f}x'.format(
+                resource, jobs, best, serial / best))
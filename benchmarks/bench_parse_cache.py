@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Time of the reading of the sentence trees of a parsed corpus, with and
+without the parse cache
+
+The cache is filled in a temporary directory first, then every file is read
+by ConllParsedReader, parsing the CoNLL text or rebuilding the sentences from
+the cache, and both must give the same sentences.
+
+    PYTHONPATH=src python benchmarks/bench_parse_cache.py [data/framenet_parsed]
+"""
+
+import argparse
+import pathlib
+import tempfile
+import time
+
+from benchutil import measure, print_table
+from conllparsedreader import ConllParsedReader
+import options
+import parsecache
+import paths
+
+
+def read(files):
+    reader = ConllParsedReader()
+    return [(sentence_id, sentence, tree.flat())
+            for filename in files
+            for sentence_id, sentence, tree in reader.sentence_trees(filename)]
+
+
+def measure_read(files, parse_cache, repeat):
+    options.Options.parse_cache = parse_cache
+    return measure(read, files, repeat=repeat)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', nargs='?', type=pathlib.Path,
+                        default=pathlib.Path('data/framenet_parsed'))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    files = sorted(args.corpus.glob('*.conll'))
+    with tempfile.TemporaryDirectory() as cache:
+        paths.Paths.CACHE = pathlib.Path(cache)
+        t = time.perf_counter()
+        for filename in files:
+            parsecache.load(filename).close()
+        warm = time.perf_counter() - t
+        text, text_trees = measure_read(files, False, args.repeat)
+        cached, cached_trees = measure_read(files, True, args.repeat)
+
+    print('{} files, {} trees, same trees: {}'.format(
+        len(files), len(text_trees), text_trees == cached_trees))
+    print_table('read', [('text', text), ('cache', cached)])
+    print('{:<8} {:>9.3f}'.format('warm-up', warm))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Time of the detection of the predicate candidates of a parsed corpus
+
+ArgGuesser used to lemmatize the lemma of every token with WordNet before
+checking its part-of-speech. This former detection is kept here as the
+reference. It is compared with the current one, which filters the
+part-of-speech first and then looks up the lemma once it has been seen, with
+a fresh lemma cache. Both must give the same candidates.
+
+    PYTHONPATH=src python benchmarks/bench_predicate_detection.py \\
+        [data/lu_parsed] --language eng
+"""
+
+import argparse
+import pathlib
+
+from benchutil import measure, print_table
+from conllparsedreader import ConllParsedReader
+import argguesser
+import options
+import paths
+import verbnetreader
+
+
+def legacy_candidates(trees, frames_for_verb):
+    from nltk.stem import WordNetLemmatizer  # type: ignore
+    lemmatizer = WordNetLemmatizer()
+    return [node.word_id for tree in trees for node in tree.preorder()
+            if lemmatizer.lemmatize(node.lemma, 'v') in frames_for_verb
+            and node.pos in options.Options.predicate_pos]
+
+
+def candidates(trees, frames_for_verb):
+    argguesser.lemmatize.cache_clear()
+    guesser = argguesser.ArgGuesser(frames_for_verb)
+    return [node.word_id for tree in trees for node in tree.preorder()
+            if guesser._is_predicate(node)
+            and guesser._in_verbnet(node.lemma)]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('corpus', nargs='?', type=pathlib.Path,
+                        default=pathlib.Path('data/lu_parsed'))
+    parser.add_argument('--language', default='eng')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    frames_for_verb, _ = verbnetreader.init_verbnet(
+        paths.Paths.verbnet_path(args.language))
+    reader = ConllParsedReader()
+    trees = [tree for filename in sorted(args.corpus.glob('*.conll'))
+             for _, _, tree in reader.sentence_trees(filename)]
+    # Load WordNet before timing
+    argguesser.lemmatize_verb('be')
+
+    legacy, legacy_ids = measure(legacy_candidates, trees, frames_for_verb,
+                                 repeat=args.repeat)
+    current, current_ids = measure(candidates, trees, frames_for_verb,
+                                   repeat=args.repeat)
+
+    print('{} sentences, {} tokens, {} candidates, same candidates: {}'.format(
+        len(trees), sum(tree.subtree_size for tree in trees), len(current_ids),
+        legacy_ids == current_ids))
+    print_table('detect', [('legacy', legacy), ('cached', current)])
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Time of the FrameNet semantic CoNLL output of a long document with dense
+predicates
+
+ConllSemanticAppender used to rebuild the words, the text and the character
+to token list of the sentence for every argument of every frame instance.
+This former lookup is kept here as the reference for the offsets computed
+once per sentence, and both must write the same file.
+
+    PYTHONPATH=src python benchmarks/bench_semantic_appender.py [--sentences 200]
+"""
+
+import argparse
+import io
+import random
+import tempfile
+import types
+
+from benchutil import measure, print_table
+from conllreader import ConllSemanticAppender
+
+
+class LegacyAppender(ConllSemanticAppender):
+
+    def token_at(self, sentence_matrix, char):
+        words = [line[1] for line in sentence_matrix if line]
+        char_to_word = []
+        for i, word in enumerate(words):
+            for _ in word:
+                char_to_word.append(i)
+            char_to_word.append(i)
+        return char_to_word[char]
+
+
+def document(sentences, words, predicates, args, seed=0):
+    """A CoNLL document and the frame instances of each of its sentences"""
+    rng = random.Random(seed)
+    lines, annotations = [], []
+    for sentence_id in range(sentences):
+        forms = [rng.choice(['the', 'nuclear', 'program', 'was', 'set',
+                             'to', 'support', 'a', 'continued', '.'])
+                 for _ in range(words)]
+        begins = []
+        offset = 0
+        for word_id, form in enumerate(forms, start=1):
+            begins.append(offset)
+            offset += len(form) + 1
+            lines.append(f'{word_id}\t{form}\t{form}\tNN\tNN\t-\t0\tROOT\t-\t-')
+        lines.append('')
+        for tokenid in rng.sample(range(1, words + 1), predicates):
+            frame_args = [types.SimpleNamespace(
+                begin=rng.choice(begins), position=rng.randint(1, 3),
+                role=rng.choice(['Agent', 'Theme', 'Goal']), text='')
+                for _ in range(args)]
+            annotations.append([types.SimpleNamespace(
+                sentence_id=sentence_id, frame_name='Placing', args=frame_args,
+                predicate=types.SimpleNamespace(tokenid=tokenid))])
+    return '\n'.join(lines), annotations
+
+
+def write(appender_class, filename, annotations):
+    output = io.StringIO()
+    appender = appender_class(filename, output)
+    for frame_instances in annotations:
+        appender.add_framenet_frame_annotation(frame_instances)
+    appender.close()
+    return output
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sentences', type=int, default=200)
+    parser.add_argument('--words', type=int, default=60)
+    parser.add_argument('--predicates', type=int, default=20,
+                        help='frame annotations per sentence')
+    parser.add_argument('--args', type=int, default=4,
+                        help='arguments per frame instance')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    text, annotations = document(args.sentences, args.words,
+                                 args.predicates, args.args)
+    with tempfile.NamedTemporaryFile('w', suffix='.conll') as conll:
+        conll.write(text)
+        conll.flush()
+        legacy, legacy_output = measure(write, LegacyAppender, conll.name,
+                                        annotations, repeat=args.repeat)
+        current, output = measure(write, ConllSemanticAppender, conll.name,
+                                  annotations, repeat=args.repeat)
+
+    print('{} sentences, {} frame annotations, same output: {}'.format(
+        args.sentences, len(annotations), output.getvalue() ==
+        legacy_output.getvalue()))
+    print_table('offsets', [('legacy', legacy), ('cached', current)])
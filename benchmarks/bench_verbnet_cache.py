@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Cold versus warm start-up time of init_verbnet
+
+Each measure is done in a fresh interpreter, as a knowledgesrl.py run would:
+the cold start parses the XML files and writes the snapshot, the warm start
+reads the snapshot back.
+
+    PYTHONPATH=src python benchmarks/bench_verbnet_cache.py --language eng
+"""
+
+import argparse
+import pathlib
+import subprocess
+import sys
+
+import lexiconcache
+import paths
+
+MEASURE = """
+import pathlib, time
+t = time.perf_counter()
+import verbnetreader
+frames_for_verb, classes = verbnetreader.init_verbnet(pathlib.Path({path!r}))
+print(time.perf_counter() - t, len(frames_for_verb))
+"""
+
+
+def run_once(path):
+    output = subprocess.run(
+        [sys.executable, '-c', MEASURE.format(path=str(path))],
+        check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    seconds, num_verbs = output.split()
+    return float(seconds), int(num_verbs)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--language', choices=['eng', 'fre'], default='eng')
+    parser.add_argument('--path', type=pathlib.Path, default=None,
+                        help='VerbNet directory (default: the one of '
+                             '--language)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    path = args.path or paths.Paths.verbnet_path(args.language)
+    snapshot = lexiconcache.cache_file('verbnet', path)
+
+    cold, warm = [], []
+    for _ in range(args.repeat):
+        if snapshot.exists():
+            snapshot.unlink()
+        seconds, num_verbs = run_once(path)
+        cold.append(seconds)
+        seconds, num_verbs = run_once(path)
+        warm.append(seconds)
+
+    print('VerbNet {}: {} verbs, snapshot {} ({} kB)'.format(
+        path, num_verbs, snapshot, snapshot.stat().st_size // 1024))
+    print('cold: best {:.3f}s, mean {:.3f}s'.format(
+        min(cold), sum(cold) / len(cold)))
+    print('warm: best {:.3f}s, mean {:.3f}s'.format(
+        min(warm), sum(warm) / len(warm)))
+    print('speedup: {:.1f}x'.format(min(cold) / min(warm)))
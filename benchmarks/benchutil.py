@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Timing and reporting shared by the benchmarks
+
+The benchmarks compare a former implementation, the reference, with the
+current one: each is run several times and the best time is kept.
+
+    Defines the functions:
+    * measure
+    * print_table
+"""
+
+import time
+
+
+def measure(function, *args, repeat=3):
+    """Time the best of several calls of a function
+
+    :param function: The function to time, called with args.
+    :type function: callable.
+    :param repeat: The number of calls.
+    :type repeat: int.
+    :returns: (float, object) -- the best time in seconds, and the result of
+        the last call
+    """
+    best, result = None, None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - t
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def print_table(title, timings):
+    """Print the best time of each implementation, and its speedup over the
+    first one
+
+    :param title: The header of the column of the implementations.
+    :type title: str.
+    :param timings: The (name, best time) of each implementation, the
+        reference first.
+    :type timings: list.
+    """
+    width = max([8, len(title)] + [len(name) for name, _ in timings])
+    print('{:<{}} {:>9} {:>8}'.format(title, width, 'best (s)', 'speedup'))
+    reference = timings[0][1]
+    for name, elapsed in timings:
+        print('{:<{}} {:>9.3f} {:>7.2f}x'.format(name, width, elapsed,
+                                                 reference / elapsed))
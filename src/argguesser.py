@@ -10,17 +10,42 @@
 from conllparsedreader import ConllParsedReader
 from framenetframe import FrameInstance, Predicate, Word, Arg
 from verbnetprepclasses import all_preps
-from argheuristic import find_args
+from argheuristic import SentenceRelations, find_args
 import headwordextractor
 
+import functools
 import options
 import logging
 
-from nltk.stem import WordNetLemmatizer # type: ignore
-from nltk.corpus import wordnet # type: ignore
+# WordNet lemmatizer, loaded with NLTK by lemmatize at first use
+_lemmatizer = None
 
-# Initialiser lemmatizer
-lemmatizer = WordNetLemmatizer()
+# Number of (word, part-of-speech) pairs whose lemma is kept in memory: more
+# than the distinct lemmas of the verbs of the whole FrameNet corpus
+LEMMA_CACHE_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=LEMMA_CACHE_SIZE)
+def lemmatize(word, pos):
+    """Return the lemma of a word according to WordNet, the lemmas of the
+    most recent words are kept in memory
+
+    :param word: The word, or the lemma given by the parser.
+    :type word: str.
+    :param pos: The WordNet part-of-speech, eg. 'v'.
+    :type pos: str.
+    :returns: str -- the lemma
+    """
+    global _lemmatizer
+    if _lemmatizer is None:
+        from nltk.stem import WordNetLemmatizer  # type: ignore
+        _lemmatizer = WordNetLemmatizer()
+    return _lemmatizer.lemmatize(word, pos)
+
+
+def lemmatize_verb(word):
+    """Return the infinitive form of a verb, according to WordNet"""
+    return lemmatize(word, 'v')
 
 
 class ArgGuesser():
@@ -133,17 +158,27 @@ class ArgGuesser():
 
     def __init__(self, frames_for_verb):
         self.frames_for_verb = frames_for_verb
+        self.predicate_pos = frozenset(options.Options.predicate_pos)
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(options.Options.loglevel)
         self.logger.debug(f"ArgGuesser({str(frames_for_verb)[:100]}...)")
 
-    def frame_instances_from_file(self, filename):
-        """ Extracts frames from one file and iterate over them """
+    def frame_instances_from_file(self, filename, document=None):
+        """ Extracts frames from one file and iterate over them
+
+        :param filename: The parsed file.
+        :type filename: str.
+        :param document: The already parsed file, if it is shared with other
+            readers.
+        :type document: conllstore.ConllStore.
+        """
 
         self.logger.debug(f'frame_instances_from_file {filename}')
-        conllparsed_reader = ConllParsedReader()
-        for sentence_id, sentence, tree in conllparsed_reader.sentence_trees(
-                filename):
+        if document is None:
+            sentence_trees = ConllParsedReader().sentence_trees(filename)
+        else:
+            sentence_trees = document.sentence_trees()
+        for sentence_id, sentence, tree in sentence_trees:
             self.logger.debug(
                 f"frame_instances_from_file sentence {sentence_id}: "
                 f"{sentence}")
@@ -158,6 +193,9 @@ class ArgGuesser():
         """ Extracts frames from one sentence and iterate over them """
         self.logger.debug(f'_sentence_predicates_iterator {sentence_id} '
                           f'sentence: {sentence}; tree: {tree} ({type(tree)})')
+        # The relations of the tree for the heuristic, shared by its
+        # predicates
+        relations = None
         visited = []
         for node in tree:
             if node in visited:
@@ -166,53 +204,58 @@ class ArgGuesser():
             # For every verb, looks for its infinitive form in VerbNet, and
             # builds a frame occurrence if it is found
             # ## TODO why does it have to be verbs ?
+            # The part-of-speech is checked first: most tokens are not verbs
+            # and need no lemmatization
+            if not self._is_predicate(node):
+                continue
             self.logger.debug(f"_sentence_predicates_iterator on {node.lemma}")
             # ##A lot of lemmas of verbs are not in the infinitive form in
             # the conll files
-            if lemmatizer.lemmatize(
-                    node.lemma, wordnet.VERB) not in self.frames_for_verb:
+            if not self._in_verbnet(node.lemma):
                 self.logger.debug(f"_sentence_predicates_iterator node.lemma "
                                   f"{node.lemma} not in frames_for_verb")
                 continue
 
-            if self._is_predicate(node):
-                self.logger.debug(f"_sentence_predicates_iterator node.lemma "
-                                  f"{node.lemma} is a predicate")
-                predicate = Predicate(
-                    node.begin_word,
-                    node.begin_word + len(node.word) - 1,
-                    node.word,
-                    node.lemma,
-                    node.word_id)
-
-                if options.Options.heuristic_rules:
-                    args = [self._nodeToArg(x, node) for x in find_args(node)]
-                else:
-                    args = self._find_args(node)
-
-                args = [x for x in args
-                        if self._is_good_phrase_type(x.phrase_type)]
-
-                # Read headwords
-                headwords = [None] * len(args)
-                for i, arg in enumerate(args):
-                    if not arg.instanciated:
-                        continue
-                    headwords[i] = headwordextractor.headword(arg, tree)
-
-                self.logger.debug(f'_sentence_predicates_iterator '
-                                  f'yielding {predicate} {args}…')
-                yield FrameInstance(
-                    sentence=sentence,
-                    predicate=predicate,
-                    args=args,
-                    words=[Word(x.begin, x.end, x.pos) for x in tree],
-                    frame_name="",
-                    sentence_id=sentence_id,
-                    filename=filename,
-                    tree=tree,
-                    headwords=headwords
-                )
+            self.logger.debug(f"_sentence_predicates_iterator node.lemma "
+                              f"{node.lemma} is a predicate")
+            predicate = Predicate(
+                node.begin_word,
+                node.begin_word + len(node.word) - 1,
+                node.word,
+                node.lemma,
+                node.word_id)
+
+            if options.Options.heuristic_rules:
+                if relations is None:
+                    relations = SentenceRelations(tree)
+                args = [self._nodeToArg(x, node)
+                        for x in find_args(node, relations)]
+            else:
+                args = self._find_args(node)
+
+            args = [x for x in args
+                    if self._is_good_phrase_type(x.phrase_type)]
+
+            # Read headwords
+            headwords = [None] * len(args)
+            for i, arg in enumerate(args):
+                if not arg.instanciated:
+                    continue
+                headwords[i] = headwordextractor.headword(arg, tree)
+
+            self.logger.debug(f'_sentence_predicates_iterator '
+                              f'yielding {predicate} {args}…')
+            yield FrameInstance(
+                sentence=sentence,
+                predicate=predicate,
+                args=args,
+                words=[Word(x.begin, x.end, x.pos) for x in tree],
+                frame_name="",
+                sentence_id=sentence_id,
+                filename=filename,
+                tree=tree,
+                headwords=headwords
+            )
 
     def _is_good_phrase_type(self, phrase_type):
         """ Tells whether a phrase type is acceptable for an argument """
@@ -237,7 +280,7 @@ class ArgGuesser():
             base_node = base_node.father
 
         result = self._find_args_rec(node, node)
-        if (base_node is not node
+        if (base_node != node
                 and base_node.pos in options.Options.predicate_pos):
             result += self._find_args_rec(base_node, base_node)
 
@@ -251,6 +294,9 @@ class ArgGuesser():
         It is possible that one of the returned arguments corresponds
         to the second node itself.
 
+        The descendants of node are walked in preorder, and the subtrees of
+        arguments and verbs are skipped by their preorder interval.
+
         :param predicate_node: The node of which we want to obtain arguments.
         :type predicate_node: SyntacticTreeNode.
         :param node: The node for which descendants are susceptible to be
@@ -260,11 +306,17 @@ class ArgGuesser():
 
         """
         result = []
-        for child in node.children:
+        rank, stop = node.preorder_interval()
+        rank += 1
+        while rank < stop:
+            child = node.preorder_node(rank)
             if self._is_arg(child, predicate_node):
                 result.append(self._nodeToArg(child, predicate_node))
-            elif child.pos not in options.Options.predicate_pos:
-                result += self._find_args_rec(predicate_node, child)
+                _, rank = child.preorder_interval()
+            elif child.pos in options.Options.predicate_pos:
+                _, rank = child.preorder_interval()
+            else:
+                rank += 1
         return result
 
     def _overlap(self, node1, node2):
@@ -319,12 +371,15 @@ class ArgGuesser():
             return self.pos_conversions[node.pos]
         return node.pos
 
+    def _in_verbnet(self, lemma):
+        """Tells whether the infinitive form of a lemma is in VerbNet, the
+        infinitive forms of the recent lemmas being kept by lemmatize"""
+        return lemmatize_verb(lemma) in self.frames_for_verb
+
     def _is_predicate(self, node):
         """Tells whether a node can be used as a predicate for a frame"""
         # Check part-of-speech compatibility
-        if node.pos not in options.Options.predicate_pos:
-            self.logger.debug(f"_is_predicate {node.lemma} is a possible "
-                              f"predicate but not its PoS {node.pos}")
+        if node.pos not in self.predicate_pos:
             return False
 
         # Check that this node is not an auxiliary NOT RELEVANT
@@ -341,7 +396,7 @@ class ArgGuesser():
         Tells whether node is the subject of predicate_node. This is only
         called when node is a brother of predicate_node.
         """
-        return ((node is not predicate_node) and
+        return ((node != predicate_node) and
                 node.deprel in self.subject_deprels)
 
     def _is_arg(self, node, predicate_node):
@@ -349,7 +404,7 @@ class ArgGuesser():
         Tells whether node is an argument of predicate_node. This is only
         called when node is a descendant of predicate_node.
         """
-        if node is predicate_node:
+        if node == predicate_node:
             return False
         self.logger.debug(f"_is_arg {node.deprel}: "
                           f"{node.deprel in self.args_deprels}")
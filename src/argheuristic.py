@@ -4,8 +4,13 @@
 """Implementation of the heuristic method that extract potential arguments
 of a syntax-annotated sentence described in:
 Lang & Lapata, 2011 "Unsupervised Semantic Role Induction via Split-Merge Clustering"
+
+The rules are described on the relation tree of a predicate, see
+build_relation_tree. find_args applies them to the same tree encoded as
+arrays of integer relation codes, see SentenceRelations and RelationTable.
 """
 
+import bisect
 from functools import reduce
 
 import options
@@ -154,10 +159,10 @@ def build_relation_tree_rec(node, new_father, relation):
 
     # Starts by the syntactic children (except new_father if it is one)
     new_children = [build_relation_tree_rec(x, node, Relation(x.deprel, "DOWN"))
-            for x in node.children if x is not new_father]
+            for x in node.children if x != new_father]
 
     # The add the father if it is not new_father
-    if not (new_father is node.father or node.father is None):
+    if not (new_father == node.father or node.father is None):
         new_children.append(build_relation_tree_rec(
             node.father, node, Relation(node.deprel, "UP")))
 
@@ -185,16 +190,219 @@ rule4_relations = reduce(lambda x, y: x + Relation.both(y), [
     ], [])
 
 
-def find_args(predicate_node):
+# Relations are coded as small integers: 2 * the index of the name of the
+# relation in relation_names, plus the direction
+UP, DOWN = 0, 1
+relation_names = sorted(Relation.possible_names)
+_name_indexes = {name: index for index, name in enumerate(relation_names)}
+
+
+def relation_code(relation):
+    """Return the code of a relation, see relation_names"""
+    direction = UP if relation.direction == "UP" else DOWN
+    return 2 * _name_indexes[relation.name] + direction
+
+
+def relation_mask(relations):
+    """Return the bitmask with the bit of the code of every relation set"""
+    return reduce(lambda mask, relation: mask | 1 << relation_code(relation),
+                  relations, 0)
+
+
+rule2_mask = relation_mask(rule2_relations)
+rule4_mask = relation_mask(rule4_relations)
+
+# The statuses of the entries of a RelationTable, as RelationTreeNode.status
+UNKNOWN, KEPT, DISCARDED = 0, 1, 2
+
+
+class SentenceRelations:
+    """The dependencies of the tree of a sentence, encoded once for the
+    relation trees of all its predicates
+
+    The nodes are numbered in the preorder of the tree.
+
+    :var nodes: SyntacticTreeNode list -- the nodes of the tree, in preorder
+    :var positions: dict -- the number of each node
+    :var fathers: int list -- the number of the father of each node, -1 for
+        the root
+    :var children: int list list -- the numbers of the children of each node
+    :var deprels: str list -- the deprel of each node
+    :var name_codes: int list -- 2 * the index in relation_names of the
+        dependency relation of each node with its father, -1 if this is not
+        a valid relation
+    :var begin_words: int list -- the begin_word of each node
+    :var begins: int list -- the begin of each node
+    :var subjects: bool list -- whether the deprel of a node is SBJ
+    :var rule1_discarded: bool list -- whether rule 1 discards a node, for
+        its part-of-speech
+    :var rule5_discarded: bool list -- whether rule 5 discards a node, for
+        its VC child
+    """
+
+    def __init__(self, node):
+        """Encode the tree of a node
+
+        :param node: Any node of the tree.
+        :type node: SyntacticTreeNode.
+        """
+        root, seen = node, set()
+        while root.father is not None and root not in seen:
+            seen.add(root)
+            root = root.father
+        self.nodes = list(root.preorder())
+        self.positions = {node: position
+                          for position, node in enumerate(self.nodes)}
+        self.fathers = [-1 if node.father is None
+                        else self.positions.get(node.father, -1)
+                        for node in self.nodes]
+        self.children = [[self.positions[child] for child in node.children]
+                         for node in self.nodes]
+        self.deprels = [node.deprel for node in self.nodes]
+        self.name_codes = [2 * _name_indexes[deprel]
+                           if deprel in _name_indexes else -1
+                           for deprel in self.deprels]
+        self.begin_words = [node.begin_word for node in self.nodes]
+        self.begins = [node.begin for node in self.nodes]
+        self.subjects = [deprel == "SBJ" for deprel in self.deprels]
+        self.rule1_discarded = [node.pos in rule1_pos for node in self.nodes]
+        self.rule5_discarded = [
+            any(self.deprels[child] == "VC" for child in children)
+            for children in self.children]
+
+    def relation_code(self, position, direction):
+        """The code of the relation of a node with its father, seen from
+        the node (UP) or from the father (DOWN)
+
+        :raises: InvalidRelationError, as Relation
+        """
+        name_code = self.name_codes[position]
+        if name_code == -1:
+            raise InvalidRelationError("name", self.deprels[position])
+        return name_code + direction
+
+
+class RelationTable:
+    """The relation tree of a predicate, as arrays in the postorder of
+    RelationTreeNode.__iter__, the predicate excluded
+
+    Entry i is the node positions[i] of the SentenceRelations, with the
+    relation codes[i] to its neighbour closer to the predicate; its
+    subtree in the relation tree is the entries i - sizes[i] + 1 to i, and
+    the ranks preorder_ranks[i] to preorder_ranks[i] + sizes[i] - 1 in the
+    preorder of the relation tree, where the predicate has rank 0.
+
+    :var relations: SentenceRelations -- the tree of the sentence
+    :var predicate: int -- the position of the predicate
+    :var positions: int list -- the node of each entry
+    :var codes: int list -- the relation of each entry
+    :var sizes: int list -- the size of the subtree of each entry
+    :var preorder_ranks: int list -- the rank of each entry in preorder
+    :var depths: int list -- 1 for the neighbours of the predicate
+    :var rule4_discarded: bool list -- whether an entry is under an entry
+        whose relation is one of rule4_relations
+    :var statuses: bytearray -- UNKNOWN, KEPT or DISCARDED for each entry
+    """
+
+    def __init__(self, relations, predicate_node):
+        self.relations = relations
+        self.predicate = relations.positions[predicate_node]
+        self.positions, self.codes, self.sizes = [], [], []
+        self.depths, self.rule4_discarded = [], []
+        self.preorder_ranks = []
+
+        fathers, children = relations.fathers, relations.children
+        # (position, neighbour it comes from, code, depth, under a rule 4
+        # relation, first entry of the subtree and preorder rank or None
+        # before the children)
+        stack = [(self.predicate, self.predicate, -1, 0, False, None, None)]
+        rank = 0
+        while stack:
+            (position, new_father, code, depth, under4,
+             start, preorder_rank) = stack.pop()
+            if start is None:
+                # Children first then father, as build_relation_tree
+                neighbours = [(child, relations.relation_code(child, DOWN))
+                              for child in children[position]
+                              if child != new_father]
+                father = fathers[position]
+                if father != -1 and father != new_father:
+                    neighbours.append(
+                        (father, relations.relation_code(position, UP)))
+                stack.append((position, new_father, code, depth, under4,
+                              len(self.positions), rank))
+                rank += 1
+                below4 = depth > 0 and (under4 or rule4_mask >> code & 1)
+                stack.extend((neighbour, position, neighbour_code, depth + 1,
+                              below4, None, None)
+                             for neighbour, neighbour_code
+                             in reversed(neighbours))
+                continue
+            if depth == 0:
+                break
+            self.positions.append(position)
+            self.codes.append(code)
+            self.sizes.append(len(self.positions) - start)
+            self.depths.append(depth)
+            self.rule4_discarded.append(bool(under4))
+            self.preorder_ranks.append(preorder_rank)
+        self.statuses = bytearray(len(self.positions))
+
+    def __len__(self):
+        return len(self.positions)
+
+    def interval(self, entry):
+        """The preorder ranks (start, stop) of the subtree of an entry"""
+        start = self.preorder_ranks[entry]
+        return start, start + self.sizes[entry]
+
+    def keep(self, entry):
+        if self.statuses[entry] == UNKNOWN:
+            self.statuses[entry] = KEPT
+
+    def discard(self, entry):
+        if self.statuses[entry] == UNKNOWN:
+            self.statuses[entry] = DISCARDED
+
+
+def nested(intervals):
+    """Return the index of every interval containing another one
+
+    The intervals are the (start, stop) preorder ranks of subtrees, see
+    TreeNodeMixin.preorder_interval or RelationTable.interval: two of them
+    are either disjoint or nested, and each one starts at the rank of its
+    own node. An interval thus contains another one if and only if the next
+    start is before its stop, found by bisection in the sorted starts
+    rather than by comparing every pair.
+
+    :param intervals: The intervals of distinct nodes of a tree.
+    :type intervals: (int, int) list.
+    :returns: int list -- the indexes in intervals, in increasing order
+    """
+    starts = sorted(start for start, _ in intervals)
+    result = []
+    for index, (start, stop) in enumerate(intervals):
+        following = bisect.bisect_right(starts, start)
+        if following < len(starts) and starts[following] < stop:
+            result.append(index)
+    return result
+
+
+def find_args(predicate_node, relations=None):
     """ Apply the heuristic to its argument
 
     :param predicate_node: The node from which we want potential arguments
     :type predicate_node: SyntacticTreeNode
+    :param relations: The relations of the tree of the predicate, shared by
+        the predicates of a sentence; encoded from predicate_node if None
+    :type relations: SentenceRelations
 
     """
 
+    if relations is None:
+        relations = SentenceRelations(predicate_node)
     # Build the relation tree
-    tree = build_relation_tree(predicate_node)
+    tree = RelationTable(relations, predicate_node)
 
     # Apply the 8 rules
     rule1(tree)
@@ -210,84 +418,94 @@ def find_args(predicate_node):
     # Returns every node marked as "KEPT"
 
     # But first, discard nodes which have children which are also candidate arguments
-    arg_list = [x for x in tree if x.status == "KEPT"]
-    for arg_node in arg_list:
-        for subnode in arg_node:
-            if subnode in arg_list:
-                arg_node.status = "DISCARDED"
-                break
+    kept = [entry for entry, status in enumerate(tree.statuses)
+            if status == KEPT]
+    for index in nested([tree.interval(entry) for entry in kept]):
+        tree.statuses[kept[index]] = DISCARDED
 
-    return [x.node for x in tree if x.status == "KEPT"]
+    return [relations.nodes[position]
+            for position, status in zip(tree.positions, tree.statuses)
+            if status == KEPT]
 
 
 def rule1(tree):
-    for elem in tree:
-        if elem.node.pos in rule1_pos:
-            elem.discard()
+    rule1_discarded = tree.relations.rule1_discarded
+    for entry, position in enumerate(tree.positions):
+        if rule1_discarded[position]:
+            tree.discard(entry)
 
 
 def rule2(tree):
-    for elem in tree:
-        if elem.relation in rule2_relations:
-            elem.discard()
+    for entry, code in enumerate(tree.codes):
+        if rule2_mask >> code & 1:
+            tree.discard(entry)
 
 
 def rule3(tree):
+    relations = tree.relations
+    begin_words = relations.begin_words
+    predicate_begin = begin_words[tree.predicate]
     candidate = None
     best_position = -1
 
-    for elem in tree:
-        if (elem.node.deprel == "SBJ" and
-                elem.node.begin_word < tree.node.begin_word and
-                elem.node.begin_word > best_position):
-            candidate, best_position = elem, elem.node.begin
+    for entry, position in enumerate(tree.positions):
+        if (relations.subjects[position] and
+                begin_words[position] < predicate_begin and
+                begin_words[position] > best_position):
+            candidate, best_position = entry, relations.begins[position]
 
     if candidate is None:
         return
 
-    found = False
-    node = tree.node
-    while node is not None:
-        if node.begin_word == candidate.node.father.begin_word:
-            found = True
-            break
-        node = node.father
-
-    if found:
-        candidate.keep()
+    # Keep the subject if its father is the predicate or one of its ancestors
+    predicate_node = relations.nodes[tree.predicate]
+    candidate_node = relations.nodes[tree.positions[candidate]]
+    if predicate_node.is_in(candidate_node.father):
+        tree.keep(candidate)
 
 
 def rule4(tree):
-    for elem1 in tree.children:
-        if elem1.relation in rule4_relations:
-            for elem2 in elem1:
-                elem2.discard()
-        else:
-            rule4(elem1)
+    for entry, discarded in enumerate(tree.rule4_discarded):
+        if discarded:
+            tree.discard(entry)
 
 
 def rule5(tree):
-    for elem in tree:
-        if any([x.deprel == "VC" for x in elem.node.children]):
-            elem.discard()
+    rule5_discarded = tree.relations.rule5_discarded
+    for entry, position in enumerate(tree.positions):
+        if rule5_discarded[position]:
+            tree.discard(entry)
 
 
 def rule6(tree):
-    for elem in tree.children:
+    relations = tree.relations
+    begin_words = relations.begin_words
+    predicate_father = relations.fathers[tree.predicate]
+    for entry, position in enumerate(tree.positions):
         # Do not keep elem that are on the left of the predicate
-        if (elem.node is not tree.node.father and
-        elem.node.begin_word > tree.node.begin_word):
-            elem.keep()
-
-
-def rule7(tree, root=True):
-    for elem in tree.children:
-        if elem.relation.name == "VC":
-            rule7(elem, False)
-        elif not root:
-            elem.keep()
+        if (tree.depths[entry] == 1 and position != predicate_father and
+                begin_words[position] > begin_words[tree.predicate]):
+            tree.keep(entry)
+
+
+def rule7(tree):
+    vc_name = _name_indexes["VC"]
+    # Whether each entry is linked to the predicate by VC relations only
+    in_chain = [False] * len(tree)
+    # The ancestors of the entry, walking the entries backwards, that is
+    # each entry before its descendants
+    ancestors = []
+    for entry in reversed(range(len(tree))):
+        while ancestors and ancestors[-1] - tree.sizes[ancestors[-1]] >= entry:
+            ancestors.pop()
+        if not ancestors or in_chain[ancestors[-1]]:
+            if tree.codes[entry] >> 1 == vc_name:
+                in_chain[entry] = True
+            elif ancestors:
+                tree.keep(entry)
+        ancestors.append(entry)
 
 
 def rule8(tree):
-    for elem in tree:
-        elem.discard()
+    for entry in range(len(tree)):
+        tree.discard(entry)
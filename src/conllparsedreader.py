@@ -7,7 +7,9 @@
 
 +"""
 
-from conllreader import SyntacticTreeBuilder
+from conllreader import conll_blocks
+from conllsentence import ConllSentence, StringTable
+import parsecache
 
 import options
 import logging
@@ -16,28 +18,37 @@ class ConllParsedReader:
     """
     Reads the syntactic parser output to  build the corresponding syntactic
     trees.
+
+    :var strings: conllsentence.StringTable -- the strings of all the
+        sentences read
     """
 
+    def __init__(self):
+        self.strings = StringTable()
+
     def sentence_trees(self, filename):
         """Yield all sentence trees from filename in order.
 
         To be used with enumerate().
 
-        :param filename: The file to load.
+        The sentences are read from the parse cache when possible, see
+        parsecache.
+
+        :param filename: The file to load, "-" for the standard input.
         :type filename: str.
         """
         logger = logging.getLogger(__name__)
         logger.setLevel(options.Options.loglevel)
         logger.debug("ConllParsedReader.sentence_trees(%s)"%filename)
 
-        with open(str(filename), encoding='UTF-8') as content:
-            sentences_data = content.read().split("\n\n")
-            if sentences_data[len(sentences_data) - 1] == "":
-                del sentences_data[len(sentences_data) - 1]
-
-        for sentence_id, sentence in enumerate(sentences_data):
-            logger.debug('ConllParsedReader.sentence_trees sentence_id: {}; sentence:\n{}'.format(sentence_id, sentence))
-            tree_builder = SyntacticTreeBuilder(sentence)
-            for tree in tree_builder.tree_list:
-                logger.debug('ConllParsedReader.sentence_trees yielding tree_builder: {}; tree: {}'.format(tree_builder, tree))
-                yield sentence_id, tree_builder.sentence, tree
+        parsed = parsecache.load(filename)
+        if parsed is not None:
+            sentences = parsed.sentences(self.strings)
+        else:
+            sentences = (ConllSentence(lines, self.strings)
+                         for lines in conll_blocks(filename))
+        for sentence_id, sentence in enumerate(sentences):
+            logger.debug('ConllParsedReader.sentence_trees sentence_id: {}; sentence:\n{}'.format(sentence_id, sentence.sentence))
+            for tree in sentence.tree_list:
+                logger.debug('ConllParsedReader.sentence_trees yielding tree: {}'.format(tree))
+                yield sentence_id, sentence.sentence, tree
@@ -4,67 +4,146 @@
 """Build syntactic trees from CoNLL parser output
 
     Define the following  classes:
+    * TreeNodeMixin
     * SyntacticTreeNode
     * SyntacticTreeBuilder
     * ConllSemanticAppender
+
+    and the functions conll_blocks, conll_columns and stdin_content
 """
+from array import array
+from bisect import bisect_right
+import io
 import sys
-from collections import defaultdict
-from distance import lcsubstrings as word_overlap # type: ignore
+from collections import defaultdict, namedtuple
 import framenetframe
 import options
 import logging
 import re
 
-logging.basicConfig(level=logging.DEBUG)
-logging.root.setLevel(logging.DEBUG)
+# The content of the standard input, once read by stdin_content
+_stdin = None
 
-class SyntacticTreeNode:
-    """A node (internal or terminal) of a syntactic tree
+# The word ids of the ancestors met by TreeNodeMixin.__iter__, shared by all
+# the sentences of the process
+_iterated_father_ids = set()
 
-    :var word_id: int, the CoNLL word id (starts at 1)
 
-    :var word: string, the word contained by the node
-    :var lemma: string, the lemma of the word contained by the node
-    :var cpos: string, part-of-speech of the node
-    :var pos: string, part-of-speech of the node
+def stdin_content():
+    """Return the content of the standard input, read at the first call
 
-    :var deprel: string, function attributed by the parser to this word
-    :var father: SyntacticTreeBuilder, the father of this node
-    :var children: SyntacticTreeNode list, the children of this node
-
-    :var begin: int, the character position this phrase starts at (root would
-                be 0)
-    :var end: int, the position this phrase ends at (root would be last
-              character)
-    :var begin_word: int, the position this *word* begins at
+    The standard input can only be read once: all the readers of "-" share
+    its content, such as the argument identification and the appender
+    writing the annotated file.
 
+    :returns: str -- the content
     """
+    global _stdin
+    if _stdin is None:
+        _stdin = sys.stdin.read()
+    return _stdin
 
-    def __init__(self, word_id, word, lemma, cpos, pos, namedEntityType,
-                 features, head, deprel, phead, pdeprel, begin_word):
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(options.Options.loglevel)
 
-        # self.logger.debug('SyntacticTreeNode({})'.format(deprel))
-        self.word_id = word_id
+def conll_blocks(source):
+    """Yield the sentences of a CoNLL file one at a time, without reading the
+    whole file first.
 
-        self.word = word
-        self.lemma = lemma
-        self.cpos = cpos
-        self.pos = pos if pos != "_" else cpos
-        self.namedEntityType = namedEntityType
-        self.features = features
-        self.head = head
-        self.deprel = deprel
-        self.phead = phead
-        self.pdeprel = pdeprel
-        self.begin_word = begin_word
+    Comment lines are dropped, and any run of blank (or whitespace only)
+    lines separates two sentences.
 
-        self.father = None
-        self.children = []
+    :param source: The file to read, "-" for the standard input (see
+        stdin_content), or an already opened text file.
+    :type source: str, pathlib.Path or file.
+    :returns: generator of str lists -- the lines of each sentence, without
+        their line ends
+    """
+    if hasattr(source, 'read'):
+        yield from _conll_blocks(source)
+    elif str(source) == '-':
+        yield from _conll_blocks(io.StringIO(stdin_content()))
+    else:
+        with open(str(source), encoding='UTF-8') as content:
+            yield from _conll_blocks(content)
+
+
+def _conll_blocks(content):
+    block = []
+    for line in content:
+        stripped = line.strip()
+        if not stripped:
+            if block:
+                yield block
+                block = []
+        elif not stripped.startswith('#'):
+            block.append(line.rstrip('\r\n'))
+    if block:
+        yield block
+
+
+# The columns of a sentence, each one a list indexed by word position, see
+# conll_columns
+ConllColumns = namedtuple('ConllColumns', [
+    'word_ids', 'forms', 'lemmas', 'cposes', 'poses', 'named_entity_types',
+    'features', 'heads', 'deprels', 'pheads', 'pdeprels'])
+
+
+def conll_columns(lines):
+    """Split the lines of a sentence into typed columns, in a single pass
+
+    Accepts both CoNLL-U (10 columns) and LIMA (11 columns, with the named
+    entity type after the POS) lines, see
+    https://github.com/aymara/lima/wiki/LIMA-User-Manual
+    Blank and comment lines are skipped, lines with another number of columns
+    are skipped with a warning.
+
+    :param lines: The lines of the sentence, without line ends.
+    :type lines: str iterable.
+    :returns: ConllColumns -- word_ids and heads are int (a head is None when
+        unknown), a "_" POS is replaced by the coarse POS and deprels are
+        normalized to ROOT for roots
+    """
+    rows = []
+    for linenum, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if not stripped or stripped[0] == "#":
+            continue
+        fields = line.split("\t")
+        if len(fields) == 10:
+            # No named entity type column
+            fields.insert(5, '_')
+        elif len(fields) != 11:
+            logger = logging.getLogger(__name__)
+            logger.setLevel(options.Options.loglevel)
+            logger.warning(
+                f'Wrong number of columns (expected 10 or 11) '
+                f'in line {linenum}, got {len(fields)}: "{line}"')
+            continue
+        rows.append(fields)
+    if not rows:
+        return ConllColumns(*([] for _ in ConllColumns._fields))
+
+    (word_ids, forms, lemmas, cposes, poses, named_entity_types, features,
+     heads, deprels, pheads, pdeprels) = map(list, zip(*rows))
+    deprels = ['ROOT' if deprel in ('-', '_', 'root') else deprel
+               for deprel in deprels]
+    heads = [int(head) if head not in ('-', '_') else
+             0 if deprel == 'ROOT' else None
+             for head, deprel in zip(heads, deprels)]
+    poses = [pos if pos != "_" else cpos for pos, cpos in zip(poses, cposes)]
+    return ConllColumns(list(map(int, word_ids)), forms, lemmas, cposes,
+                        poses, named_entity_types, features, heads, deprels,
+                        pheads, pdeprels)
+
+
+class TreeNodeMixin:
+    """Tree walks and text reconstruction shared by SyntacticTreeNode and by
+    the array-backed conllsentence.NodeView
+
+    Nodes are equal when they have the same CoNLL word id, whatever their
+    class, see SyntacticTreeNode for their attributes.
+    """
 
-        self.begin, self.end = None, None
+    __slots__ = ()
 
     def __repr__(self):
         children = " ".join([str(t.word_id) for t in self.children])
@@ -88,7 +167,7 @@ class SyntacticTreeNode:
         return result
 
     def __eq__(self, other):
-        if isinstance(other, SyntacticTreeNode):
+        if isinstance(other, TreeNodeMixin):
             return ((self.word_id == other.word_id))
         else:
             return False
@@ -100,11 +179,18 @@ class SyntacticTreeNode:
         return self.word_id
 
     def __iter__(self):
-        for position, child in enumerate(self.children):
+        """Yield the nodes of the subtree, each node after its children
+
+        A node whose word id was met before as an ancestor, by any iteration
+        since the start of the process, is replaced by the node iterated, so
+        that nodes may be repeated or skipped. The reference scores depend on
+        it: use preorder() to visit each node once.
+        """
+        for child in self.children:
             if child.word_id == self.word_id:
-                yield(self)
+                yield self
             for node in child:
-                if node in self.fathers():
+                if node.word_id in self._iterated_fathers():
                     yield self
                 else:
                     yield node
@@ -113,12 +199,56 @@ class SyntacticTreeNode:
         # if self.position == len(self.children):
         yield self
 
-    def fathers(self, previous=set()):
-        if self.father is not None and self.father not in previous:
-            result = previous
-            result.add(self.father)
-            return self.father.fathers(result)
-        return previous
+    def _iterated_fathers(self):
+        """Add the word ids of the ancestors of this node to
+        _iterated_father_ids, up to the first one already there"""
+        node = self.father
+        while node is not None and node.word_id not in _iterated_father_ids:
+            _iterated_father_ids.add(node.word_id)
+            node = node.father
+        return _iterated_father_ids
+
+    def preorder(self):
+        """Yield every node of the subtree once, each node before its
+        children"""
+        if self.preorder_rank is None:
+            return iter([self])
+        return self._sentence_nodes(self.preorder_rank,
+                                    self.preorder_rank + self.subtree_size)
+
+    def preorder_interval(self):
+        """Return the ranks (start, stop) of the subtree of this node in the
+        preorder of the sentence: the node is at start, its descendants up
+        to stop - 1"""
+        return (self.preorder_rank,
+                self.preorder_rank + self.subtree_size)
+
+    def preorder_node(self, rank):
+        """Return the node of the sentence at a rank of the preorder"""
+        return next(self._sentence_nodes(rank, rank + 1))
+
+    def is_in(self, other):
+        """Tell whether this node is other or one of its descendants
+
+        The subtree of other is an interval of the preorder of the sentence,
+        so that this takes constant time.
+
+        :param other: A node of the same sentence.
+        :type other: TreeNodeMixin.
+        """
+        if self.preorder_rank is None or other.preorder_rank is None:
+            return self == other
+        return (other.preorder_rank <= self.preorder_rank <
+                other.preorder_rank + other.subtree_size)
+
+    def fathers(self):
+        """Return the set of the ancestors of this node"""
+        result = set()
+        node = self.father
+        while node is not None and node not in result:
+            result.add(node)
+            node = node.father
+        return result
 
     #def flat(self):
         #"""Return the tokenized sentence from the parse tree."""
@@ -130,69 +260,18 @@ class SyntacticTreeNode:
             # result += " " + str(child_node)
         # result += ")"  # To end the representation
         # return result
-    def str2(self):
-
-        result = f"({self.pos}/{self.deprel}/{self.position}/{self.begin}/{self.end}/{self.begin_word} {self.word}"
-        # If the node has childre we add them recursively
-        for child_node in self.children:
-
-            result += " " + child_node.str2()
-        result += " )"  # To end the representation a space was added to ease the retrieval of the words in parse_dependency_tree
-        return result
-
-    # Fonction pour extraire les mots et les informations à partir de l'arbre de dépendances
-    def parse_dependency_tree(self):
-        # Regex pour extraire les mots et leurs informations
-        pattern = re.compile(r'\(([^()\s]+(?:/\w+/\d+/\d+/\d+)\s+.*?\s(?=\(|\)))') ## now includes the parentheses
-        #matches = pattern.findall(str(tree))
-        tree_str2 = self.str2()
-        matches = pattern.findall(tree_str2)
-        # breakpoint()
-
-        # Liste pour stocker les informations extraites
-        words_info = []
-
-        for match in matches:
-            # Extraire les informations de chaque mot
-            self.logger.debug(f"match: {match}")
-            parts = match.split()
-            tag_info = parts[0].split('/')
-            word = parts[1]
-
-            # Structure des informations pour chaque mot
-            word_info = {
-                'pos_tag': tag_info[0],  # Étiquette grammaticale (par exemple, VBD, NN)
-                'dep_rel': tag_info[1],  # Relation de dépendance (par exemple, ROOT, SUB)
-                'word_order': int(tag_info[5]),  # Position du mot dans la phrase
-                'word': word  # Le mot lui-même
-            }
-            words_info.append(word_info)
-
-        return words_info
-
-
-    # Fonction pour reconstruire la phrase
     def flat(self):
-
-        # tree = str(self)
-        # Parse l'arbre de dépendances
-        words_info = self.parse_dependency_tree()
-        # breakpoint()
-        # Trier les mots en fonction de leur ordre dans la phrase
-        sorted_words = sorted(words_info, key=lambda x: x['word_order'])
-
-        # Récupérer les mots dans l'ordre
-        sentence = ' '.join([word['word'] for word in sorted_words])
-
-        return sentence
-
-
-
+        """Return the words of the subtree, in the order of the sentence"""
+        words = self.sentence_words
+        if self.last_index - self.first_index + 1 == self.subtree_size:
+            return ' '.join(words[self.first_index:self.last_index + 1])
+        # Non-projective subtree, with holes
+        return ' '.join(words[index] for index in
+                        sorted(node.index for node in self.preorder()))
 
     def contains(self, arg):
         """Search an exact argument in all subtrees"""
-        return (self.flat() == arg or
-                any((c.contains(arg) for c in self.children)))
+        return any(node.flat() == arg for node in self.preorder())
         #return (self.reconstruct_sentence() == arg or any((c.contains(arg) for c in self.children)))
 
     def closest_match(self, arg):
@@ -202,24 +281,134 @@ class SyntacticTreeNode:
     def closest_match_as_node(self, arg):
         return self._closest_match_as_node_lcs(arg)[1]
 
+    def node_at_span(self, arg):
+        """Return the node of the subtree spanning exactly the characters and
+        the words of arg, None if there is none
+
+        The nodes are found in the index of the spans of the sentence, the
+        first one in preorder when several nodes have the same span. This is
+        the node closest_match_as_node would find, unless the span of arg is
+        not aligned with the parse.
+
+        :param arg: The argument.
+        :type arg: Arg.
+        :returns: TreeNodeMixin -- the node, or None
+        """
+        wanted_word_list = arg.text.split()
+        for node in self._span_nodes(arg.begin, arg.end):
+            if node.is_in(self) and node.flat().split() == wanted_word_list:
+                return node
+        return None
+
     def _closest_match_as_node_lcs(self, arg):
+        """Return (score, node) for the node of the subtree whose words
+        overlap the most with the words of arg, the first one in preorder in
+        case of tie"""
+        from distance import lcsubstrings as word_overlap  # type: ignore
 
-        current_word_list = self.flat().split()
         wanted_word_list = arg.text.split()
+        best = None
+        for node in self.preorder():
+            current_word_list = node.flat().split()
+            overlap = word_overlap(tuple(current_word_list),
+                                   tuple(wanted_word_list))
+            if not overlap:
+                overlap_words = []
+            else:
+                overlap_words = list(next(iter(overlap)))
 
-        overlap = word_overlap(tuple(current_word_list),
-                               tuple(wanted_word_list))
-        if not overlap:
-            overlap_words = []
-        else:
-            overlap_words = list(next(iter(overlap)))
+            mean_length = (len(current_word_list) + len(wanted_word_list)) / 2
+            score = -1 if mean_length == 0 else len(overlap_words) / mean_length
+            if best is None or score > best[0]:
+                best = (score, node)
+        return best
 
-        mean_length = (len(current_word_list) + len(wanted_word_list)) / 2
-        score = -1 if mean_length == 0 else len(overlap_words) / mean_length
 
-        children_results = [c._closest_match_as_node_lcs(arg)
-                            for c in self.children]
-        return max([(score, self)] + children_results, key=lambda x: x[0])
+class SyntacticTreeNode(TreeNodeMixin):
+    """A node (internal or terminal) of a syntactic tree
+
+    :var word_id: int, the CoNLL word id (starts at 1)
+
+    :var word: string, the word contained by the node
+    :var lemma: string, the lemma of the word contained by the node
+    :var cpos: string, part-of-speech of the node
+    :var pos: string, part-of-speech of the node
+
+    :var deprel: string, function attributed by the parser to this word
+    :var father: SyntacticTreeBuilder, the father of this node
+    :var children: SyntacticTreeNode list, the children of this node
+
+    :var begin: int, the character position this phrase starts at (root would
+                be 0)
+    :var end: int, the position this phrase ends at (root would be last
+              character)
+    :var begin_word: int, the position this *word* begins at
+
+    :var index: int, the position of the word in the sentence (starts at 0)
+    :var sentence_words: string list, the words of the sentence, shared by
+                         all its nodes
+    :var first_index: int, index of the first word of this phrase
+    :var last_index: int, index of the last word of this phrase
+    :var subtree_size: int, number of words of this phrase
+
+    :var preorder_rank: int, position of the node in the preorder of the
+                        sentence, its subtree is the next subtree_size nodes
+    :var sentence_preorder: SyntacticTreeNode list, the nodes of the
+                            sentence in preorder, shared by all its nodes
+    :var sentence_spans: dict, the nodes of the sentence in preorder by
+                         (begin, end), shared by all its nodes and filled by
+                         the first call to node_at_span
+
+    """
+
+    def __init__(self, word_id, word, lemma, cpos, pos, namedEntityType,
+                 features, head, deprel, phead, pdeprel, begin_word):
+        self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(options.Options.loglevel)
+
+        # self.logger.debug('SyntacticTreeNode({})'.format(deprel))
+        self.word_id = word_id
+
+        self.word = word
+        self.lemma = lemma
+        self.cpos = cpos
+        self.pos = pos if pos != "_" else cpos
+        self.namedEntityType = namedEntityType
+        self.features = features
+        self.head = head
+        self.deprel = deprel
+        self.phead = phead
+        self.pdeprel = pdeprel
+        self.begin_word = begin_word
+
+        self.father = None
+        self.children = []
+
+        self.begin, self.end = None, None
+        self.index = None
+        self.sentence_words = None
+        self.first_index, self.last_index, self.subtree_size = None, None, 0
+        self.preorder_rank = None
+        self.sentence_preorder = None
+        self.sentence_spans = None
+
+    def _sentence_nodes(self, start, stop):
+        """The nodes from start to stop in the preorder"""
+        return iter(self.sentence_preorder[start:stop])
+
+    def preorder_node(self, rank):
+        return self.sentence_preorder[rank]
+
+    def _span_nodes(self, begin, end):
+        """The nodes of the sentence spanning from begin to end, in
+        preorder"""
+        if self.sentence_spans is None:
+            return []
+        if not self.sentence_spans:
+            for node in self.sentence_preorder:
+                self.sentence_spans.setdefault(
+                    (node.begin, node.end), []).append(node)
+        return self.sentence_spans.get((begin, end), [])
 
 
 class SyntacticTreeBuilder():
@@ -229,6 +418,7 @@ class SyntacticTreeBuilder():
     :var father_ids: every dependency relation: child id -> father id
     :var tree_list: every root node, that is every root subtree
     :var sentence: the "sentence" (words separated by spaces)
+    :var preorder: every node of the trees, each one before its children
 
     """
 
@@ -246,50 +436,9 @@ class SyntacticTreeBuilder():
         self.tree_list = []
 
         begin = 0
-        linenum = 0
-        filtered_lines = [line for line in conll_tree.splitlines()
-                          if not line.strip().startswith("#")]
-
-        # Join filtered lines with line breaks
-        filtered_text = "\n".join(filtered_lines)
-
-        # Replace double (or multiple) empty lines with a single line
-        cleaned_text = re.sub(r"\n\s+\n", "\n\n", filtered_text)
-        cleaned_text2 = re.sub(r"\n\n\n", "\n\n", cleaned_text)
-        while cleaned_text2 != cleaned_text:
-            cleaned_text = cleaned_text2
-            cleaned_text2 = re.sub(r"\n\n\n", "\n\n", cleaned_text)
-
-        for l in cleaned_text2.splitlines():
-            linenum += 1
-            """Columns from
-            https://github.com/aymara/lima/wiki/LIMA-User-Manual"""
-            if not l:
-                continue
-            if l and l.strip()[0] == "#":
-                continue
-            split_line = l.split("\t")
-            if len(split_line) == 11:
-                (word_id, form, lemma, cpos, pos, namedEntityType, features,
-                 head, deprel, phead, pdeprel) = l.split("\t")
-            elif len(split_line) == 10:
-                (word_id, form, lemma, cpos, pos, features,
-                 head, deprel, phead, pdeprel) = l.split("\t")
-                namedEntityType = '_'
-            else:
-                self.logger.warn(
-                    f'Wrong number of columns (expected 10 or 11) '
-                    f'in line {linenum}, got {len(split_line)}: "{l}"\n')
-                self.logger.warn(f'text:\n{cleaned_text2}')
-                continue
-            word_id = int(word_id)
-            deprel = deprel if deprel not in ['-', '_'] else 'ROOT'
-            if deprel == 'root':
-                deprel = 'ROOT'
-            head = int(head) if head not in ['-', '_'] else None
-            if head is None and deprel == 'ROOT':
-                head = 0
-
+        for (word_id, form, lemma, cpos, pos, namedEntityType, features,
+             head, deprel, phead, pdeprel) in zip(
+                 *conll_columns(conll_tree.splitlines())):
             # on remplit fathers_ids en y mettant la valuer head pour chaque
             # word_id
             self.father_ids[word_id] = head
@@ -346,6 +495,14 @@ class SyntacticTreeBuilder():
 
         # Dictionnaire de nœuds par ID
         self.nodes = [node for node in self.node_dict.values()]
+        sentence_words = [node.word for node in self.nodes]
+        self.preorder = []
+        sentence_spans = {}
+        for index, node in enumerate(self.nodes):
+            node.index = index
+            node.sentence_words = sentence_words
+            node.sentence_preorder = self.preorder
+            node.sentence_spans = sentence_spans
         #self.logger.debug(self.nodes)
 
         for node in self.node_dict.values():
@@ -368,22 +525,34 @@ class SyntacticTreeBuilder():
         self.logger.debug(f"tree_list: {self.tree_list[0] if self.tree_list else ''}")
 
     # Fills the begin and end for every child
-    def fill_begin_end(self, node):
-        """Fill begin/end values of every subtree"""
-
-        begin_words = [node.begin_word]
-        #self.logger.debug(f"begin_words: {begin_words}", file=sys.stderr)
-        end_words = [node.begin_word + len(node.word) - 1]
-        #self.logger.debug(f"end_words: {end_words}", file=sys.stderr)
-
-        for child in node.children:
-            self.fill_begin_end(child)
-            #self.logger.debug(f"child: {child}", file=sys.stderr)
+    def fill_begin_end(self, root):
+        """Fill begin/end values, word spans and preorder ranks of every node
+        of the tree of root, without recursion"""
+
+        stack = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                node.preorder_rank = len(self.preorder)
+                self.preorder.append(node)
+                stack.append((node, True))
+                stack.extend((child, False)
+                             for child in reversed(node.children))
+                continue
 
-            begin_words.append(child.begin)
-            end_words.append(child.end)
-        node.begin = min(begin_words)
-        node.end = max(end_words)
+            # Every child is filled
+            begin = node.begin_word
+            end = node.begin_word + len(node.word) - 1
+            first_index = last_index = node.index
+            subtree_size = 1
+            for child in node.children:
+                begin, end = min(begin, child.begin), max(end, child.end)
+                first_index = min(first_index, child.first_index)
+                last_index = max(last_index, child.last_index)
+                subtree_size += child.subtree_size
+            node.begin, node.end = begin, end
+            node.first_index, node.last_index = first_index, last_index
+            node.subtree_size = subtree_size
 
 
 
@@ -412,50 +581,130 @@ class ConllSemanticAppender():
 
     The input is a syntactic ConLL file, and the output a so-called semantic
     CoNLL file.
+
+    The input is read and the output written in a single pass, one sentence
+    at a time: the frames must be added in the order of their sentences, and
+    a sentence is written as soon as a frame of a later sentence is added.
+    close() writes the remaining sentences. Only the sentence being annotated
+    is held in memory, as a matrix of cells.
+
+    :var output: text file -- where the semantic CoNLL file is written
+    :var input_sentences: iterator -- the lines of the sentences of the input
+        not read yet, see conll_blocks
+    :var sentence_id: int -- the id of the sentence being annotated, -1
+        before the first one
+    :var sentence_matrix: list -- the lines of this sentence, each one a list
+        of cells, None once it is written
+    :var offsets: array -- character position of each token of the sentence
+        offsets_sentence, and of its end, see token_at
+    :var offsets_sentence: list -- the last sentence given to token_at
     """
 
-    def __init__(self, syntactic_conll_file):
+    def __init__(self, syntactic_conll_file, output):
+        """
+        :param syntactic_conll_file: The input file, "-" for the standard
+            input (see stdin_content), or an already opened text file.
+        :type syntactic_conll_file: str, pathlib.Path or file.
+        :param output: Where to write the semantic CoNLL file.
+        :type output: text file.
+        """
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(options.Options.loglevel)
 
-        self.conll_matrix = []
-
-        with open(syntactic_conll_file) as content:
-            sentences_data = content.read().split("\n\n")
-
-            for sentence in sentences_data:
-                sentence_matrix = []
-                for line in sentence.split('\n'):
-                    if len(line.split('\t')) == 1:
-                        continue
-                    # Put current line with a new column appended for predicate
-                    sentence_matrix.append(line.split('\t') + ['_'])
-                self.conll_matrix.append(sentence_matrix)
-
-    def __str__(self):
-        result = ""
-        for i, sentence in enumerate(self.conll_matrix):
-            for line in sentence:
-                result += '\t'.join(line) + '\n'
-            if i < len(self.conll_matrix) - 1:
-                result += '\n'
-        return result
-
-    def add_new_column(self, sentence_id):
-        for line in self.conll_matrix[sentence_id]:
+        self.output = output
+        self.input_sentences = conll_blocks(syntactic_conll_file)
+        self.sentence_id = -1
+        self.sentence_matrix = None
+        self.offsets = None
+        self.offsets_sentence = None
+
+    def _sentence(self, sentence_id):
+        """Write the sentences before sentence_id, and return the matrix of
+        sentence_id, None if it is not in the input or already written"""
+        if sentence_id < self.sentence_id or (
+                sentence_id == self.sentence_id
+                and self.sentence_matrix is None):
+            self.logger.error(f"ConllSemanticAppender got an annotation of "
+                              f"sentence {sentence_id}, which is already "
+                              f"written")
+            return None
+        while self.sentence_id < sentence_id:
+            if not self._next_sentence():
+                self.logger.error(f"ConllSemanticAppender got an annotation "
+                                  f"of sentence {sentence_id}, after the end "
+                                  f"of the input")
+                return None
+        return self.sentence_matrix
+
+    def _next_sentence(self):
+        """Write the sentence being annotated and read the next one
+
+        :returns: bool -- False at the end of the input
+        """
+        if self.sentence_matrix is not None:
+            if self.sentence_id > 0:
+                self.output.write('\n\n')
+            self.output.write(''.join('\t'.join(line) + '\n'
+                                      for line in self.sentence_matrix))
+            self.sentence_matrix = None
+        sentence = next(self.input_sentences, None)
+        if sentence is None:
+            return False
+        self.sentence_id += 1
+        # Put each line with a new column appended for predicate
+        self.sentence_matrix = [line.split('\t') + ['_'] for line in sentence
+                                if len(line.split('\t')) > 1]
+        return True
+
+    def close(self):
+        """Write the remaining sentences, the output is left open"""
+        while self._next_sentence():
+            pass
+
+    def token_at(self, sentence_matrix, char):
+        """Index of the token at a character position of the sentence
+
+        The words of the sentence are separated by one space, which belongs
+        to the token before it. The character position of each token is
+        computed once by sentence, and shared by all its frames.
+
+        :param sentence_matrix: The sentence being written.
+        :type sentence_matrix: str list list.
+        :param char: The character position.
+        :type char: int.
+        :returns: int -- the index of the token, None after the sentence
+        """
+        if self.offsets_sentence is not sentence_matrix:
+            self.offsets_sentence = sentence_matrix
+            self.offsets = array('i')
+            offset = 0
+            for line in sentence_matrix:
+                self.offsets.append(offset)
+                offset += len(line[1]) + 1
+            self.offsets.append(offset)
+        if not 0 <= char < self.offsets[-1]:
+            return None
+        return bisect_right(self.offsets, char) - 1
+
+    @staticmethod
+    def add_new_column(sentence_matrix):
+        for line in sentence_matrix:
             line.append('_')
 
     def add_verbnet_frame_annotation(self, frame_annotation):
+        sentence_matrix = self._sentence(frame_annotation.sentence_id)
+        if sentence_matrix is None:
+            return
         # We could have multiple classes, so join them with |
-        self.conll_matrix[frame_annotation.sentence_id][frame_annotation.tokenid-1][-1] = '|'.join(sorted(frame_annotation.best_classes()))  # noqa
+        sentence_matrix[frame_annotation.tokenid-1][-1] = '|'.join(sorted(frame_annotation.best_classes()))  # noqa
         # Add new column to place the new roles
-        self.add_new_column(frame_annotation.sentence_id)
+        self.add_new_column(sentence_matrix)
 
         for roleset, arg in zip(frame_annotation.roles, frame_annotation.args):
             roleset_str = '|'.join(sorted(roleset)) if roleset else '_EMPTYROLE_'  # noqa
             self.logger.debug('add_verbnet_frame_annotation roleset: {}'
                               .format(roleset_str))
-            self.conll_matrix[frame_annotation.sentence_id][arg.position-1][-1] = roleset_str  # noqa
+            sentence_matrix[arg.position-1][-1] = roleset_str
 
     def add_framenet_frame_annotation(self, frame_annotations):
         """ Add columns corresponding to the given frame instances.
@@ -467,6 +716,9 @@ class ConllSemanticAppender():
         self.logger.info("add_framenet_frame_annotation frame instance list: [{}]".format(','.join(str(x) for x in frame_annotations)))  # noqa
         if len(frame_annotations) == 0:
             return
+        sentence_matrix = self._sentence(frame_annotations[0].sentence_id)
+        if sentence_matrix is None:
+            return
 
         # Must shift annotations one line up on first sentence because
         # there is no previous sentence punctuation.
@@ -476,41 +728,37 @@ class ConllSemanticAppender():
 
         # compute the predicates string, concatenation of the possible
         # frames names
-        if frame_annotations[0].predicate.tokenid+notFirstSentenceShift < len(self.conll_matrix[frame_annotations[0].sentence_id]):
-            # self.logger.debug(len(self.conll_matrix[frame_annotations[0].sentence_id][frame_annotations[0].predicate.tokenid+notFirstSentenceShift]))
+        if frame_annotations[0].predicate.tokenid+notFirstSentenceShift < len(sentence_matrix):
+            # self.logger.debug(len(sentence_matrix[frame_annotations[0].predicate.tokenid+notFirstSentenceShift]))
             self.logger.debug("[frame_annotations[0].sentence_id {frame_annotations[0].sentence_id}")
             self.logger.debug("frame_annotations[0].predicate.tokenid+notFirstSentenceShift {frame_annotations[0].predicate.tokenid+notFirstSentenceShift}")
             self.logger.debug("frame_annotations[0].predicate.tokenid {frame_annotations[0].predicate.tokenid}")
             self.logger.debug("notFirstSentenceShift {notFirstSentenceShift}")
-            self.logger.debug("self.conll_matrix[frame_annotations[0].sentence_id][frame_annotations[0].predicate.tokenid+notFirstSentenceShift][-1] {self.conll_matrix[frame_annotations[0].sentence_id][frame_annotations[0].predicate.tokenid+notFirstSentenceShift][-1]}")
+            self.logger.debug("sentence_matrix[frame_annotations[0].predicate.tokenid+notFirstSentenceShift][-1] {sentence_matrix[frame_annotations[0].predicate.tokenid+notFirstSentenceShift][-1]}")
             self.logger.debug("[frame_instance.frame_name for frame_instance in frame_annotations] {[frame_instance.frame_name for frame_instance in frame_annotations]}")
-            self.conll_matrix[frame_annotations[0].sentence_id][frame_annotations[0].predicate.tokenid+notFirstSentenceShift][-1] = '|'.join([frame_instance.frame_name for frame_instance in frame_annotations])  # noqa
-            self.logger.debug(self.conll_matrix[frame_annotations[0].sentence_id])
+            sentence_matrix[frame_annotations[0].predicate.tokenid+notFirstSentenceShift][-1] = '|'.join([frame_instance.frame_name for frame_instance in frame_annotations])  # noqa
+            self.logger.debug(sentence_matrix)
         else:
             self.logger.error("add_framenet_frame_annotation got token number "
-                              "larger than conll_matrix for current sentence")
+                              "larger than the matrix of the current sentence")
             return
 
         # Add new column to place the new roles
-        self.add_new_column(frame_annotations[0].sentence_id)
+        self.add_new_column(sentence_matrix)
 
         # join all frame instance argument that are at the same position
         arguments_for_ids = defaultdict(list)
         for frame_instance in frame_annotations:
             for arg in frame_instance.args:
-                conll_lines = self.conll_matrix[frame_instance.sentence_id]
-                words = [line[1] for line in conll_lines if line]
-                sentence = " ".join(words)
-                char_to_word = []
-                current_char = 0
-                for i, word in enumerate(words):
-                    for _ in word:
-                        char_to_word.append(i)
-                    char_to_word.append(i)
-                    current_char += len(word) + 1
-                start_word = char_to_word[arg.begin] +1
-                positions = list(range(start_word, start_word + arg.position))
-                for position in positions:
+                token = self.token_at(sentence_matrix, arg.begin)
+                if token is None:
+                    self.logger.error(
+                        f"add_framenet_frame_annotation got argument "
+                        f"{arg.text} beginning at {arg.begin}, after the end "
+                        f"of the current sentence")
+                    continue
+                start_word = token + 1
+                for position in range(start_word, start_word + arg.position):
                     arguments_for_ids[position].append(arg.role)
 
         # place the arguments at the correct place in the matrix
@@ -519,22 +767,7 @@ class ConllSemanticAppender():
             self.logger.debug(
                 'add_framenet_frame_annotation roleset: {}'.format(
                     roleset_str))
-            if (position+notFirstSentenceShift <
-                    len(self.conll_matrix[frame_annotations[0].sentence_id])):
+            if position+notFirstSentenceShift < len(sentence_matrix):
                 self.logger.debug("frame_annotations[0].sentence_id {frame_annotations[0].sentence_id}, position {position}, notFirstSentenceShift {notFirstSentenceShift}")
-                self.conll_matrix[frame_annotations[0].sentence_id][
-                    position+notFirstSentenceShift][-1] = roleset_str  # noqa
-
-    def dump_semantic_file(self, filename):
-        with open(filename, 'w') as semantic_file:
-            for i, sentence in enumerate(self.conll_matrix):
-                for line in sentence:
-                    semantic_file.write('\t'.join(line))
-                    semantic_file.write('\n')
-                    self.logger.debug('\t'.join(line))
-                if i < len(self.conll_matrix) - 1:
-                    semantic_file.write('\n')
-                    semantic_file.write('\n')
-                    self.logger.debug('\n')
-                    self.logger.debug('\n')
+                sentence_matrix[position+notFirstSentenceShift][-1] = roleset_str  # noqa
 
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Array-backed parsed CoNLL sentences
+
+SyntacticTreeBuilder creates one SyntacticTreeNode object per word. A
+ConllSentence stores the same sentence by columns instead: arrays of integers
+for the ids, heads and spans, and codes in a StringTable, shared by all the
+sentences of a corpus, for the strings. NodeView gives the SyntacticTreeNode
+interface on top of these columns and is only created when a node is
+accessed.
+
+    Defines the classes:
+    * StringTable
+    * ConllSentence
+    * NodeView
+"""
+
+from array import array
+import logging
+
+from conllreader import TreeNodeMixin, conll_columns
+import options
+
+
+class StringTable:
+    """Interned strings, stored once whatever the number of words using them
+
+    :var strings: str list -- the strings, by code
+    """
+
+    __slots__ = ('strings', '_codes')
+
+    def __init__(self):
+        self.strings = []
+        self._codes = {}
+
+    def __len__(self):
+        return len(self.strings)
+
+    def __getitem__(self, code):
+        return self.strings[code]
+
+    def code(self, string):
+        """Return the code of string, adding it to the table if needed"""
+        code = self._codes.get(string)
+        if code is None:
+            code = self._codes[string] = len(self.strings)
+            self.strings.append(string)
+        return code
+
+
+class ConllSentence:
+    """A parsed sentence, stored by columns indexed by word position
+
+    Integer columns hold -1 where a SyntacticTreeNode attribute would be None,
+    string columns hold codes in strings.
+
+    :var strings: StringTable -- the strings of the string columns
+    :var word_ids: array -- CoNLL word ids (start at 1)
+    :var heads: array -- CoNLL heads
+    :var fathers: array -- index of the father of each word
+    :var begin_words: array -- character position of each word
+    :var begins: array -- character position of each phrase
+    :var ends: array -- character position of the end of each phrase
+    :var first_indexes: array -- index of the first word of each phrase
+    :var last_indexes: array -- index of the last word of each phrase
+    :var subtree_sizes: array -- number of words of each phrase
+    :var preorder: array -- index of every word of the trees, each one before
+        its children
+    :var preorder_ranks: array -- position of each word in preorder
+    :var child_starts: array -- children of word i are
+        child_indexes[child_starts[i]:child_starts[i + 1]]
+    :var child_indexes: array -- index of the children of every word
+    :var roots: array -- index of the root of each tree
+    :var words, lemmas, cposes, poses, deprels, named_entity_types, features,
+        pheads, pdeprels: array -- codes of the string columns
+    """
+
+    string_columns = ['words', 'lemmas', 'cposes', 'poses',
+                      'named_entity_types', 'features', 'deprels', 'pheads',
+                      'pdeprels']
+
+    # Every column, enough to rebuild a sentence with from_columns
+    array_columns = ['word_ids', 'heads', 'fathers', 'begin_words', 'begins',
+                     'ends', 'first_indexes', 'last_indexes', 'subtree_sizes',
+                     'preorder', 'preorder_ranks', 'child_starts',
+                     'child_indexes', 'roots'] + string_columns
+
+    def __init__(self, lines, strings=None):
+        """Parse a sentence
+
+        :param lines: The lines of the sentence, see conllreader.conll_blocks
+            and conllreader.conll_columns.
+        :type lines: str iterable.
+        :param strings: The table shared by the sentences of a corpus, a new
+            one if None.
+        :type strings: StringTable.
+        """
+        logger = logging.getLogger(__name__)
+        logger.setLevel(options.Options.loglevel)
+
+        self.strings = StringTable() if strings is None else strings
+        columns = conll_columns(lines)
+        self.word_ids = array('i', columns.word_ids)
+        self.heads = array('i', [-1 if head is None else head
+                                 for head in columns.heads])
+        self.begin_words = array('i', [0]) * len(columns.forms)
+        begin = 0
+        for index, form in enumerate(columns.forms):
+            self.begin_words[index] = begin
+            begin += 1 + len(form)
+        code = self.strings.code
+        for name, strings in zip(self.string_columns, (
+                columns.forms, columns.lemmas, columns.cposes, columns.poses,
+                columns.named_entity_types, columns.features,
+                columns.deprels, columns.pheads, columns.pdeprels)):
+            setattr(self, name, array('i', map(code, strings)))
+
+        self._link(logger)
+        self._fill_spans()
+        self._sentence_words = None
+        self._spans = None
+
+    @classmethod
+    def from_columns(cls, columns, strings):
+        """Rebuild a sentence without parsing it again
+
+        :param columns: The arrays of a sentence, by name, see array_columns.
+        :type columns: dict.
+        :param strings: The table of the codes of the string columns.
+        :type strings: StringTable.
+        :returns: ConllSentence -- the sentence
+        """
+        sentence = cls.__new__(cls)
+        sentence.strings = strings
+        for name in cls.array_columns:
+            setattr(sentence, name, columns[name])
+        sentence._sentence_words = None
+        sentence._spans = None
+        return sentence
+
+    def __len__(self):
+        return len(self.word_ids)
+
+    def _link(self, logger):
+        """Fill fathers, children and roots from the heads"""
+        size = len(self.word_ids)
+        index_of = {word_id: index
+                    for index, word_id in enumerate(self.word_ids)}
+        self.fathers = array('i', [-1]) * size
+        children = [[] for _ in range(size)]
+        for index, head in enumerate(self.heads):
+            if head > 0:
+                father = index_of.get(head)
+                if father is None:
+                    logger.error(
+                        f'father id {head} of word_id '
+                        f'{self.word_ids[index]} not found in CoNLL tree')
+                    continue
+                self.fathers[index] = father
+                children[father].append(index)
+
+        self.child_starts = array('i', [0])
+        self.child_indexes = array('i')
+        for node_children in children:
+            self.child_indexes.extend(node_children)
+            self.child_starts.append(len(self.child_indexes))
+        self.roots = array('i', [index for index, father
+                                 in enumerate(self.fathers) if father == -1])
+
+    def _fill_spans(self):
+        """Fill the character and word spans and the preorder of every
+        phrase, as SyntacticTreeBuilder.fill_begin_end"""
+        size = len(self.word_ids)
+        self.begins = array('i', [-1]) * size
+        self.ends = array('i', [-1]) * size
+        self.first_indexes = array('i', [-1]) * size
+        self.last_indexes = array('i', [-1]) * size
+        self.subtree_sizes = array('i', [0]) * size
+        self.preorder = array('i')
+        self.preorder_ranks = array('i', [-1]) * size
+
+        for root in self.roots:
+            stack = [(root, False)]
+            while stack:
+                index, children_done = stack.pop()
+                children = self.children_of(index)
+                if not children_done:
+                    self.preorder_ranks[index] = len(self.preorder)
+                    self.preorder.append(index)
+                    stack.append((index, True))
+                    stack.extend((child, False) for child in reversed(children))
+                    continue
+                begin = self.begin_words[index]
+                end = begin + len(self.strings[self.words[index]]) - 1
+                first = last = index
+                subtree_size = 1
+                for child in children:
+                    begin = min(begin, self.begins[child])
+                    end = max(end, self.ends[child])
+                    first = min(first, self.first_indexes[child])
+                    last = max(last, self.last_indexes[child])
+                    subtree_size += self.subtree_sizes[child]
+                self.begins[index], self.ends[index] = begin, end
+                self.first_indexes[index] = first
+                self.last_indexes[index] = last
+                self.subtree_sizes[index] = subtree_size
+
+    def children_of(self, index):
+        """Index of the children of a word, in the order of the sentence"""
+        return self.child_indexes[
+            self.child_starts[index]:self.child_starts[index + 1]]
+
+    def span_indexes(self, begin, end):
+        """Index of the phrases spanning from begin to end, in preorder
+
+        The index of the spans is built by the first call.
+        """
+        if self._spans is None:
+            self._spans = {}
+            for index in self.preorder:
+                self._spans.setdefault(
+                    (self.begins[index], self.ends[index]), []).append(index)
+        return self._spans.get((begin, end), [])
+
+    def node(self, index):
+        """The view of the word at index"""
+        return NodeView(self, index)
+
+    @property
+    def sentence_words(self):
+        """The words of the sentence, as SyntacticTreeNode.sentence_words"""
+        if self._sentence_words is None:
+            self._sentence_words = [self.strings[code]
+                                    for code in self.words]
+        return self._sentence_words
+
+    @property
+    def sentence(self):
+        """The words separated by spaces, as SyntacticTreeBuilder.sentence"""
+        return ' '.join(word for _, word in sorted(
+            zip(self.word_ids, self.sentence_words), key=lambda x: x[0]))
+
+    @property
+    def tree_list(self):
+        """The root of every tree, as SyntacticTreeBuilder.tree_list"""
+        return [NodeView(self, root) for root in self.roots]
+
+    @property
+    def nodes(self):
+        """Every word, as SyntacticTreeBuilder.nodes"""
+        return [NodeView(self, index) for index in range(len(self))]
+
+
+def _int_column(name, doc):
+    def get(self):
+        value = getattr(self.sentence, name)[self.index]
+        return None if value == -1 else value
+    return property(get, doc=doc)
+
+
+def _string_column(name, doc):
+    def get(self):
+        sentence = self.sentence
+        return sentence.strings[getattr(sentence, name)[self.index]]
+    return property(get, doc=doc)
+
+
+class NodeView(TreeNodeMixin):
+    """One word of a ConllSentence, with the interface of SyntacticTreeNode
+
+    Views are created on demand: compare them with == rather than is.
+
+    :var sentence: ConllSentence -- the sentence of the word
+    :var index: int -- the position of the word in the sentence (starts at 0)
+    """
+
+    __slots__ = ('sentence', 'index')
+
+    def __init__(self, sentence, index):
+        self.sentence = sentence
+        self.index = index
+
+    word_id = _int_column('word_ids', 'int, the CoNLL word id (starts at 1)')
+    head = _int_column('heads', 'int, the CoNLL head')
+    begin_word = _int_column('begin_words',
+                             'int, the position this *word* begins at')
+    begin = _int_column('begins',
+                        'int, the character position this phrase starts at')
+    end = _int_column('ends', 'int, the position this phrase ends at')
+    first_index = _int_column('first_indexes',
+                              'int, index of the first word of this phrase')
+    last_index = _int_column('last_indexes',
+                             'int, index of the last word of this phrase')
+    subtree_size = _int_column('subtree_sizes',
+                               'int, number of words of this phrase')
+    preorder_rank = _int_column('preorder_ranks',
+                                'int, position of the word in preorder')
+
+    word = _string_column('words', 'string, the word')
+    lemma = _string_column('lemmas', 'string, the lemma of the word')
+    cpos = _string_column('cposes', 'string, part-of-speech of the node')
+    pos = _string_column('poses', 'string, part-of-speech of the node')
+    namedEntityType = _string_column('named_entity_types',
+                                     'string, named entity type')
+    features = _string_column('features', 'string, morphological features')
+    deprel = _string_column('deprels',
+                            'string, function attributed by the parser')
+    phead = _string_column('pheads', 'string, projective head')
+    pdeprel = _string_column('pdeprels', 'string, projective deprel')
+
+    @property
+    def father(self):
+        father = self.sentence.fathers[self.index]
+        return None if father == -1 else NodeView(self.sentence, father)
+
+    @property
+    def children(self):
+        return [NodeView(self.sentence, child)
+                for child in self.sentence.children_of(self.index)]
+
+    @property
+    def sentence_words(self):
+        return self.sentence.sentence_words
+
+    def _sentence_nodes(self, start, stop):
+        """The nodes from start to stop in the preorder"""
+        sentence = self.sentence
+        return (NodeView(sentence, index)
+                for index in sentence.preorder[start:stop])
+
+    def preorder_interval(self):
+        sentence = self.sentence
+        start = sentence.preorder_ranks[self.index]
+        return start, start + sentence.subtree_sizes[self.index]
+
+    def preorder_node(self, rank):
+        return NodeView(self.sentence, self.sentence.preorder[rank])
+
+    def _span_nodes(self, begin, end):
+        """The nodes of the sentence spanning from begin to end, in
+        preorder"""
+        sentence = self.sentence
+        return [NodeView(sentence, index)
+                for index in sentence.span_indexes(begin, end)]
+
+    @property
+    def position(self):
+        """Where the word is among its children, see SyntacticTreeBuilder"""
+        begin_words = self.sentence.begin_words
+        children = self.sentence.children_of(self.index)
+        for child_id, child in enumerate(children):
+            if begin_words[child] > begin_words[self.index]:
+                return child_id
+        return len(children)
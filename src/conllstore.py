@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Random access to the sentences of a parsed CoNLL file
+
+Reading a whole parse file to build the tree of every sentence is wasteful
+when only some sentences are needed. The file is memory-mapped instead, and
+an index of the byte offsets of its sentences, built in one scan, gives
+direct access to any of them. The index is kept in paths.Paths.CACHE, named
+after the path of the file like its parse cache file, until the file changes.
+Sentences are only parsed when accessed, or rebuilt from the parse cache when
+it holds the file, see parsecache.
+
+A store keeping all its sentences is also the parsed document shared by the
+argument identification and the gold annotations, so that each file is only
+parsed once.
+
+    Defines the class ConllStore and the functions:
+    * sentence_offsets
+    * index_file
+    * load_index
+"""
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+import logging
+import mmap
+import os
+import pathlib
+import struct
+import sys
+import tempfile
+
+from conllreader import stdin_content
+from conllsentence import ConllSentence, StringTable
+import options
+import parsecache
+import paths
+
+# The byte order is part of the magic: offsets are written in native order
+INDEX_MAGIC = b'KSRLIDX' + sys.byteorder[0].encode('ascii')
+INDEX_VERSION = 1
+# magic, version, size and modification time of the CoNLL file, number of
+# offsets
+INDEX_HEADER = struct.Struct('<8sIQQQ')
+
+
+def sentence_offsets(content):
+    """Find the sentences of a CoNLL file, as conllreader.conll_blocks
+
+    :param content: The content of the file.
+    :type content: bytes or mmap.mmap.
+    :returns: array -- sentence i spans the bytes from offsets[2 * i] to
+        offsets[2 * i + 1]
+    """
+    offsets = array('q')
+    in_sentence, last_end = False, 0
+    start, size = 0, len(content)
+    while start < size:
+        end = content.find(b'\n', start)
+        if end == -1:
+            end = size
+        stripped = content[start:end].strip()
+        if not stripped.isascii():
+            stripped = stripped.decode('utf-8').strip().encode('utf-8')
+        if not stripped:
+            if in_sentence:
+                offsets.append(last_end)
+                in_sentence = False
+        elif not stripped.startswith(b'#'):
+            if not in_sentence:
+                offsets.append(start)
+                in_sentence = True
+            last_end = end
+        start = end + 1
+    if in_sentence:
+        offsets.append(last_end)
+    return offsets
+
+
+def index_file(filename):
+    """Return the index file of a CoNLL file"""
+    return (paths.Paths.CACHE / 'indexes' /
+            (parsecache.cache_name(filename) + '.idx'))
+
+
+def load_index(filename, content):
+    """Return the sentence offsets of a CoNLL file, read from its index file
+    while the size and the modification time of the file are the ones it was
+    built for
+
+    Otherwise the index is built again and written to its index file, or
+    only kept in memory when the cache cannot be written or when the index
+    files are disabled (see options.Options.conll_index).
+
+    :param filename: The CoNLL file.
+    :type filename: pathlib.Path.
+    :param content: The content of the file.
+    :type content: bytes or mmap.mmap.
+    :returns: array -- the offsets, see sentence_offsets
+    """
+    logger = logging.getLogger(__name__)
+    logger.setLevel(options.Options.loglevel)
+
+    if not options.Options.conll_index:
+        return sentence_offsets(content)
+    stat = filename.stat()
+    indexed = index_file(filename)
+    try:
+        with open(str(indexed), 'rb') as index:
+            stored = index.read()
+        magic, version, size, mtime, count = INDEX_HEADER.unpack_from(stored)
+        if ((magic, version, size, mtime) ==
+                (INDEX_MAGIC, INDEX_VERSION, stat.st_size, stat.st_mtime_ns)
+                and len(stored) == INDEX_HEADER.size + 8 * count):
+            offsets = array('q')
+            offsets.frombytes(stored[INDEX_HEADER.size:])
+            return offsets
+        logger.debug('load_index: {} changed'.format(filename))
+    except FileNotFoundError:
+        logger.debug('load_index: no index for {} yet'.format(filename))
+    except (OSError, struct.error) as e:
+        logger.warning('load_index: ignoring unreadable {}: {}'.format(
+            indexed, e))
+
+    offsets = sentence_offsets(content)
+    _store_index(indexed, INDEX_HEADER.pack(
+        INDEX_MAGIC, INDEX_VERSION, stat.st_size, stat.st_mtime_ns,
+        len(offsets)) + offsets.tobytes())
+    return offsets
+
+
+def _store_index(indexed, stored):
+    """Atomically write an index file, concurrent readers never see half of
+    it"""
+    logger = logging.getLogger(__name__)
+    try:
+        indexed.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmpname = tempfile.mkstemp(dir=str(indexed.parent),
+                                       prefix=indexed.name)
+    except OSError as e:
+        # Without a writable cache, files are indexed at each run
+        logger.debug('load_index: cannot write {}: {}'.format(indexed, e))
+        return
+    try:
+        with os.fdopen(fd, 'wb') as tmpfile:
+            tmpfile.write(stored)
+        os.replace(tmpname, str(indexed))
+    except OSError as e:
+        logger.warning('load_index: cannot write {}: {}'.format(indexed, e))
+        os.unlink(tmpname)
+
+
+class ConllStore(Mapping):
+    """The trees of the sentences of a parsed CoNLL file, by sentence id
+
+    The store maps the id of a sentence (starting at 0) to the tree_list of
+    its ConllSentence. The last cache_size sentences accessed are kept.
+
+    :var filename: pathlib.Path -- the CoNLL file
+    :var cache_size: int -- the number of sentences kept, all if None
+    :var offsets: array -- byte offsets of the sentences, see
+        sentence_offsets
+    :var strings: conllsentence.StringTable -- the strings of the sentences
+    :var parsed: int -- the number of sentences parsed (or rebuilt from the
+        parse cache) so far
+    :var parses: parsecache.ParsedFile -- the cached sentences of the file,
+        None without parse cache
+    """
+
+    def __init__(self, filename, cache_size=128):
+        """Map a file and load (or build) the index of its sentences
+
+        :param filename: The CoNLL file, "-" for the standard input.
+        :type filename: str or pathlib.Path.
+        :param cache_size: The number of sentences kept, all if None.
+        :type cache_size: int.
+        """
+        self.filename = pathlib.Path(filename)
+        self.cache_size = cache_size
+        self.strings = StringTable()
+        self.parsed = 0
+        self._sentences = OrderedDict()
+        self.parses = None
+        if str(filename) == '-':
+            # The standard input cannot be mapped, and is shared with the
+            # other readers of "-"
+            self.content = stdin_content().encode('utf-8')
+            self.offsets = sentence_offsets(self.content)
+            return
+        with open(str(self.filename), 'rb') as conll_file:
+            try:
+                self.content = mmap.mmap(conll_file.fileno(), 0,
+                                         access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                self.content = b''
+        self.offsets = load_index(self.filename, self.content)
+        self.parses = parsecache.load(self.filename, self.content)
+        if self.parses is not None:
+            self._codes = self.parses.remap(self.strings)
+
+    def __len__(self):
+        return len(self.offsets) // 2
+
+    def __iter__(self):
+        return iter(range(len(self)))
+
+    def __getitem__(self, sentence_id):
+        return self.sentence(sentence_id).tree_list
+
+    def sentence(self, sentence_id):
+        """The parsed sentence, parsing it if it is not kept yet
+
+        :param sentence_id: The id of the sentence (starts at 0).
+        :type sentence_id: int.
+        :returns: conllsentence.ConllSentence -- the sentence
+        """
+        sentence = self._sentences.get(sentence_id)
+        if sentence is not None:
+            self._sentences.move_to_end(sentence_id)
+            return sentence
+        if self.parses is not None:
+            sentence = self.parses.sentence(sentence_id, self.strings,
+                                            self._codes)
+        else:
+            sentence = ConllSentence(self.lines(sentence_id), self.strings)
+        self.parsed += 1
+        self._sentences[sentence_id] = sentence
+        if (self.cache_size is not None and
+                len(self._sentences) > self.cache_size):
+            self._sentences.popitem(last=False)
+        return sentence
+
+    def sentence_trees(self):
+        """Yield all sentence trees in order, as
+        conllparsedreader.ConllParsedReader.sentence_trees"""
+        for sentence_id in self:
+            sentence = self.sentence(sentence_id)
+            for tree in sentence.tree_list:
+                yield sentence_id, sentence.sentence, tree
+
+    def lines(self, sentence_id):
+        """The lines of a sentence, as conllreader.conll_blocks
+
+        :param sentence_id: The id of the sentence (starts at 0).
+        :type sentence_id: int.
+        :returns: str list -- the lines, without their line ends
+        """
+        if not 0 <= sentence_id < len(self):
+            raise KeyError(sentence_id)
+        start, end = self.offsets[2 * sentence_id:2 * sentence_id + 2]
+        text = self.content[start:end].decode('utf-8')
+        return [line.rstrip('\r') for line in text.split('\n')
+                if not line.strip().startswith('#')]
+
+    def close(self):
+        """Unmap the file"""
+        self._sentences.clear()
+        if self.parses is not None:
+            self.parses.close()
+        if isinstance(self.content, mmap.mmap):
+            self.content.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -18,21 +18,26 @@ import errorslog
 import roleextractor
 import argguesser
 import stats
+import lexicons
 import options
 import paths
-import rolematcher
 
 import logging
 
-def get_frames(corpus, verbnet_classes, frameNet, argid=False):
+def get_frames(corpus, verbnet_classes, frameNet, argid=False, language=None):
     """ Fills two list of the same size with content dependent of the kind of input
     
     The two lists are annotation_list and parsed_conll_list
+
+    :param language: The language of the corpus, options.Options.language if
+        None.
+    :type language: str.
     """
     logger = logging.getLogger(__name__)
     logger.setLevel(options.Options.loglevel)
     logger.debug("get_frames corpus={} input={}".format(
         corpus,options.Options.conll_input))
+    language = language or options.Options.language
 
     if options.Options.conll_input is not None:
         annotation_list = [None]
@@ -47,7 +52,7 @@ def get_frames(corpus, verbnet_classes, frameNet, argid=False):
 
     if options.Options.corpus == 'FrameNet':
         logger.info("Loading FrameNet and VerbNet role mappings %s ..."%paths.Paths.VNFN_MATCHING)
-        role_matcher = rolematcher.VnFnRoleMatcher(paths.Paths.VNFN_MATCHING, frameNet)
+        role_matcher = lexicons.role_matcher(language)
 
         for annotation_file, parsed_conll_file in zip(annotation_list, parsed_conll_list):
             logger.debug("Handling {} {}" .format(annotation_file, parsed_conll_file))
@@ -70,7 +75,7 @@ def get_frames(corpus, verbnet_classes, frameNet, argid=False):
                     )
                 new_annotated_frames = roleextractor.fill_gold_roles(
                     new_frame_instances, annotation_file, parsed_conll_file,
-                    verbnet_classes, role_matcher)
+                    verbnet_classes, role_matcher, language=language)
                 logger.debug('got nb new_annotated_frames: {}'.format(len(new_annotated_frames)))
                 
                 for gold_frame, frame_instance in zip(new_annotated_frames, new_frame_instances):
@@ -82,7 +87,8 @@ def get_frames(corpus, verbnet_classes, frameNet, argid=False):
                 # Load gold arguments
                 #
                 fn_reader = FNAllReader(
-                    add_non_core_args=options.Options.add_non_core_args)
+                    add_non_core_args=options.Options.add_non_core_args,
+                    language=language)
 
                 for framenet_instance in fn_reader.iter_frames(annotation_file, parsed_conll_file):
                     annotated_frames.append(framenet_instance)
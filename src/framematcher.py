@@ -124,17 +124,17 @@ class FrameMatcher():
             yield i, restr
 
     @staticmethod
-    def _is_a_match(frame_occurrence_part, official_frame_part):
+    def _is_a_match(frame_occurrence_elem, official_frame_elem):
         """Tell wether two elements can be considered as a match
 
-        frame_occurrence_part is a seen element, while official_frame_elem can
-        contain a set of possible elements, such as prepositions
+        frame_occurrence_elem is a seen element, while official_frame_elem can
+        be a set of possible elements, such as prepositions
         """
 
-        if isinstance(official_frame_part['elem'], set):
-            return frame_occurrence_part['elem'] in official_frame_part['elem']
+        if isinstance(official_frame_elem, (set, frozenset)):
+            return frame_occurrence_elem in official_frame_elem
         else:
-            return frame_occurrence_part['elem'] == official_frame_part['elem']
+            return frame_occurrence_elem == official_frame_elem
 
     def _matching_baseline(self, verbnet_frame, slots_associations):
         """ Matching algorithm that is the closest to the article's method """
@@ -164,8 +164,8 @@ class FrameMatcher():
 
                 if (slot_type == ComputeSlotTypeMixin.slot_types["prep_object"] and
                     not FrameMatcher._is_a_match(
-                        {'elem': self.frame_occurrence.slot_preps[slot_pos]},
-                        {'elem': test_slot_data["prep"]})):
+                        self.frame_occurrence.slot_preps[slot_pos],
+                        test_slot_data["prep"])):
                     continue
 
                 matching_slot = test_slot_data["pos"]
@@ -188,10 +188,13 @@ class FrameMatcher():
         num_match = 0
         i, j = 0, 0
         index_v_in_frame_occurrence = self.frame_occurrence.structure.index({'elem': 'V'})
-        index_v_in_official_frame = verbnet_frame.syntax.index({'elem': 'V'})
+        index_v_in_official_frame = verbnet_frame.index_v
+        if index_v_in_official_frame is None:
+            raise ValueError('No verb in {}'.format(verbnet_frame))
+        official_elements = verbnet_frame.elements
         slot_1, slot_2 = 0, 0
         num_slots_before_v_in_frame_occurrence = 0
-        num_slots_before_v_in_official_frame = 0
+        num_slots_before_v_in_official_frame = verbnet_frame.num_slots_before_v
 
         for part in self.frame_occurrence.structure:
             if VerbnetFrameOccurrence._is_a_slot(part):
@@ -199,17 +202,10 @@ class FrameMatcher():
             elif part['elem'] == "V":
                 break
 
-        for part in verbnet_frame.syntax:
-            if 'role' in part:
-                num_slots_before_v_in_official_frame += 1
-            elif part['elem'] == "V":
-                break
-
-        while i < len(self.frame_occurrence.structure) and j < len(verbnet_frame.syntax):
+        while i < len(self.frame_occurrence.structure) and j < len(official_elements):
             occured_part = self.frame_occurrence.structure[i]
-            official_part = verbnet_frame.syntax[j]
 
-            if FrameMatcher._is_a_match(occured_part, official_part):
+            if FrameMatcher._is_a_match(occured_part['elem'], official_elements[j]):
                 if VerbnetFrameOccurrence._is_a_slot(occured_part):
                     num_match += 1
                     # TODO this is probably fixed with the SYNTAX-based VN reader
@@ -239,8 +235,8 @@ class FrameMatcher():
     def _matching_stop_on_fail(self, verbnet_frame, slots_associations):
         """ Stop the algorithm at the first mismatch encountered """
         num_match = 0
-        for occured_part, official_part in zip(self.frame_occurrence.structure, verbnet_frame.syntax):
-            if FrameMatcher._is_a_match(occured_part, official_part):
+        for occured_part, official_elem in zip(self.frame_occurrence.structure, verbnet_frame.elements):
+            if FrameMatcher._is_a_match(occured_part['elem'], official_elem):
                 if VerbnetFrameOccurrence._is_a_slot(occured_part):
                     num_match += 1
                     if num_match - 1 < verbnet_frame.num_slots:
@@ -259,15 +255,14 @@ class FrameMatcher():
         """
         logger.debug('perform_frame_matching with algo {}'.format(self.algo))
         best_score = 0
+        # Consider 'that' as optional in english, eg.:
+        # Tell him that S --> Tell him S
+        that_is_optional = {'elem': 'that'} not in self.frame_occurrence.structure
         for verbnet_frame in official_frames_to_be_matched:
             slots_associations = [None for x in range(self.frame_occurrence.num_slots)]
 
-            # Consider 'that' as optional in english, eg.:
-            # Tell him that S --> Tell him S
-            import copy
-            if verbnet_frame.has('that') and {'elem': 'that'} not in self.frame_occurrence.structure:
-                verbnet_frame = copy.deepcopy(verbnet_frame)
-                verbnet_frame.remove('that')
+            if that_is_optional:
+                verbnet_frame = verbnet_frame.without_that()
 
             if self.algo == "baseline":
                 matching_function = self._matching_baseline
@@ -5,6 +5,8 @@
 
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+import lexiconcache
+import parallelloader
 import options
 import logging
 
@@ -17,15 +19,54 @@ class FrameNet:
     
     frames : dict ( string : FrameDefinition )
         a map frame name to FrameDefinition
+    lexical_unit_names : dict ( string : frozenset( string ) )
+        a map frame name to the "lemma.pos_tag" names of its lexical units,
+        available without loading the full frame definition
+    frames_for_verb : dict ( string : set( string ) )
+        the inverted index of the verbal lexical units: a map verb lemma to
+        the names of the frames having "lemma.v" as lexical unit
     """
 
     def __init__(self):
         # nothing
         self.frames = {}
+        self.lexical_unit_names = {}
+        self.frames_for_verb = defaultdict(set)
+
+    def add_lexical_units(self, frame_name, lexical_unit_names):
+        """Record the lexical units names of a frame and index its verbs
+
+        :param frame_name: the name of the frame, e.g.: Ingestion
+        :type frame_name: string
+        :param lexical_unit_names: the "lemma.pos_tag" lexical units names
+        :type lexical_unit_names: frozenset( string )
+        """
+        self.lexical_unit_names[frame_name] = lexical_unit_names
+        for lexical_unit_name in lexical_unit_names:
+            lemma, _, pos = lexical_unit_name.rpartition('.')
+            if pos == 'v':
+                self.frames_for_verb[lemma].add(frame_name)
+
+    def frames_with_verb(self, lemma):
+        """The names of the frames having "lemma.v" as lexical unit
+
+        :returns: set( string ), not to be modified
+        """
+        return self.frames_for_verb.get(lemma, frozenset())
 
     def __eq__(self, other):
         return (isinstance(other, self.__class__))
 
+    def has_lexical_unit(self, frame_name, lexical_unit_name):
+        """Tell whether a frame has a lexical unit, eg. "eat.v" for Ingestion
+
+        Unlike frames[frame_name].lexicalUnits, this does not load a lazy
+        frame definition.
+        """
+        if frame_name in self.lexical_unit_names:
+            return lexical_unit_name in self.lexical_unit_names[frame_name]
+        return lexical_unit_name in self.frames[frame_name].lexicalUnits
+
 
 class FrameDefinition:
     """A frame structure as defined by FrameNet
@@ -79,6 +120,30 @@ class FrameDefinition:
         return ("FrameDefinition(name={}, id={})".format(self.name, self.id))
 
 
+class LazyFrameDefinition(FrameDefinition):
+    """A FrameDefinition whose XML file is only parsed when one of its
+    attributes other than name is read.
+
+    :var name: the name of the frame, e.g.: Ingestion
+    """
+
+    def __init__(self, name, filename, reader):
+        # The other attributes are set by __getattr__
+        self.name = name
+        self._filename = filename
+        self._reader = reader
+
+    def __getattr__(self, attribute):
+        # Only called for attributes that are not set yet
+        if attribute.startswith('_'):
+            raise AttributeError(attribute)
+        frame = self._reader.loadFrame(self._filename)
+        self.__dict__.update(frame.__dict__)
+        if attribute not in self.__dict__:
+            raise AttributeError(attribute)
+        return self.__dict__[attribute]
+
+
 class SemanticType:
     """ A semantic type as defined by FrameNet"""
 
@@ -154,14 +219,24 @@ class FrameNetReader:
     :var path: Path to FrameNet
     :var frameNet: the FrameNet instance to fill
     """
-    
-    def __init__(self, path, frameNet):
+
+    # Increase each time the content of the lazy index changes
+    INDEX_VERSION = 1
+
+    def __init__(self, path, frameNet, lazy=False, jobs=1):
         """Read FrameNet and fill its content.
         
         :param path: Path to FrameNet
         :type path: pathlib.Path
         :param frameNet: the FrameNet instance to fill
         :type frameNet: FrameNet
+        :param lazy: Only read the frame names and their lexical units names
+            (from an index stored by lexiconcache), and parse each frame file
+            the first time its definition is used.
+        :type lazy: bool
+        :param jobs: Number of processes parsing the files, see
+            parallelloader.num_jobs
+        :type jobs: int
         """
 
         self.logger = logging.getLogger(__name__)
@@ -171,9 +246,40 @@ class FrameNetReader:
         if not list(path.glob('frame/*.xml')):
             raise Exception('FrameNet not found in {}! Did you clone with submodules?'.format(path))
 
-        for filename in path.glob('frame/*.xml'):
-            frame = self.loadFrame(filename)
+        if lazy:
+            frame_dir = path / 'frame'
+            index = lexiconcache.load_or_build(
+                'framenet-index', frame_dir,
+                lambda: self.buildIndex(frame_dir, jobs),
+                version=FrameNetReader.INDEX_VERSION)
+            for name, (filename, lexical_unit_names) in index.items():
+                self.frameNet.frames[name] = LazyFrameDefinition(
+                    name, frame_dir / filename, self)
+                self.frameNet.add_lexical_units(name, lexical_unit_names)
+            return
+
+        for frame in parallelloader.map_files(
+                _load_frame_file, path.glob('frame/*.xml'), jobs):
             self.frameNet.frames[frame.name] = frame
+            self.frameNet.add_lexical_units(frame.name,
+                                            frozenset(frame.lexicalUnits))
+
+    def buildIndex(self, frame_dir, jobs=1):
+        """Map each frame name to its file name and lexical units names.
+
+        Only the frame and lexUnit tags are looked at.
+
+        :param frame_dir: the directory containing the frames xml files
+        :type frame_dir: pathlib.Path
+        :param jobs: Number of processes parsing the files
+        :type jobs: int
+        :return dict ( string : ( string, frozenset( string ) ) )
+        """
+        index = {}
+        for name, filename, lexical_unit_names in parallelloader.map_files(
+                _index_frame_file, frame_dir.glob('*.xml'), jobs):
+            index[name] = (filename, lexical_unit_names)
+        return index
 
     def loadFrame(self, filename):
         """Parse one frame.
@@ -265,3 +371,37 @@ class FrameNetReader:
             self.loadAttrib(lexUnitNode, 'cDate'), 
             self.loadDefinition(lexUnitNode))
         return lu
+
+
+def _load_frame_file(filename):
+    """Parse one frame, in a worker process of parallelloader
+
+    :param filename: the name of the file defining the frame
+    :type filename: pathlib.Path
+    :return FrameDefinition
+    """
+    # loadFrame does not depend on the state of the reader
+    return FrameNetReader.__new__(FrameNetReader).loadFrame(filename)
+
+
+def _index_frame_file(filename):
+    """Read the frame name and lexical units names of one frame file, in a
+    worker process of parallelloader
+
+    :param filename: the name of the file defining the frame
+    :type filename: pathlib.Path
+    :return ( string, string, frozenset( string ) ) -- the name of the frame,
+        the name of the file and the names of the lexical units
+    """
+    frame_tag = '{{{}}}frame'.format(namespaces['fn'])
+    lexical_unit_tag = '{{{}}}lexUnit'.format(namespaces['fn'])
+    name, lexical_unit_names = None, set()
+    for _, node in ET.iterparse(str(filename.resolve()), events=('start',)):
+        if node.tag == frame_tag:
+            name = node.attrib['name']
+        elif node.tag == lexical_unit_tag:
+            lexical_unit_names.add(node.attrib.get('name', ''))
+    if name is None:
+        raise Exception('File {} is not a frame xml '
+                        'representation.'.format(filename))
+    return name, filename.name, frozenset(lexical_unit_names)
@@ -6,7 +6,7 @@
 import logging
 import framenetreader
 import options
-from conllreader import SyntacticTreeBuilder
+from conllstore import ConllStore
 import headwordextractor
 
 
@@ -24,6 +24,8 @@ class FNAllReader:
         args
     :var keep_unannotated: boolean -- Indicates whether we want to keep frames
         without arg annotations
+    :var language: str -- The language of the corpus, options.Options.language
+        if None
     :var frames: FrameInstance List -- The collected frames
     """
 
@@ -31,40 +33,46 @@ class FNAllReader:
     be_forms = ["am", "are", "be", "been", "being", "is", "was", "were",
                 "'m", "'re", "'s"]
 
-    def __init__(self, add_non_core_args=True, keep_unannotated=False):
+    def __init__(self, add_non_core_args=True, keep_unannotated=False,
+                 language=None):
         self.add_non_core_args = add_non_core_args
         self.keep_unannotated = keep_unannotated
+        self.language = language
 
         self.stats = {
             "files": 0
         }
 
-    def iter_frames(self, annotation_file, parse_file):
-        """Read the corpus and yield every valid frame"""
+    def iter_frames(self, annotation_file, parse_file, document=None):
+        """Read the corpus and yield every valid frame
+
+        :param annotation_file: The fulltext annotations.
+        :type annotation_file: str.
+        :param parse_file: The syntactic parses of the annotated sentences.
+        :type parse_file: str.
+        :param document: The parses already read from parse_file, if they are
+            shared with other readers.
+        :type document: conllstore.ConllStore.
+        """
 
         logger = logging.getLogger(__name__)
         logger.setLevel(options.Options.loglevel)
         logger.debug(f'iter_frames {annotation_file}, {parse_file}')
         self.stats["files"] += 1
 
-        tree_dict = self.read_syntactic_parses(parse_file)
-        logger.debug(f'iter_frames tree_dict: {tree_dict}')
-
-        reader = framenetreader.FulltextReader(
-            annotation_file,
-            add_non_core_args=self.add_non_core_args,
-            keep_unannotated=self.keep_unannotated,
-            tree_dict=tree_dict)
+        if document is None:
+            with self.read_syntactic_parses(parse_file) as tree_dict:
+                reader = self.read_annotations(annotation_file, tree_dict)
+        else:
+            reader = self.read_annotations(annotation_file, document)
 
         # logger.debug(f'iter_frames reader.frames: {reader.frames}')
         for frame_instance in reader.frames:
             try:
                 logger.debug(f'iter_frames frame_instance: {frame_instance}')
-                logger.debug(f'iter_frames searching {frame_instance.sentence_id}')
-                sentence_tree_list = tree_dict[frame_instance.sentence_id]
-                logger.debug(f'iter_frames sentence_tree_list: {sentence_tree_list}')
+                # frame_instance.tree is the first tree of its sentence
                 self.add_syntactic_information(frame_instance,
-                                               sentence_tree_list[0])
+                                               frame_instance.tree)
                 logger.debug(f'iter_frames yielding {frame_instance}')
                 yield frame_instance
             except PredicateNotFound as e:
@@ -72,25 +80,34 @@ class FNAllReader:
                 pass
         logger.debug('iter_frames DONE')
 
+    def read_annotations(self, annotation_file, tree_dict):
+        """Read the fulltext annotations, with the trees of their sentences
+
+        :param annotation_file: The fulltext annotations.
+        :type annotation_file: str.
+        :param tree_dict: The trees of each sentence, by sentence id.
+        :type tree_dict: ConllStore.
+        :returns: framenetreader.FulltextReader -- the reader of the file
+        """
+        return framenetreader.FulltextReader(
+            annotation_file,
+            add_non_core_args=self.add_non_core_args,
+            keep_unannotated=self.keep_unannotated,
+            tree_dict=tree_dict,
+            language=self.language)
+
     def read_syntactic_parses(self, parse_filename):
         """Load the syntactic annotations files.
-        Not affected by newlines at the end of the file.
+        Not affected by comments nor by extra blank lines.
+
+        The trees of a sentence are only built when it is accessed.
 
         :param parse_filename: The FrameNet filepath,
             eg. path/to/ANC__110CYL072.conll
         :type filename: str.
-        :returns: list of trees
+        :returns: ConllStore -- the trees of each sentence, by sentence id
         """
-        with open(str(parse_filename), encoding='UTF-8') as content:
-            sentences_data = content.read().split("\n\n")
-            if sentences_data[-1] == "":
-                del sentences_data[-1]
-
-        tree_dict = {}
-        for sentence_id, one_sentence_data in enumerate(sentences_data):
-            tree_dict[sentence_id] = SyntacticTreeBuilder(one_sentence_data).tree_list  # noqa
-
-        return tree_dict
+        return ConllStore(parse_filename)
 
     def add_syntactic_information(self, frame, sentence_tree):
         """
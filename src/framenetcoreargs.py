@@ -3,6 +3,10 @@
 
 import xml.etree.ElementTree as ET
 
+import parallelloader
+
+_xmlns = "{http://framenet.icsi.berkeley.edu}"
+
 
 class NoSuchFrameError(Exception):
     """ Trying to determine if a role is a core role of a frame that does not exist.
@@ -23,24 +27,22 @@ class CoreArgsFinder:
     :var core_args: str List Dictionnary -- The list of core args for each frame.
     """
     def __init__(self):
-        self._xmlns = "{http://framenet.icsi.berkeley.edu}"
+        self._xmlns = _xmlns
         self.core_args = {}
 
-    def load_data_from_xml(self, dirname):
+    def load_data_from_xml(self, dirname, jobs=1):
         """Retrieve the data from the XML FrameNet files.
 
         :param dirname: The path to the XML files.
         :type dirname: str.
+        :param jobs: Number of processes parsing the files, see
+            parallelloader.num_jobs.
+        :type jobs: int.
 
         """
-        for filename in dirname.glob('*.xml'):
-            root = ET.ElementTree(file=str(filename.resolve())).getroot()
-
-            self.core_args[root.attrib["name"]] = []
-            for arg_data in root.findall(self._xmlns+"FE[@coreType]"):
-                if arg_data.attrib["coreType"] in ["Core", "Core-Unexpressed"]:
-                    self.core_args[root.attrib["name"]].append(
-                        arg_data.attrib["name"])
+        for frame, core_args in parallelloader.map_files(
+                _read_core_args, dirname.glob('*.xml'), jobs):
+            self.core_args[frame] = core_args
 
     def is_core_role(self, role, frame):
         """Tells whether a role is a core role of a frame
@@ -56,3 +58,18 @@ class CoreArgsFinder:
             raise NoSuchFrameError(frame)
 
         return role in self.core_args[frame]
+
+
+def _read_core_args(filename):
+    """Read the core args of the frame defined in filename, in a worker
+    process of parallelloader
+
+    :returns: (str, str List) -- the frame name and its core args
+    """
+    root = ET.ElementTree(file=str(filename.resolve())).getroot()
+
+    core_args = []
+    for arg_data in root.findall(_xmlns+"FE[@coreType]"):
+        if arg_data.attrib["coreType"] in ["Core", "Core-Unexpressed"]:
+            core_args.append(arg_data.attrib["name"])
+    return root.attrib["name"], core_args
@@ -25,8 +25,7 @@ import xml.etree.ElementTree as ET
 
 from framenetframe import FrameInstance, Predicate, Word, Arg
 from verbnetprepclasses import rel_pronouns
-import framenetcoreargs
-import paths
+import lexicons
 import options
 
 
@@ -38,8 +37,6 @@ class FulltextReader:
 
     """
 
-    core_arg_finder = None
-
     pos_mapping = {
         # Nouns
         "NP": "NNP",
@@ -68,7 +65,8 @@ class FulltextReader:
 
     def __init__(self, filename, add_non_core_args=True,
                  keep_unannotated=False,
-                 tree_dict=None, keep_nonverbal=False, pos_file=None):
+                 tree_dict=None, keep_nonverbal=False, pos_file=None,
+                 language=None):
         """Read a file and update the collected frames list.
 
         :param filename: Path to the file to read.
@@ -81,11 +79,15 @@ class FulltextReader:
         :param tree_dict: Syntactic trees for the frames (grouped by
                             sentence in dict)
         :type trees: None | SyntacticTreeNode Dict
+        :param language: The language of the file, options.Options.language
+                         if None.
+        :type language: str.
         """
 
-        if FulltextReader.core_arg_finder is None and not add_non_core_args:
-            FulltextReader.core_arg_finder = framenetcoreargs.CoreArgsFinder()
-            FulltextReader.core_arg_finder.load_data_from_xml(paths.Paths.framenet_frames(options.Options.language))  # noqa
+        self.core_arg_finder = None
+        if not add_non_core_args:
+            self.core_arg_finder = lexicons.core_args_finder(
+                language or options.Options.language)
 
         self.frames = []
 
@@ -330,7 +332,7 @@ class FulltextReader:
                     continue
 
                 if (not self.add_non_core_args and not
-                    FulltextReader.core_arg_finder.is_core_role(
+                    self.core_arg_finder.is_core_role(
                         new_arg.role, frame_name)):
                     continue
 
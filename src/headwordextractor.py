@@ -6,25 +6,49 @@
     Define the functions:
     * headword
     * get_class
+    * wordnet_class
 
 """
 
-from nltk.corpus import wordnet as wn  # type: ignore
+from collections import Counter
+import functools
 import logging
+import sqlite3
+
+import options
+import wordnetcache
 
 logger = logging.getLogger(__name__)
 
+# The number of classes kept in memory by get_class
+CLASS_CACHE_SIZE = 1 << 16
+
+# How headword found the node of the arguments, in debug mode only: "span"
+# by the span of the argument, "closest match" by the search of the closest
+# match
+lookups = Counter()
+
 
 def headword(arg, tree):
     """Returns the headword of an argument, assuming the proper sentence has
     already been selected.
 
+    The node of the argument is looked up by its span, the search of the
+    closest match in the whole tree is only needed when the span of the
+    argument is not aligned with the parse.
+
     :param arg: The argument.
     :type arg: Arg.
     :returns: str -- The headword
 
     """
-    headword_node = tree.closest_match_as_node(arg)
+    headword_node = tree.node_at_span(arg)
+    if headword_node is None:
+        headword_node = tree.closest_match_as_node(arg)
+        if options.Options.loglevel == logging.DEBUG:
+            lookups['closest match'] += 1
+    elif options.Options.loglevel == logging.DEBUG:
+        lookups['span'] += 1
     prep_child_node = None
 
     # If another word points to headword with relation PMOD, then we want to
@@ -46,8 +70,39 @@ def headword(arg, tree):
     return result
 
 
+@functools.lru_cache(maxsize=CLASS_CACHE_SIZE)
 def get_class(word):
-    """Looks for the WordNet class of a word and returns it.
+    """Returns the WordNet class of a word.
+
+    The recent classes are kept in memory, and all the classes in the table
+    of wordnetcache, shared by all the processes: WordNet is only searched
+    for the words found in neither.
+
+    :param word: The word
+    :type word: str.
+    :returns: str -- The class of the word or None if it was not found
+    """
+    classes = wordnetcache.store()
+    if classes is None:
+        return wordnet_class(word)
+    try:
+        found, wordclass = classes.get(word)
+    except sqlite3.Error as e:
+        logger.warning('get_class: cannot read {}: {}'.format(
+            classes.filename, e))
+        return wordnet_class(word)
+    if not found:
+        wordclass = wordnet_class(word)
+        try:
+            classes.put(word, wordclass)
+        except sqlite3.Error as e:
+            logger.warning('get_class: cannot write {}: {}'.format(
+                classes.filename, e))
+    return wordclass
+
+
+def wordnet_class(word):
+    """Looks for the WordNet class of a word in WordNet and returns it.
 
     :param word: The word
     :type word: str.
@@ -58,6 +113,8 @@ def get_class(word):
     # highest hypernym
     entity_synset = "entity.n.01"
 
+    # NLTK is long to import, and only needed here
+    from nltk.corpus import wordnet as wn  # type: ignore
     synsets = wn.synsets(word)
     if not synsets:
         return None
@@ -6,7 +6,6 @@ import sys
 
 import options
 import probabilitymodel
-import semanticrolelabeler
 
 if __name__ == "__main__":
     # parse command line arguments
@@ -74,6 +73,23 @@ if __name__ == "__main__":
                         default="VerbNet",
                         help="Chose frame lexicon to use for output.")
     # meta
+    parser.add_argument("--no-lexicon-cache", action="store_true",
+                        help="Always parse the lexicons XML files instead of "
+                             "using their snapshots in data/cache.")
+    parser.add_argument("--no-parse-cache", action="store_true",
+                        help="Always parse the CoNLL files instead of using "
+                             "their parsed sentences in data/cache.")
+    parser.add_argument("--no-conll-index", action="store_true",
+                        help="Always index the sentences of the CoNLL "
+                             "files instead of using their index in "
+                             "data/cache.")
+    parser.add_argument("--no-wordnet-cache", action="store_true",
+                        help="Always search WordNet for the classes of the "
+                             "headwords instead of using their table in "
+                             "data/cache.")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of processes parsing the lexicons XML "
+                             "files, 0 for one per core.")
     parser.add_argument("--loglevel", type=str,
                         choices=['debug', 'info', 'warning', 'error',
                                     'critical'],
@@ -89,6 +105,9 @@ if __name__ == "__main__":
     # initialize the Options class with command line arguments
     options.Options(args)
 
+    # Imported once the arguments are parsed, so that --help stays fast
+    import semanticrolelabeler
+
     srl = semanticrolelabeler.SemanticRoleLabeler(language=args.language)
     # What to annotate is set through the Options class
     result = srl.annotate(args.conll_input)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""On-disk snapshots of the lexical resources read from XML
+
+Parsing VerbNet (and the other XML resources) is the main part of the
+start-up time. A snapshot of the resulting Python structures is pickled in
+paths.Paths.CACHE and reused as long as the XML files it was built from do not
+change.
+
+    Defines the functions:
+    * fingerprint
+    * load_or_build
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+import options
+import paths
+
+
+def fingerprint(path, pattern='*.xml', version=0):
+    """Summarize the state of the files matching pattern in path.
+
+    The names, sizes and modification times of the files are hashed, so that
+    any edit, addition or removal produces a new fingerprint.
+
+    :param path: The directory containing the resource.
+    :type path: pathlib.Path.
+    :param pattern: The glob pattern of the resource files.
+    :type pattern: str.
+    :param version: The version of the snapshot format.
+    :type version: int.
+    :returns: str -- the fingerprint
+    """
+    digest = hashlib.sha1()
+    digest.update('{}\0{}\n'.format(version, path.resolve()).encode('utf-8'))
+    for filename in sorted(path.glob(pattern)):
+        stat = filename.stat()
+        digest.update('{}\0{}\0{}\n'.format(
+            filename.name, stat.st_size, stat.st_mtime_ns).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def cache_file(name, path):
+    """Return the snapshot file used for the resource name found in path"""
+    path_hash = hashlib.sha1(str(path.resolve()).encode('utf-8')).hexdigest()
+    return paths.Paths.CACHE / '{}-{}.pickle'.format(name, path_hash[:12])
+
+
+def load_or_build(name, path, builder, pattern='*.xml', version=0):
+    """Return the snapshot of a resource, building it if needed.
+
+    :param name: The name of the resource, eg. "verbnet".
+    :type name: str.
+    :param path: The directory containing the resource.
+    :type path: pathlib.Path.
+    :param builder: Function without arguments returning the snapshot.
+    :type builder: callable.
+    :param pattern: The glob pattern of the resource files.
+    :type pattern: str.
+    :param version: The version of the snapshot format. Increase it each time
+        the structure of the snapshot changes.
+    :type version: int.
+    """
+    logger = logging.getLogger(__name__)
+    logger.setLevel(options.Options.loglevel)
+
+    if not options.Options.lexicon_cache:
+        return builder()
+
+    current = fingerprint(path, pattern, version)
+    filename = cache_file(name, path)
+    try:
+        with open(str(filename), 'rb') as cache:
+            cached_fingerprint, snapshot = pickle.load(cache)
+        if cached_fingerprint == current:
+            logger.debug('load_or_build: {} loaded from {}'.format(
+                name, filename))
+            return snapshot
+        logger.info('load_or_build: {} changed, rebuilding {}'.format(
+            name, filename))
+    except FileNotFoundError:
+        logger.info('load_or_build: no snapshot for {} yet'.format(name))
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ValueError) as e:
+        logger.warning('load_or_build: ignoring unreadable {}: {}'.format(
+            filename, e))
+
+    snapshot = builder()
+    _store(filename, current, snapshot)
+    return snapshot
+
+
+def _store(filename, current, snapshot):
+    """Atomically write a snapshot, concurrent readers never see half of it"""
+    logger = logging.getLogger(__name__)
+    try:
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmpname = tempfile.mkstemp(dir=str(filename.parent),
+                                       prefix=filename.name)
+    except OSError as e:
+        logger.warning('load_or_build: cannot write {}: {}'.format(
+            filename, e))
+        return
+    try:
+        with os.fdopen(fd, 'wb') as tmpfile:
+            pickle.dump((current, snapshot), tmpfile,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpname, str(filename))
+    except (OSError, pickle.PicklingError) as e:
+        logger.warning('load_or_build: cannot write {}: {}'.format(
+            filename, e))
+        os.unlink(tmpname)
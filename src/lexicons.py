@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Process-wide registry of the lexical resources
+
+Each resource is loaded once per language and the same instance is then
+handed to every consumer. Consumers must treat these instances as read-only:
+VerbNet dictionaries are returned as read-only mappings of tuples.
+
+    Defines the class Lexicons and the functions:
+    * for_language
+    * framenet
+    * verbnet
+    * candidate_frames
+    * role_matcher
+    * core_args_finder
+    * clear
+"""
+
+import logging
+from types import MappingProxyType
+
+import framenet as framenet_module
+import framenetcoreargs
+import options
+import paths
+import rolematcher
+import verbnetreader
+
+# (resource name, language) -> shared instance
+_instances = {}
+
+
+def _shared(name, language, builder):
+    key = (name, language)
+    if key not in _instances:
+        logger = logging.getLogger(__name__)
+        logger.setLevel(options.Options.loglevel)
+        logger.info('Loading {} for {}...'.format(name, language))
+        _instances[key] = builder()
+    return _instances[key]
+
+
+def framenet(language):
+    """The FrameNet of language, with lazily loaded frame definitions
+
+    :returns: framenet.FrameNet
+    """
+    def build():
+        frameNet = framenet_module.FrameNet()
+        framenet_module.FrameNetReader(paths.Paths.framenet_path(language),
+                                       frameNet, lazy=True,
+                                       jobs=options.Options.jobs)
+        return frameNet
+    return _shared('FrameNet', language, build)
+
+
+def _verbnet_snapshot(language):
+    return _shared('VerbNet snapshot', language,
+                   lambda: verbnetreader.load_snapshot(
+                       paths.Paths.verbnet_path(language),
+                       options.Options.jobs))
+
+
+def verbnet(language):
+    """The VerbNet of language
+
+    :returns: (frames_for_verb, verbnet_classes) -- read-only mappings from
+        verbs to the tuple of their VerbnetOfficialFrame and to the tuple of
+        their VerbNet class names
+    """
+    def build():
+        snapshot = _verbnet_snapshot(language)
+        return (
+            MappingProxyType({verb: tuple(frames) for verb, frames
+                              in snapshot['frames_for_verb'].items()}),
+            MappingProxyType({verb: tuple(classes) for verb, classes
+                              in snapshot['classes'].items()}))
+    return _shared('VerbNet', language, build)
+
+
+def candidate_frames(language):
+    """The VerbNet frames of each verb of language, ready for frame matching
+
+    :returns: read-only mapping from verbs to their
+        verbnetreader.CandidateFrames
+    """
+    return _shared('VerbNet candidate frames', language,
+                   lambda: MappingProxyType(
+                       _verbnet_snapshot(language)['candidate_frames']))
+
+
+def role_matcher(language):
+    """The VerbNet/FrameNet role mapping
+
+    FrameNet is only loaded for the FrameNet output (see
+    options.Options.framelexicon): otherwise the matcher gets an empty
+    FrameNet, and keeps all the frames of the mapping.
+
+    :returns: rolematcher.VnFnRoleMatcher
+    """
+    if options.Options.framelexicon == options.FrameLexicon.FrameNet:
+        return _shared('VN-FN role matcher', language,
+                       lambda: rolematcher.VnFnRoleMatcher(
+                           paths.Paths.VNFN_MATCHING, framenet(language)))
+    return _shared('VN-FN role matcher without FrameNet', language,
+                   lambda: rolematcher.VnFnRoleMatcher(
+                       paths.Paths.VNFN_MATCHING, framenet_module.FrameNet()))
+
+
+def core_args_finder(language):
+    """The core FrameNet roles of each frame of language
+
+    :returns: framenetcoreargs.CoreArgsFinder
+    """
+    def build():
+        finder = framenetcoreargs.CoreArgsFinder()
+        finder.load_data_from_xml(paths.Paths.framenet_frames(language),
+                                  options.Options.jobs)
+        return finder
+    return _shared('FrameNet core args', language, build)
+
+
+class Lexicons:
+    """The lexical resources of one language
+
+    FrameNet and the role matcher are only looked up when used, so that
+    FrameNet is only loaded when needed, see role_matcher.
+
+    :var language: str -- the language, eg. "eng"
+    :var frames_for_verb: read-only mapping from verbs to the tuple of their
+        VerbnetOfficialFrame
+    :var verbnet_classes: read-only mapping from verbs to the tuple of their
+        VerbNet class names
+    :var candidate_frames: read-only mapping from verbs to their
+        verbnetreader.CandidateFrames
+    """
+
+    def __init__(self, language):
+        self.language = language
+        self.frames_for_verb, self.verbnet_classes = verbnet(language)
+        self.candidate_frames = candidate_frames(language)
+
+    @property
+    def frameNet(self):
+        """framenet.FrameNet -- loaded at first use"""
+        return framenet(self.language)
+
+    @property
+    def role_matcher(self):
+        """rolematcher.VnFnRoleMatcher -- for the current output lexicon"""
+        return role_matcher(self.language)
+
+    def __repr__(self):
+        return 'Lexicons({})'.format(self.language)
+
+
+def for_language(language):
+    """All the resources a labeler needs for language
+
+    :returns: Lexicons
+    """
+    return _shared('lexicons', language, lambda: Lexicons(language))
+
+
+def clear():
+    """Forget every loaded resource, eg. after data files changed"""
+    _instances.clear()
@@ -39,6 +39,11 @@ class Options:
     wordnetrestr: bool = False
     corpus = None  # Init from args
     loglevel: int = logging.WARNING
+    lexicon_cache: bool = True
+    parse_cache: bool = True
+    conll_index: bool = True
+    wordnet_cache: bool = True
+    jobs: int = 1
 
     framelexicon = "VerbNet"
     framelexicons = {
@@ -137,6 +142,16 @@ class Options:
             Options.use_training_set = args.training_set
         if hasattr(args, "lu"):
             Options.corpus_lu = args.lu
+        if hasattr(args, "no_lexicon_cache"):
+            Options.lexicon_cache = not args.no_lexicon_cache
+        if hasattr(args, "no_parse_cache"):
+            Options.parse_cache = not args.no_parse_cache
+        if hasattr(args, "no_conll_index"):
+            Options.conll_index = not args.no_conll_index
+        if hasattr(args, "no_wordnet_cache"):
+            Options.wordnet_cache = not args.no_wordnet_cache
+        if hasattr(args, "jobs"):
+            Options.jobs = args.jobs
         if hasattr(args, "dump") and args.dump is not None:
             Options.dump = True
             Options.dump_file = args.dump
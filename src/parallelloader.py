@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Parse the files of a lexical resource over a pool of processes
+
+The VerbNet classes files and the FrameNet frames files are independent from
+each other: each one is parsed by a worker process and the partial results are
+merged by the caller, in the order of the files, so that the result does not
+depend on the number of processes.
+
+    Defines the functions:
+    * num_jobs
+    * map_files
+"""
+
+import concurrent.futures
+import logging
+import os
+
+import options
+
+
+def num_jobs(jobs=None):
+    """Number of processes to use, 0 meaning one per core
+
+    :param jobs: The requested number of processes, options.Options.jobs if
+        None.
+    :type jobs: int.
+    :returns: int -- the number of processes, at least 1
+    """
+    if jobs is None:
+        jobs = options.Options.jobs
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return jobs
+
+
+def map_files(function, filenames, jobs=None):
+    """Apply function to each file, in parallel when jobs > 1.
+
+    function has to be defined at the top level of a module so that the
+    worker processes can unpickle it, and so do its results.
+
+    :param function: Function parsing one file.
+    :type function: callable.
+    :param filenames: The files to parse.
+    :type filenames: pathlib.Path list.
+    :param jobs: The number of processes, see num_jobs.
+    :type jobs: int.
+    :returns: list -- the results of function, in the order of filenames
+    """
+    logger = logging.getLogger(__name__)
+    logger.setLevel(options.Options.loglevel)
+
+    filenames = list(filenames)
+    jobs = min(num_jobs(jobs), len(filenames))
+    if jobs <= 1:
+        return [function(filename) for filename in filenames]
+
+    logger.info('map_files: {} files over {} processes'.format(
+        len(filenames), jobs))
+    # Big enough chunks to amortize the inter-process communication, small
+    # enough to balance the load between the processes
+    chunksize = max(1, len(filenames) // (jobs * 4))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(function, filenames, chunksize=chunksize))
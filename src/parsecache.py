@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""On-disk cache of the parsed sentences of CoNLL files
+
+Every run parses the same files of data/framenet_parsed and data/lu_parsed
+again. Once parsed, the columns of the ConllSentence of every sentence of a
+file are written in a binary file of paths.Paths.CACHE, named after the path
+of the CoNLL file: later runs rebuild the sentences from these arrays. The
+cache file records the size, the modification time and the hash of the
+content of the CoNLL file. The content is only hashed when the size or the
+modification time differ: the cache file of a file only touched records its
+new modification time, and a file whose content changed is parsed again,
+replacing its cache file.
+
+The cache file holds a header, the strings of the file, the offset of each
+sentence and, for each sentence, the lengths and the array typecodes of its
+columns followed by their values. Each column is stored with the smallest
+integer type holding its values, which keeps the cache about the size of the
+CoNLL text.
+
+Run this module to fill the cache for some files or directories (the
+FrameNet parses by default), and with --prune to remove the cache files of
+all the other CoNLL files:
+
+    PYTHONPATH=src python src/parsecache.py [--prune] [path ...]
+
+    Defines the class ParsedFile and the functions:
+    * content_hash
+    * cache_name
+    * cache_file
+    * narrow
+    * encode
+    * restamp
+    * load
+    * prune
+"""
+
+from array import array
+import argparse
+import hashlib
+import io
+import logging
+import mmap
+import os
+import pathlib
+import struct
+import sys
+import tempfile
+
+from conllreader import conll_blocks
+from conllsentence import ConllSentence, StringTable
+import options
+import paths
+
+# The byte order is part of the magic: arrays are written in native order
+MAGIC = b'KSRLPRS' + sys.byteorder[0].encode('ascii')
+VERSION = 4
+# The typecodes a column can be stored with, from the smallest
+TYPECODES = 'bhi'
+# magic, version, size, modification time and content hash of the CoNLL file,
+# number of sentences, number of strings, size of the strings
+HEADER = struct.Struct('<8sIQQ20sIIQ')
+
+
+def content_hash(content):
+    """Return the hash of the content of a CoNLL file"""
+    return hashlib.sha1(content).digest()
+
+
+def cache_name(filename):
+    """Return the name of the cache files of a CoNLL file: its name and a
+    hash of its absolute path, so that files of the same name do not share
+    their cache files"""
+    filename = pathlib.Path(filename)
+    path_hash = hashlib.sha1(
+        str(filename.resolve()).encode('utf-8')).hexdigest()
+    return '{}-{}'.format(filename.name, path_hash[:12])
+
+
+def cache_file(filename):
+    """Return the cache file of a CoNLL file"""
+    return paths.Paths.CACHE / 'parses' / (cache_name(filename) + '.parses')
+
+
+def narrow(column):
+    """Return the column in the smallest array type holding its values"""
+    low, high = (min(column), max(column)) if column else (0, 0)
+    for typecode in TYPECODES:
+        bits = 8 * array(typecode).itemsize - 1
+        if -(1 << bits) <= low and high < (1 << bits):
+            return column if typecode == column.typecode else array(
+                typecode, column)
+    return column
+
+
+def encode(sentences, strings, stat=None, digest=bytes(20)):
+    """Serialize the parsed sentences of a file
+
+    :param sentences: The sentences.
+    :type sentences: ConllSentence list.
+    :param strings: The table of the codes of all the sentences.
+    :type strings: StringTable.
+    :param stat: The state of the CoNLL file, see ParsedFile.
+    :type stat: os.stat_result.
+    :param digest: The hash of the content of the CoNLL file.
+    :type digest: bytes.
+    :returns: bytes -- the content of the cache file
+    """
+    text = '\n'.join(strings.strings).encode('utf-8')
+    offsets = array('q', [0])
+    body = []
+    for sentence in sentences:
+        columns = [narrow(getattr(sentence, name))
+                   for name in ConllSentence.array_columns]
+        stored = b''.join(
+            [array('i', [len(column) for column in columns]).tobytes(),
+             ''.join(column.typecode for column in columns).encode('ascii')] +
+            [column.tobytes() for column in columns])
+        body.append(stored)
+        offsets.append(offsets[-1] + len(stored))
+    return b''.join([
+        HEADER.pack(MAGIC, VERSION,
+                    stat.st_size if stat is not None else 0,
+                    stat.st_mtime_ns if stat is not None else 0,
+                    digest, len(sentences), len(strings), len(text)),
+        text, offsets.tobytes()] + body)
+
+
+def restamp(content, stat):
+    """Return the content of a cache file, with a new state of its CoNLL file
+
+    :param content: The content of the cache file, see encode.
+    :type content: bytes or mmap.mmap.
+    :param stat: The state of the CoNLL file, see ParsedFile.
+    :type stat: os.stat_result.
+    :returns: bytes -- the new content of the cache file
+    """
+    fields = list(HEADER.unpack_from(content))
+    fields[2:4] = stat.st_size, stat.st_mtime_ns
+    return HEADER.pack(*fields) + content[HEADER.size:]
+
+
+class ParsedFile:
+    """The cached sentences of a CoNLL file
+
+    :var size: int -- the size of the CoNLL file
+    :var mtime: int -- the modification time of the CoNLL file, in ns
+    :var digest: bytes -- the hash of the content of the CoNLL file
+    :var strings: str list -- the strings coded in the string columns
+    :var offsets: array -- sentence i is stored from body + offsets[i] to
+        body + offsets[i + 1]
+    """
+
+    def __init__(self, content):
+        """Read the header of a cache file
+
+        :param content: The content of the cache file, see encode.
+        :type content: bytes or mmap.mmap.
+        :raises: ValueError if this is not a cache file of this version
+        """
+        self.content = content
+        if len(content) < HEADER.size:
+            raise ValueError('truncated header')
+        magic, version = HEADER.unpack_from(content)[:2]
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('not a parse cache of version {}'.format(VERSION))
+        (self.size, self.mtime, self.digest,
+         sentences, strings, size) = HEADER.unpack_from(content)[2:]
+        start = HEADER.size
+        self.strings = (content[start:start + size].decode('utf-8')
+                        .split('\n') if strings else [])
+        start += size
+        self.offsets = array('q')
+        self.offsets.frombytes(
+            content[start:start + (sentences + 1) * self.offsets.itemsize])
+        self.body = start + len(self.offsets) * self.offsets.itemsize
+        if (len(self.strings) != strings or
+                len(self.offsets) != sentences + 1 or
+                self.body + self.offsets[-1] != len(content)):
+            raise ValueError('truncated content')
+
+    @classmethod
+    def open(cls, filename):
+        """Map a cache file"""
+        with open(str(filename), 'rb') as cache:
+            return cls(mmap.mmap(cache.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def remap(self, strings):
+        """Add the strings of the file to a table
+
+        :param strings: The table used by the sentences.
+        :type strings: StringTable.
+        :returns: array -- the code in strings of each code of the file, None
+            if they are the same
+        """
+        codes = array('i', map(strings.code, self.strings))
+        if codes == array('i', range(len(codes))):
+            return None
+        return codes
+
+    def sentence(self, sentence_id, strings, codes=None):
+        """Rebuild a sentence
+
+        :param sentence_id: The id of the sentence (starts at 0).
+        :type sentence_id: int.
+        :param strings: The table used by the sentence.
+        :type strings: StringTable.
+        :param codes: The result of remap(strings).
+        :type codes: array.
+        :returns: ConllSentence -- the sentence
+        """
+        if not 0 <= sentence_id < len(self):
+            raise KeyError(sentence_id)
+        stored = self.content[self.body + self.offsets[sentence_id]:
+                              self.body + self.offsets[sentence_id + 1]]
+        count = len(ConllSentence.array_columns)
+        lengths = array('i')
+        start = count * lengths.itemsize
+        lengths.frombytes(stored[:start])
+        typecodes = stored[start:start + count].decode('ascii')
+        start += count
+        columns = {}
+        for name, length, typecode in zip(ConllSentence.array_columns,
+                                          lengths, typecodes):
+            column = columns[name] = array(typecode)
+            end = start + length * column.itemsize
+            column.frombytes(stored[start:end])
+            start = end
+        if codes is not None:
+            for name in ConllSentence.string_columns:
+                columns[name] = array('i', [codes[code]
+                                            for code in columns[name]])
+        return ConllSentence.from_columns(columns, strings)
+
+    def sentences(self, strings):
+        """Yield every sentence in order
+
+        :param strings: The table used by the sentences.
+        :type strings: StringTable.
+        """
+        codes = self.remap(strings)
+        for sentence_id in range(len(self)):
+            yield self.sentence(sentence_id, strings, codes)
+
+    def close(self):
+        """Unmap the cache file"""
+        if isinstance(self.content, mmap.mmap):
+            self.content.close()
+
+
+def load(filename, content=None):
+    """Return the cached sentences of a CoNLL file, parsing it if needed
+
+    The content of the file is only read and hashed when its size or its
+    modification time are not the ones of the cache.
+
+    :param filename: The CoNLL file.
+    :type filename: str or pathlib.Path.
+    :param content: The content of the file, if it was already read.
+    :type content: bytes or mmap.mmap.
+    :returns: ParsedFile -- the sentences, None when the cache is disabled
+        (see options.Options.parse_cache) or for the standard input
+    """
+    logger = logging.getLogger(__name__)
+    logger.setLevel(options.Options.loglevel)
+
+    if not options.Options.parse_cache or str(filename) == '-':
+        return None
+    stat = os.stat(str(filename))
+    digest = None
+    cached = cache_file(filename)
+    try:
+        parsed = ParsedFile.open(cached)
+        if (parsed.size, parsed.mtime) == (stat.st_size, stat.st_mtime_ns):
+            logger.debug('load: {} loaded from {}'.format(filename, cached))
+            return parsed
+        if content is None:
+            with open(str(filename), 'rb') as conll_file:
+                content = conll_file.read()
+        digest = content_hash(content)
+        if parsed.digest == digest:
+            logger.debug('load: {} touched, loaded from {}'.format(
+                filename, cached))
+            # Not to hash the file again at the next runs
+            _store(cached, restamp(parsed.content, stat))
+            return parsed
+        parsed.close()
+        logger.info('load: {} changed, parsing it again'.format(filename))
+    except FileNotFoundError:
+        logger.debug('load: no cache for {} yet'.format(filename))
+    except (OSError, ValueError) as e:
+        logger.warning('load: ignoring unreadable {}: {}'.format(cached, e))
+
+    if content is None:
+        with open(str(filename), 'rb') as conll_file:
+            content = conll_file.read()
+    if digest is None:
+        digest = content_hash(content)
+    strings = StringTable()
+    text = io.StringIO(bytes(content).decode('utf-8'), newline=None)
+    sentences = [ConllSentence(lines, strings)
+                 for lines in conll_blocks(text)]
+    encoded = encode(sentences, strings, stat, digest)
+    _store(cached, encoded)
+    return ParsedFile(encoded)
+
+
+def _store(filename, encoded):
+    """Atomically write a cache file, concurrent readers never see half of
+    it"""
+    logger = logging.getLogger(__name__)
+    try:
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmpname = tempfile.mkstemp(dir=str(filename.parent),
+                                       prefix=filename.name)
+    except OSError as e:
+        logger.warning('load: cannot write {}: {}'.format(filename, e))
+        return
+    try:
+        with os.fdopen(fd, 'wb') as tmpfile:
+            tmpfile.write(encoded)
+        os.replace(tmpname, str(filename))
+    except OSError as e:
+        logger.warning('load: cannot write {}: {}'.format(filename, e))
+        os.unlink(tmpname)
+
+
+def prune(filenames):
+    """Remove the cache files of the CoNLL files not in filenames
+
+    The index files of conllstore, named like the cache files, are removed
+    as well.
+
+    :param filenames: The CoNLL files whose cache files are kept.
+    :type filenames: pathlib.Path iterable.
+    :returns: int -- the number of files removed
+    """
+    logger = logging.getLogger(__name__)
+    logger.setLevel(options.Options.loglevel)
+
+    kept = {cache_name(filename) for filename in filenames}
+    removed = 0
+    for directory, suffix in (('parses', '.parses'), ('indexes', '.idx')):
+        for cached in (paths.Paths.CACHE / directory).glob('*' + suffix):
+            if cached.name[:-len(suffix)] in kept:
+                continue
+            try:
+                cached.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning('prune: cannot remove {}: {}'.format(cached,
+                                                                     e))
+    return removed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Fill the cache of the parsed CoNLL files.')
+    parser.add_argument('paths', nargs='*', type=pathlib.Path,
+                        default=[paths.Paths.FRAMENET_PARSED,
+                                 paths.Paths.FRAMENET_LU_PARSED],
+                        help='CoNLL files, or directories of .conll files.')
+    parser.add_argument('--prune', action='store_true',
+                        help='Remove the cache files of the other CoNLL '
+                             'files.')
+    args = parser.parse_args()
+
+    files = [filename for path in args.paths
+             for filename in (sorted(path.glob('*.conll')) if path.is_dir()
+                              else [path])]
+    sentences = 0
+    for filename in files:
+        parsed = load(filename)
+        sentences += len(parsed)
+        parsed.close()
+    print('{} files, {} sentences in {}'.format(
+        len(files), sentences, paths.Paths.CACHE / 'parses'))
+    if args.prune:
+        print('{} files of other CoNLL files removed'.format(prune(files)))
@@ -14,6 +14,9 @@ class Paths:
 
     VNFN_MATCHING = ROOT / "vn-fn-roles.xml"
 
+    # Snapshots of the parsed resources, see lexiconcache
+    CACHE = ROOT / "cache/"
+
     # Domain
     DICO_XML = 'domain/contextes_olst/dico{domain}_{lang}.xml'
     DICO_XMLNS = {
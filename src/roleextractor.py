@@ -25,7 +25,9 @@ def fill_gold_roles(frame_instances,
                     annotation_file,
                     parsed_conll_file,
                     verbnet_classes,
-                    role_matcher):
+                    role_matcher,
+                    documents=None,
+                    language=None):
     """Fill the roles of some frame instance arguments, when possible.
 
     Note: frame_instances must be sorted by sentence order.
@@ -36,6 +38,12 @@ def fill_gold_roles(frame_instances,
     :param verbnet_classes: The VerbNet lexicon, used to determine which frames
     from the corpus we should have extracted.
     :type verbnet_classes: Str Dict.
+    :param documents: The files of parsed_conll_file already parsed for
+        frame_instances, so that they are not parsed again.
+    :type documents: conllstore.ConllStore List.
+    :param language: The language of the annotations, options.Options.language
+        if None.
+    :type language: str.
     """
 
     logger = logging.getLogger(__name__)
@@ -47,12 +55,14 @@ def fill_gold_roles(frame_instances,
         frames[frame.filename.stem][frame.sentence_id].append(frame)
 
     fn_reader = FNAllReader(
-        add_non_core_args=False, keep_unannotated=True)
+        add_non_core_args=False, keep_unannotated=True, language=language)
     previous_id = -1
     sentence_frames = []
     good_frames = 0
     for k in range(len(annotation_file)):  # we are looping through all the files
-        for frame in fn_reader.iter_frames(annotation_file[k], parsed_conll_file[k]):
+        document = documents[k] if documents is not None else None
+        for frame in fn_reader.iter_frames(annotation_file[k],
+                                           parsed_conll_file[k], document):
             logger.debug('fill_gold_roles on frame {} with args {}'.format(frame, frame.args))
             for arg in frame.args:
                 if not arg.instanciated:
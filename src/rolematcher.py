@@ -102,6 +102,12 @@ class VnFnRoleMatcher():
                     fn_role, vn_role,
                     fn_frame, vn_class)
         self._build_frames_vnclasses_mapping()
+
+        if self.frameNet.frames:
+            for fn_frame in sorted(set(self.framenetframe_to_verbnetclasses)
+                                   - set(self.frameNet.frames)):
+                self.logger.warning(f"Frame {fn_frame} not present in "
+                                    f"FrameNet")
         # self.logger.debug(f'VnFnRoleMatcher verbnetclass_to_framenetframes: '
         #                   f'{self.verbnetclass_to_framenetframes}')
 
@@ -303,22 +309,17 @@ class VnFnRoleMatcher():
         return result
 
     def filter_frame_names(self, framenames, predicate):
+        """Keep the frames that have predicate as a verbal lexical unit, or
+        all of them if none has.
+
+        :param framenames: The candidate FrameNet frames.
+        :type framenames: str iterable.
+        :param predicate: The lemma of the verb.
+        :type predicate: str.
+        """
         self.logger.debug("filter_frame_names filtering predicate {} from frames {}".format(predicate, framenames))
-        result = set()
-        #print("frameNet frames: {}".format(self.frameNet.frames))
-        for framename in framenames:
-            if framename in self.frameNet.frames:
-                self.logger.debug(
-                    f"filter_frame_names frame {framename} lexical units: "
-                    f"{self.frameNet.frames[framename].lexicalUnits}")
-                if (f"{predicate}.v"
-                        in self.frameNet.frames[framename].lexicalUnits):
-                    result.add(framename)
-                else:
-                    self.logger.debug(f"filter_frame_names filtering out "
-                                    f"{framename} for predicate {predicate}")
-            else:
-                self.logger.warn(f"Frame {framename} not present in FrameNet")
+        result = self.frameNet.frames_with_verb(predicate).intersection(
+            framenames)
         if (result):
             return result
         else:
@@ -5,21 +5,23 @@ import argguesser
 import dumper
 import errorslog
 import framematcher
-import framenet
+import headwordextractor
+import io
+import lexicons
 import logging
 import options
+import os
 import paths
 import probabilitymodel
 import roleextractor
-import rolematcher
 import stats
 import sys
 import tempfile
-import verbnetreader
 
 from bootstrap import bootstrap_algorithm
 from collections import Counter
 from conllreader import ConllSemanticAppender
+from conllstore import ConllStore
 from errorslog import *
 from framenetallreader import FNAllReader
 from options import FrameLexicon
@@ -29,10 +31,12 @@ from verbnetrestrictions import NoHashDefaultDict
 
 
 class SemanticRoleLabeler:
-    def __init__(self, language: str):
+    def __init__(self, language: str, languages=()):
         """ Initialize the semantic role labeller
 
-        :var language: string -- the language of input text
+        :var language: string -- the default language of input texts
+        :var languages: string iterable -- other languages to load now, any
+                        other one is loaded by the first annotate call using it
 
         Return the same string than conllinput but with new colums
         corresponding to the frames and roles found
@@ -48,30 +52,33 @@ class SemanticRoleLabeler:
         if language:
             options.Options.language = language
 
-        """ Load resources """
-        self.frameNet = framenet.FrameNet()
-        self.role_matcher = None
-        if options.Options.framelexicon == FrameLexicon.FrameNet:
-            self.logger.info("Loading FrameNet...")
-            framenet.FrameNetReader(
-                paths.Paths.framenet_path(language),
-                self.frameNet)
-            # self.logger.info(f"SemanticRoleLabeler framenet frames: "
-            #                  f"{self.frameNet.frames}")
-        # elif options.Options.framelexicon == FrameLexicon.VerbNet:
-        self.logger.info("Loading VN-FN role matcher...")
-        self.role_matcher = rolematcher.VnFnRoleMatcher(paths.Paths.
-                                                        VNFN_MATCHING,
-                                                        self.frameNet)
-        # Load VerbNet
-        self.logger.info("Loading VerbNet...")
-        (self.frames_for_verb,
-         self.verbnet_classes) = verbnetreader.init_verbnet(
-            paths.Paths.verbnet_path(language))
+        """ Load resources, shared with any other labeller of the process """
+        self.language = options.Options.language
+        # language -> lexicons.Lexicons
+        self.lexicons = {}
+        for other_language in languages:
+            self.lexicons_for(other_language)
+        default_lexicons = self.lexicons_for(self.language)
+        self.role_matcher = default_lexicons.role_matcher
+        # Empty unless FrameNet is the output lexicon
+        self.frameNet = self.role_matcher.frameNet
+        self.frames_for_verb = default_lexicons.frames_for_verb
+        self.verbnet_classes = default_lexicons.verbnet_classes
         self.logger.debug("SemanticRoleLabeler::init DONE")
 
-    def get_frames(self, corpus, verbnet_classes, frameNet,
-                   conll_input: str, argid=False):
+    def lexicons_for(self, language=None):
+        """ The resources of language, the default one if None
+
+        They are loaded only once by process, whatever the number of labellers
+        and documents.
+        """
+        language = language or self.language
+        if language not in self.lexicons:
+            self.lexicons[language] = lexicons.for_language(language)
+        return self.lexicons[language]
+
+    def get_frames(self, corpus, verbnet_classes, role_matcher,
+                   conll_input: str, argid=False, language=None):
         """
         Fills two list of the same size with content dependent of the kind of
         input
@@ -99,12 +106,6 @@ class SemanticRoleLabeler:
         else:
             raise Exception('Unknown corpus {}'.format(corpus))
 
-        # if corpus == 'FrameNet':
-        logger.info(f"Loading FrameNet and VerbNet role mappings "
-                    f"{paths.Paths.VNFN_MATCHING} ...")
-        role_matcher = rolematcher.VnFnRoleMatcher(paths.Paths.VNFN_MATCHING,
-                                                   frameNet)
-
         for annotation_file, parsed_conll_file in zip(annotation_list,
                                                       parsed_conll_list):
             logger.debug(f"Handling {annotation_file} {parsed_conll_file}")
@@ -120,15 +121,22 @@ class SemanticRoleLabeler:
                 #
                 arg_guesser = argguesser.ArgGuesser(verbnet_classes)
 
-                # Many instances are not actually FrameNet frames
-                new_frame_instances = list(
-                    arg_guesser.frame_instances_from_file(
-                        parsed_conll_file
-                        )
-                    )
-                new_annotated_frames = roleextractor.fill_gold_roles(
-                    frame_instances=new_frame_instances, annotation_file=[annotation_file], parsed_conll_file=[parsed_conll_file],
-                    verbnet_classes=verbnet_classes, role_matcher=role_matcher)
+                # The file is parsed once, for both the argument
+                # identification and the gold annotations
+                with ConllStore(parsed_conll_file,
+                                cache_size=None) as document:
+                    # Many instances are not actually FrameNet frames
+                    new_frame_instances = list(
+                        arg_guesser.frame_instances_from_file(
+                            parsed_conll_file, document))
+                    new_annotated_frames = roleextractor.fill_gold_roles(
+                        frame_instances=new_frame_instances, annotation_file=[annotation_file], parsed_conll_file=[parsed_conll_file],
+                        verbnet_classes=verbnet_classes, role_matcher=role_matcher,
+                        documents=[document], language=language)
+                stats.stats_data["sentences"] += len(document)
+                stats.stats_data["parsed_sentences"] += document.parsed
+                logger.debug(f'parsed {document.parsed} sentences of '
+                             f'{len(document)}')
                 logger.debug(f'got nb new_annotated_frames: '
                              f'{len(new_annotated_frames)}')
 
@@ -143,7 +151,8 @@ class SemanticRoleLabeler:
                 # Load gold arguments
                 #
                 fn_reader = FNAllReader(
-                    add_non_core_args=options.Options.add_non_core_args)
+                    add_non_core_args=options.Options.add_non_core_args,
+                    language=language)
 
                 for framenet_instance in fn_reader.iter_frames(
                         annotation_file, parsed_conll_file):
@@ -158,17 +167,24 @@ class SemanticRoleLabeler:
         #     logger.info(f"get_frames: nothing to do for corpus "
         #                 f"{corpus}")
 
-    def annotate(self, conllinput: str) -> None:
+    def annotate(self, conllinput: str, language: str = None) -> None:
         """ Run the semantic role labelling
 
         :var conllinput: string -- text to annotate formated in the CoNLL
                                    format. If empty, annotate the corpus
+        :var language: string -- the language of the text, the default one of
+                                 the labeller if None
 
         Return the same string than conllinput but with new colums
         corresponding to the frames and roles found
         """
         self.logger.info(f"SemanticRoleLabeler.annotate: {conllinput}")
-        model = probabilitymodel.ProbabilityModel(self.verbnet_classes, 0)
+        lexicon = self.lexicons_for(language)
+        frames_for_verb = lexicon.frames_for_verb
+        candidate_frames = lexicon.candidate_frames
+        verbnet_classes = lexicon.verbnet_classes
+        role_matcher = lexicon.role_matcher
+        model = probabilitymodel.ProbabilityModel(verbnet_classes, 0)
 
         # tmpfile = None
         # if conllinput is not None:
@@ -192,10 +208,11 @@ class SemanticRoleLabeler:
         # vn_frames: list of VerbnetFrameOccurrence
         for annotated_frames, vn_frames in self.get_frames(
                 options.Options.corpus,
-                self.verbnet_classes,
-                self.frameNet,
+                verbnet_classes,
+                role_matcher,
                 conllinput,
-                options.Options.argument_identification):
+                options.Options.argument_identification,
+                lexicon.language):
             self.logger.debug('annotate: handling a pair annotated_frames, '
                               'vn_frames of size {}'.format(len(vn_frames)))
             all_matcher = []
@@ -210,11 +227,11 @@ class SemanticRoleLabeler:
             for gold_frame, frame_occurrence in zip(annotated_frames,
                                                     vn_frames):
                 self.logger.debug("GOLD_FRAME:{gold_frame}")
-                if gold_frame.predicate.lemma not in self.frames_for_verb:
+                if gold_frame.predicate.lemma not in frames_for_verb:
                     errorslog.log_vn_missing(gold_frame)
                     self.logger.debug('gold_frame predicate lemma "{}" not in '
                                       '{}'.format(gold_frame.predicate.lemma,
-                                                  self.frames_for_verb))
+                                                  frames_for_verb))
                     continue
 
                 stats.stats_data["frames_with_predicate_in_verbnet"] += 1
@@ -251,13 +268,11 @@ class SemanticRoleLabeler:
                 frame_occurrence.matcher = matcher
                 all_matcher.append(matcher)
 
-                frames_to_be_matched = []
-                for verbnet_frame in sorted(self.frames_for_verb[predicate]):
-                    if options.Options.passivize and gold_frame.passive:
-                        for passivized_frame in verbnet_frame.passivize():
-                            frames_to_be_matched.append(passivized_frame)
-                    else:
-                        frames_to_be_matched.append(verbnet_frame)
+                candidates = candidate_frames[predicate]
+                if options.Options.passivize and gold_frame.passive:
+                    frames_to_be_matched = candidates.passive
+                else:
+                    frames_to_be_matched = candidates.active
 
                 self.logger.debug(f'there is {len(frames_to_be_matched)} '
                                   f'frames to be matched')
@@ -291,7 +306,7 @@ class SemanticRoleLabeler:
                         and set() in frame_occurrence.roles):
                     log_debug_data(gold_frame, frame_occurrence, matcher,
                                    frame_occurrence.roles,
-                                   self.verbnet_classes)
+                                   verbnet_classes)
 
             if options.Options.semrestr:
                 for matcher in all_matcher:
@@ -307,7 +322,7 @@ class SemanticRoleLabeler:
         if options.Options.bootstrap:
             self.logger.info("Applying bootstrap...")
             bootstrap_algorithm(all_vn_frames, model,
-                                self.verbnet_classes)
+                                verbnet_classes)
         elif options.Options.probability_model is not None:
             self.logger.info("Applying probability model...")
             for frame_occurrence in all_vn_frames:
@@ -334,44 +349,57 @@ class SemanticRoleLabeler:
         count_annotations=0
         if conllinput is not None:
             self.logger.info("\n## Dumping semantic CoNLL...")
-            semantic_appender = ConllSemanticAppender(conllinput)
-            # vn_frame: VerbnetFrameOccurrence
-            self.logger.debug("VERBNETFRAME_LETSCHECK : {all_vn_frames}")
-            for vn_frame in all_vn_frames:
-                if vn_frame.best_classes():
-                    if options.Options.framelexicon == FrameLexicon.VerbNet:
-                        semantic_appender.add_verbnet_frame_annotation(vn_frame)  # noqa
-                        count_annotations+=1
-                    elif options.Options.framelexicon == FrameLexicon.FrameNet:
-                        semantic_appender.add_framenet_frame_annotation(
-                            self.role_matcher.possible_framenet_mappings(vn_frame))  # noqa
-                        count_annotations+=1
-                    else:
-                        self.logger.error(
-                            f"Error: unknown frame lexicon for output "
-                            f"{options.Options.framelexicon}")
-            if options.Options.conll_output is None:
-                self.logger.debug(f'\nannotate: result '
-                                  f'{str(semantic_appender)}')
-                if options.Options.loglevel == logging.DEBUG:
+            if options.Options.conll_output is not None:
+                semantic_file = open(options.Options.conll_output, 'w')
+            elif options.Options.loglevel == logging.DEBUG:
+                semantic_file = io.StringIO()
+            else:
+                # Nothing to show, the annotations are only counted
+                semantic_file = open(os.devnull, 'w')
+            with semantic_file:
+                semantic_appender = ConllSemanticAppender(conllinput,
+                                                          semantic_file)
+                # vn_frame: VerbnetFrameOccurrence
+                self.logger.debug("VERBNETFRAME_LETSCHECK : {all_vn_frames}")
+                # Each sentence is written once the frames are past it
+                for vn_frame in sorted(all_vn_frames,
+                                       key=lambda frame: frame.sentence_id):
+                    if vn_frame.best_classes():
+                        if options.Options.framelexicon == FrameLexicon.VerbNet:
+                            semantic_appender.add_verbnet_frame_annotation(vn_frame)  # noqa
+                            count_annotations+=1
+                        elif options.Options.framelexicon == FrameLexicon.FrameNet:
+                            semantic_appender.add_framenet_frame_annotation(
+                                role_matcher.possible_framenet_mappings(vn_frame))  # noqa
+                            count_annotations+=1
+                        else:
+                            self.logger.error(
+                                f"Error: unknown frame lexicon for output "
+                                f"{options.Options.framelexicon}")
+                semantic_appender.close()
+                if (options.Options.conll_output is None
+                        and options.Options.loglevel == logging.DEBUG):
+                    result = semantic_file.getvalue()
+                    self.logger.debug(f'\nannotate: result {result}')
                     display_debug()
                     display_errors_num()
                     display_error_details()
                     display_mapping_errors()
-                self.logger.debug(str(semantic_appender))
-            else:
-                semantic_appender.dump_semantic_file(options.Options.
-                                                     conll_output)
+                    self.logger.debug(result)
 
         else:
             self.logger.info("\n## Evaluation")
             stats.stats_quality(
                 all_annotated_frames, all_vn_frames,
-                self.frames_for_verb, self.verbnet_classes,
-                options.Options.argument_identification, self.frameNet)
+                frames_for_verb, verbnet_classes,
+                options.Options.argument_identification, role_matcher)
             stats.display_stats(options.Options.argument_identification)
 
             if options.Options.dump:
                 dumper.dump(options.Options.dump_file,
                             stats.annotated_frames_stats)
         self.logger.info(f"Nb annotations: {count_annotations}")
+        self.logger.debug(
+            f"Headwords found by the span of their argument: "
+            f"{headwordextractor.lookups['span']}, by the closest match: "
+            f"{headwordextractor.lookups['closest match']}")
@@ -3,7 +3,6 @@
 
 from collections import Counter
 
-import paths
 import rolematcher
 
 
@@ -11,6 +10,12 @@ import rolematcher
 stats_data = {
     # Total number of files in the corpus
     "files": 0,
+    # Number of sentences in the parsed files read with argument
+    # identification
+    "sentences": 0,
+    # Number of times these sentences were parsed, the same as "sentences"
+    # as long as each file is parsed once
+    "parsed_sentences": 0,
     # Number of annotated verbal frame instances in the corpus
     "frames": 0,
     # Number of annotated verbal frame instances which have a predicate in VerbNet
@@ -272,8 +277,7 @@ def vnclass_to_normalized_name(vnclass):
     raise Exception('Impossible VerbNet class {}'.format(vnclass))
 
 
-def stats_quality(annotated_frames, vn_frames, frames_for_verb, verbnet_classes, argument_identification, frame_net):
-    role_matcher = rolematcher.VnFnRoleMatcher(paths.Paths.VNFN_MATCHING, frame_net)
+def stats_quality(annotated_frames, vn_frames, frames_for_verb, verbnet_classes, argument_identification, role_matcher):
     # This variable is not handled here for non-gold args, because
     # annotated_frame contains only extracted frames at this point and
     # args_annotated_mapping_ok is related to gold annotated frames
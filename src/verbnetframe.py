@@ -10,6 +10,7 @@
 """
 
 import logging
+import sys
 logger = logging.getLogger(__name__)
 
 from abc import ABCMeta
@@ -21,6 +22,8 @@ import verbnetprepclasses
 
 
 class ComputeSlotTypeMixin(metaclass=ABCMeta):
+    __slots__ = ()
+
     slot_types = {
         "subject": "SBJ", "object": "OBJ",
         "indirect_object": "OBJI", "prep_object": "PPOBJ"
@@ -53,7 +56,7 @@ class ComputeSlotTypeMixin(metaclass=ABCMeta):
                     slot_preps.append(None)
                     if next_expected == ComputeSlotTypeMixin.slot_types["object"]:  # noqa
                         next_expected = ComputeSlotTypeMixin.slot_types["indirect_object"]  # noqa
-            elif (isinstance(element, set)
+            elif (isinstance(element, (set, frozenset))
                   or element in verbnetprepclasses.all_preps):
                 preposition = element
 
@@ -69,7 +72,7 @@ class ComputeSlotTypeMixin(metaclass=ABCMeta):
         """
         if 'role' in part:
             return True
-        elif type(part['elem']) == set:
+        elif isinstance(part['elem'], (set, frozenset)):
             return False
         else:
             return part['elem'].isupper() and part['elem'] != "V"
@@ -207,12 +210,7 @@ class VerbnetFrameOccurrence(ComputeSlotTypeMixin):
                 if slot2 is None:
                     continue
 
-                # We want this to fail when roles get stored in a dictionary
-                # or a class
-                assert all([type(s) == dict for s in match['vnframe'].syntax])
-
-                role = [part['role'] for part in match['vnframe'].syntax if 'role' in part][slot2]  # noqa
-                result[slot1].add(role)
+                result[slot1].add(match['vnframe'].roles()[slot2])
 
         return result
 
@@ -399,40 +397,126 @@ class VerbnetFrameOccurrence(ComputeSlotTypeMixin):
 class VerbnetOfficialFrame(ComputeSlotTypeMixin):
     """A representation of a frame syntactic syntax
 
-    :var syntax : (str + role tuple | str + None tuple
-                    | str set + None tuple) list -- structure + roles
+    Frames are immutable: each part of the syntax is stored as an
+    (element, role, restriction) tuple, the element being an interned str or
+    frozenset of str, and the values needed by frame matching are computed
+    once at construction.
+
+    :var vnclass: str -- the class number, eg. 9.10
+    :var parts: (str | str frozenset, str | None, VNRestriction | None) tuple
+        -- structure + roles + restrictions
+    :var elements: (str | str frozenset) tuple -- the structure alone
     :var num_slots: int -- number of argument slots in :structure
+    :var num_slots_before_v: int -- number of argument slots before the verb
+    :var index_v: int -- position of the verb in the structure, or None
     :var slot_types:
     :var slot_preps:
-    :var vnclass: str -- the class number, eg. 9.10
     #:var example: str -- An example sentence that illustrates the frame
+
+    The variants of the frame used by frame matching, see without_that and
+    passivized, are only computed once, and stored with the frame.
     """
 
-    def __init__(self, vnclass, syntax):
-        self.syntax = syntax
-        self.num_slots = len([part for part in syntax if 'role' in part])
+    __slots__ = ('vnclass', 'parts', 'elements', 'num_slots',
+                 'num_slots_before_v', 'index_v', 'slot_types', 'slot_preps',
+                 '_roles', '_selrestrs', '_without_that', '_passivized')
 
-        self.slot_types, self.slot_preps = self.compute_slot_types(syntax)
-        self.vnclass = vnclass
+    def __init__(self, vnclass, syntax):
+        """
+        :param vnclass: The VerbNet class of the frame.
+        :type vnclass: str.
+        :param syntax: The structure of the frame, a dict for each part with
+            its 'elem' and, for slots, its 'role' and 'restr'.
+        :type syntax: dict list.
+        """
+        self._init(vnclass, tuple(
+            (part['elem'], part.get('role'), part.get('restr'))
+            for part in syntax))
+
+    @classmethod
+    def from_parts(cls, vnclass, parts):
+        """Build a frame from the parts of other frames
+
+        :param vnclass: The VerbNet class of the frame.
+        :type vnclass: str.
+        :param parts: The (element, role, restriction) parts.
+        :type parts: tuple iterable.
+        """
+        frame = cls.__new__(cls)
+        frame._init(vnclass, tuple(parts))
+        return frame
+
+    def _init(self, vnclass, parts):
+        parts = tuple((_intern_element(elem),
+                       None if role is None else sys.intern(role), restr)
+                      for elem, role, restr in parts)
+        elements = tuple(elem for elem, role, restr in parts)
+        num_slots_before_v = 0
+        for elem, role, restr in parts:
+            if role is not None:
+                num_slots_before_v += 1
+            elif elem == 'V':
+                break
+        slot_types, slot_preps = self.compute_slot_types(
+            [{'elem': elem} if role is None else {'elem': elem, 'role': role}
+             for elem, role, restr in parts])
+
+        set_slot = object.__setattr__
+        set_slot(self, 'vnclass', vnclass)
+        set_slot(self, 'parts', parts)
+        set_slot(self, 'elements', elements)
+        set_slot(self, 'index_v',
+                 elements.index('V') if 'V' in elements else None)
+        set_slot(self, 'num_slots_before_v', num_slots_before_v)
+        set_slot(self, '_roles', tuple(
+            role for elem, role, restr in parts if role is not None))
+        set_slot(self, '_selrestrs', tuple(
+            restr for elem, role, restr in parts if role is not None))
+        set_slot(self, 'num_slots', len(self._roles))
+        set_slot(self, 'slot_types', tuple(slot_types))
+        set_slot(self, 'slot_preps', tuple(slot_preps))
+        set_slot(self, '_without_that', None)
+        set_slot(self, '_passivized', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('VerbnetOfficialFrame is immutable')
+
+    def __reduce__(self):
+        return (VerbnetOfficialFrame.from_parts, (self.vnclass, self.parts),
+                (self._without_that, self._passivized))
+
+    def __setstate__(self, state):
+        object.__setattr__(self, '_without_that', state[0])
+        object.__setattr__(self, '_passivized', state[1])
 
     def __eq__(self, other):
         return (isinstance(other, self.__class__) and
-                self.syntax == other.syntax and
+                self.parts == other.parts and
                 self.vnclass == other.vnclass)
 
+    def __hash__(self):
+        # Restrictions are not hashable
+        return hash((self.vnclass, self.elements, self._roles))
+
+    @property
+    def syntax(self):
+        """The parts of the frame as dicts, as given to the constructor"""
+        return [{'elem': elem} if role is None else
+                {'elem': elem, 'role': role, 'restr': restr}
+                for elem, role, restr in self.parts]
+
     def syntax_no_set(self):
-        for part in self.syntax:
-            elem = part['elem']
-            if 'role' in part:
-                yield (f"{part['elem']}.{part['role']} "
-                       f"[{part['restr'] if 'restr' in part else ''}]")
-            elif type(elem) == set:
+        for elem, role, restr in self.parts:
+            if role is not None:
+                yield (f"{elem}.{role} "
+                       f"[{restr if restr is not None else ''}]")
+            elif isinstance(elem, frozenset):
                 yield '-'.join(elem)
             else:
                 yield elem
 
     def __key__(self):
-        return (self.vnclass, len(self.syntax), tuple(self.syntax_no_set()))
+        return (self.vnclass, len(self.parts), tuple(self.syntax_no_set()))
 
     def __lt__(self, other):
         return self.__key__() < other.__key__()
@@ -442,73 +526,130 @@ class VerbnetOfficialFrame(ComputeSlotTypeMixin):
             self.vnclass, ' '.join(self.syntax_no_set()))
 
     def has(self, word):
-        return any([True for part in self.syntax if word in part['elem']])
+        return any(word in elem for elem in self.elements)
 
     def roles(self):
-        return [part['role'] for part in self.syntax if 'role' in part]
+        return self._roles
 
     def selrestrs(self):
-        return [part['restr'] for part in self.syntax if 'role' in part]
+        return self._selrestrs
+
+    def without(self, word):
+        """Return the same frame without the elements equal to word"""
+        return VerbnetOfficialFrame.from_parts(
+            self.vnclass,
+            (part for part in self.parts if part[0] != word))
+
+    def without_that(self):
+        """The frame to match against occurrences without 'that': 'that' is
+        optional in english, eg. Tell him that S --> Tell him S
+
+        :returns: VerbnetOfficialFrame -- the frame itself if it has no 'that'
+        """
+        if self._without_that is None:
+            object.__setattr__(
+                self, '_without_that',
+                self.without('that') if self.has('that') else self)
+        return self._without_that
 
-    def remove(self, word):
-        self.syntax = [part for part in self.syntax if part['elem'] != word]
+    def passivized(self):
+        """The passivizations of the frame, see passivize
+
+        :returns: VerbnetOfficialFrame tuple
+        """
+        if self._passivized is None:
+            object.__setattr__(self, '_passivized', tuple(self.passivize()))
+        return self._passivized
+
+    def precompute_variants(self):
+        """Compute all the variants that frame matching can ask for"""
+        self.without_that()
+        # passivize fails without verb
+        if self.index_v is not None:
+            for passivized_frame in self.passivized():
+                passivized_frame.without_that()
+
+    @staticmethod
+    def _is_a_slot_part(part):
+        elem, role, restr = part
+        if role is not None:
+            return True
+        elif isinstance(elem, frozenset):
+            return False
+        else:
+            return elem.isupper() and elem != "V"
 
     def passivize(self):
         """
         Based on current frame, return a list of possible passivizations
         """
         passivizedframes = []
+        parts = self.parts
 
         # Find the position of the first slot following the verb and
         # the last element of the first slot of the frame
         slot_position = 0
         old_sbj_end = 0
         first_slot = True
-        for i, part in enumerate(self.syntax):
-            if part['elem'] == "V":
+        for i, part in enumerate(parts):
+            if part[0] == "V":
                 break
 
             if first_slot:
                 old_sbj_end = i
 
-            if VerbnetOfficialFrame._is_a_slot(part):
+            if VerbnetOfficialFrame._is_a_slot_part(part):
                 first_slot = False
                 slot_position += 1
 
         # Find the first and last element of the first slot following the verb
-        index_v = self.syntax.index({'elem': 'V'})
+        index_v = self.index_v
+        if index_v is None:
+            raise ValueError('No verb in {}'.format(self))
         new_sbj_begin, new_sbj_end = index_v + 1, index_v + 1
         while True:
-            if new_sbj_end >= len(self.syntax):
+            if new_sbj_end >= len(parts):
                 return []
 
-            if VerbnetOfficialFrame._is_a_slot(self.syntax[new_sbj_end]):
+            if VerbnetOfficialFrame._is_a_slot_part(parts[new_sbj_end]):
                 break
             new_sbj_end += 1
 
         # Build the passive frame without "by"
-        frame_without_agent = VerbnetOfficialFrame(
+        frame_without_agent = VerbnetOfficialFrame.from_parts(
             self.vnclass,
-            (self.syntax[new_sbj_begin:new_sbj_end+1] +
-             self.syntax[old_sbj_end+1:index_v] + [{'elem': "V"}] +
-             self.syntax[new_sbj_end+1:]))
+            (parts[new_sbj_begin:new_sbj_end+1] +
+             parts[old_sbj_end+1:index_v] + (("V", None, None),) +
+             parts[new_sbj_end+1:]))
 
         passivizedframes.append(frame_without_agent)
 
         # Add the frames obtained by inserting "by + the old subject"
         # after the verb and every slot that follows it
-        new_index_v = frame_without_agent.syntax.index({'elem': 'V'})
-        i = new_index_v
+        passive_parts = frame_without_agent.parts
+        i = frame_without_agent.index_v
         slot = slot_position - 1
-        while i < len(frame_without_agent.syntax):
-            part = frame_without_agent.syntax[i]
-            if self._is_a_slot(part) or part['elem'] == "V":
-                passivizedframes.append(VerbnetOfficialFrame(
+        while i < len(passive_parts):
+            part = passive_parts[i]
+            if self._is_a_slot_part(part) or part[0] == "V":
+                passivizedframes.append(VerbnetOfficialFrame.from_parts(
                     self.vnclass,
-                    (frame_without_agent.syntax[0:i+1] +
-                     [{'elem': 'by'}] + self.syntax[0:old_sbj_end+1] +
-                     frame_without_agent.syntax[i+1:])))
+                    (passive_parts[0:i+1] +
+                     (("by", None, None),) + parts[0:old_sbj_end+1] +
+                     passive_parts[i+1:])))
                 slot += 1
             i += 1
 
         return passivizedframes
+
+
+# Prepositions sets shared by all the frames, see _intern_element
+_interned_sets = {}
+
+
+def _intern_element(elem):
+    """Return a shared copy of a syntax element, a str or set of str"""
+    if isinstance(elem, str):
+        return sys.intern(elem)
+    elem = frozenset(elem)
+    return _interned_sets.setdefault(elem, elem)
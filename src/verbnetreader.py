@@ -3,11 +3,14 @@
 
 """Read VerbNet and build a list of allowed VerbNet frame for each verb"""
 
+import collections
 import xml.etree.ElementTree as ET
 
 from errorslog import errors
 from verbnetframe import VerbnetOfficialFrame
 from verbnetrestrictions import VNRestriction
+import lexiconcache
+import parallelloader
 import verbnetprepclasses
 
 import options
@@ -15,6 +18,17 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(options.Options.loglevel)
 
+# Increase each time the content of the snapshot or the classes it pickles
+# (VerbnetOfficialFrame, VNRestriction) change
+SNAPSHOT_VERSION = 5
+
+# The VerbNet frames of a verb for frame matching, see candidate_frames:
+# * active: VerbnetOfficialFrame tuple -- the frames, sorted and deduplicated
+# * passive: VerbnetOfficialFrame tuple -- their passivizations, in the same
+#   order
+CandidateFrames = collections.namedtuple('CandidateFrames',
+                                         ['active', 'passive'])
+
 
 class VerbnetReader:
 
@@ -23,15 +37,30 @@ class VerbnetReader:
     :var verbs: Dictionary of VerbnetOfficialFrame lists representing VerbNet.
     """
 
-    def __init__(self, path):
+    def __init__(self, path, jobs=1):
         """Read VerbNet and fill verbs with its content.
 
         :param path: Path to VerbNet.
         :type path: pathlib.Path.
+        :param jobs: Number of processes parsing the files, see
+            parallelloader.num_jobs.
+        :type jobs: int.
         """
+        self._clear()
+        self.logger.debug(f'VerbnetReader({path})')
+
+        if not list(path.glob('*-[0-9]*.xml')):
+            raise Exception('VerbNet not found in {}! Did you clone with submodules?'.format(path))
+
+        for partial_reader in parallelloader.map_files(
+                _read_class_file, path.glob('*.xml'), jobs):
+            self._merge(partial_reader)
+        self.logger.debug(f'VerbnetReader({path}): {len(self.frames_for_verb)}'
+                          f', {len(self.classes)}')
+
+    def _clear(self):
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(options.Options.loglevel)
-        self.logger.debug(f'VerbnetReader({path})')
 
         self.frames_for_verb = {}
         self.classes = {}
@@ -42,15 +71,29 @@ class VerbnetReader:
         self.filename = ""
         self.unhandled = []
 
-        if not list(path.glob('*-[0-9]*.xml')):
-            raise Exception('VerbNet not found in {}! Did you clone with submodules?'.format(path))
+    def _read_file(self, filename):
+        """Parse one VerbNet file, containing one class and its subclasses.
 
-        for filename in path.glob('*.xml'):
-            root = ET.ElementTree(file=str(filename.resolve()))
-            self.filename = str(filename)
-            self._handle_class(root.getroot(), [], [], [])
-        self.logger.debug(f'VerbnetReader({path}): {len(self.frames_for_verb)}'
-                          f', {len(self.classes)}')
+        :param filename: The file to parse.
+        :type filename: pathlib.Path.
+        """
+        root = ET.ElementTree(file=str(filename.resolve()))
+        self.filename = str(filename)
+        self._handle_class(root.getroot(), [], [], [])
+
+    def _merge(self, other):
+        """Add the content read by another reader, after the current one.
+
+        :param other: The reader of the next files.
+        :type other: VerbnetReader.
+        """
+        for verb, frames in other.frames_for_verb.items():
+            self.frames_for_verb.setdefault(verb, []).extend(frames)
+        for verb, vnclasses in other.classes.items():
+            self.classes.setdefault(verb, []).extend(vnclasses)
+        self.roles.update(other.roles)
+        self.cnames.update(other.cnames)
+        self.unhandled.extend(other.unhandled)
 
     def _handle_class(self, xml_class, parent_frames, role_list, restrictions):
         """Parse one class of verbs and all its subclasses.
@@ -162,6 +205,8 @@ class VerbnetReader:
 
         syntax = self._merge_syntax(structure, roles, role_restr)
         result = VerbnetOfficialFrame(vnclass, syntax)
+        # Once and for all, rather than for each occurrence
+        result.precompute_variants()
 
         return result
 
@@ -422,10 +467,92 @@ class VerbnetReader:
         return " ".join(pred_strings)
 
 
-def init_verbnet(path):
+def _read_class_file(filename):
+    """Parse one VerbNet file, in a worker process of parallelloader
+
+    :param filename: The file to parse.
+    :type filename: pathlib.Path.
+    :returns: VerbnetReader -- a reader holding the content of this file only
+    """
+    reader = VerbnetReader.__new__(VerbnetReader)
+    reader._clear()
+    reader._read_file(filename)
+    return reader
+
+
+def candidate_frames(frames_for_verb):
+    """Order the frames of each verb once and for all for frame matching
+
+    The frames are sorted as frame matching expects them, and their
+    passivizations are computed. Duplicates are kept (a verb member of a
+    class and of one of its subclasses inherits the frames of the class
+    twice): frame matching counts every frame.
+
+    :param frames_for_verb: The frames of each verb.
+    :type frames_for_verb: VerbnetOfficialFrame list dict.
+    :returns: CandidateFrames dict
+    """
+    table = {}
+    for verb, frames in frames_for_verb.items():
+        active = tuple(sorted(frames))
+        passive = tuple(passivized_frame
+                        for frame in active if frame.index_v is not None
+                        for passivized_frame in frame.passivized())
+        table[verb] = CandidateFrames(active, passive)
+    return table
+
+
+def read_snapshot(path, jobs=1):
+    """Parse VerbNet and return the structures that init_verbnet needs
+
+    :param path: Path to VerbNet.
+    :type path: pathlib.Path.
+    :param jobs: Number of processes parsing the files.
+    :type jobs: int.
+    :returns: dict -- frames_for_verb, candidate_frames, classes, roles,
+        cnames and unhandled
+    """
+    reader = VerbnetReader(path, jobs)
+    return {
+        'frames_for_verb': reader.frames_for_verb,
+        'candidate_frames': candidate_frames(reader.frames_for_verb),
+        'classes': reader.classes,
+        'roles': reader.roles,
+        'cnames': reader.cnames,
+        'unhandled': reader.unhandled,
+    }
+
+
+def load_snapshot(path, jobs=1):
+    """Load VerbNet, from its snapshot in paths.Paths.CACHE when it is up to
+    date with the XML files.
+
+    :param path: Path to VerbNet.
+    :type path: pathlib.Path.
+    :param jobs: Number of processes parsing the files when there is no
+        snapshot, see parallelloader.num_jobs.
+    :type jobs: int.
+    :returns: dict -- see read_snapshot
+    """
     logger = logging.getLogger(__name__)
     logger.setLevel(options.Options.loglevel)
-    logger.info(f"init_verbnet Loading VerbNet data from {path} ...")
-    reader = VerbnetReader(path)
-    errors["vn_parsing"] = reader.unhandled
-    return reader.frames_for_verb, reader.classes
+    logger.info(f"load_snapshot Loading VerbNet data from {path} ...")
+    snapshot = lexiconcache.load_or_build(
+        'verbnet', path, lambda: read_snapshot(path, jobs),
+        version=SNAPSHOT_VERSION)
+    errors["vn_parsing"] = snapshot['unhandled']
+    return snapshot
+
+
+def init_verbnet(path, jobs=1):
+    """Load VerbNet, see load_snapshot
+
+    :param path: Path to VerbNet.
+    :type path: pathlib.Path.
+    :param jobs: Number of processes parsing the files when there is no
+        snapshot, see parallelloader.num_jobs.
+    :type jobs: int.
+    :returns: (frames_for_verb, classes)
+    """
+    snapshot = load_snapshot(path, jobs)
+    return snapshot['frames_for_verb'], snapshot['classes']
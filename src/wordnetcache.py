@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""On-disk cache of the WordNet classes of words
+
+headwordextractor.get_class looks up the synsets and the hypernym paths of a
+word in WordNet, and the bootstrap algorithm asks for the same headwords at
+every iteration. get_class keeps the classes of the recent words in memory;
+this module also stores them in an SQLite table of paths.Paths.CACHE, shared
+by all the processes and runs using the same WordNet. The table is named
+after the fingerprint of the WordNet files: a new WordNet gives a new table.
+Words not in WordNet are stored with a NULL class.
+
+Run this module to fill the table with the words of some parsed CoNLL files
+or directories (the FrameNet parses by default):
+
+    PYTHONPATH=src python src/wordnetcache.py [data/framenet_parsed ...]
+
+    Defines the class ClassStore and the functions:
+    * wordnet_fingerprint
+    * cache_file
+    * store
+"""
+
+import argparse
+import glob
+import logging
+import os
+import pathlib
+import sqlite3
+
+import lexiconcache
+import options
+import paths
+
+# The version of the computation of the classes, see
+# headwordextractor.wordnet_class
+CLASS_VERSION = 1
+
+
+def wordnet_fingerprint():
+    """Return the fingerprint of the WordNet files NLTK reads, None if NLTK
+    finds no WordNet"""
+    # Only finds the files: WordNet itself is not loaded
+    import nltk.data  # type: ignore
+    try:
+        pointer = nltk.data.find('corpora/wordnet')
+    except LookupError:
+        return None
+    if isinstance(pointer, nltk.data.ZipFilePathPointer):
+        location = pathlib.Path(pointer.zipfile.filename)
+        return lexiconcache.fingerprint(location.parent,
+                                        glob.escape(location.name),
+                                        CLASS_VERSION)
+    return lexiconcache.fingerprint(pathlib.Path(pointer.path), '*',
+                                    CLASS_VERSION)
+
+
+def cache_file(fingerprint):
+    """Return the table of the classes of the WordNet with a fingerprint"""
+    return paths.Paths.CACHE / 'wordnet-classes-{}.sqlite'.format(
+        fingerprint[:12])
+
+
+class ClassStore:
+    """The table of the WordNet classes of words
+
+    :var filename: pathlib.Path -- the SQLite database
+    """
+
+    def __init__(self, filename):
+        """Open the table, creating it if needed
+
+        :param filename: The SQLite database.
+        :type filename: pathlib.Path.
+        :raises: sqlite3.Error
+        """
+        self.filename = filename
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        # Other processes may write at the same time: wait for them
+        self.connection = sqlite3.connect(str(filename), timeout=30,
+                                          isolation_level=None)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS classes '
+            '(word TEXT PRIMARY KEY, class TEXT)')
+
+    def __len__(self):
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM classes').fetchone()[0]
+
+    def get(self, word):
+        """Look up the class of a word
+
+        :returns: (bool, str) -- whether the word is in the table, and its
+            class or None
+        """
+        row = self.connection.execute(
+            'SELECT class FROM classes WHERE word = ?', (word,)).fetchone()
+        return (False, None) if row is None else (True, row[0])
+
+    def put(self, word, wordclass):
+        """Store the class of a word, None if it is not in WordNet"""
+        self.connection.execute(
+            'INSERT OR REPLACE INTO classes VALUES (?, ?)', (word, wordclass))
+
+    def update(self, classes):
+        """Store the classes of many words at once
+
+        :param classes: The (word, class) pairs.
+        :type classes: iterable.
+        """
+        with self.connection:
+            self.connection.execute('BEGIN')
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO classes VALUES (?, ?)', classes)
+
+    def words(self):
+        """Return the set of the words in the table"""
+        return {word for word, in
+                self.connection.execute('SELECT word FROM classes')}
+
+    def close(self):
+        self.connection.close()
+
+
+# The table opened by this process, and the id of the process
+_store = None
+_store_pid = None
+
+
+def store():
+    """Return the table of the classes of the installed WordNet, opened once
+    per process
+
+    :returns: ClassStore -- the table, None when the cache is disabled (see
+        options.Options.wordnet_cache), when NLTK finds no WordNet or when the
+        table cannot be opened
+    """
+    global _store, _store_pid
+    if not options.Options.wordnet_cache:
+        return None
+    # A connection must not be used by a forked process
+    if _store_pid != os.getpid():
+        _store, _store_pid = None, os.getpid()
+        fingerprint = wordnet_fingerprint()
+        if fingerprint is not None:
+            try:
+                _store = ClassStore(cache_file(fingerprint))
+            except sqlite3.Error as e:
+                logger = logging.getLogger(__name__)
+                logger.setLevel(options.Options.loglevel)
+                logger.warning('store: cannot open {}: {}'.format(
+                    cache_file(fingerprint), e))
+    return _store
+
+
+if __name__ == '__main__':
+    from conllreader import conll_blocks, conll_columns
+    import headwordextractor
+
+    parser = argparse.ArgumentParser(
+        description='Fill the cache of the WordNet classes of the words of '
+                    'parsed CoNLL files.')
+    parser.add_argument('paths', nargs='*', type=pathlib.Path,
+                        default=[paths.Paths.FRAMENET_PARSED,
+                                 paths.Paths.FRAMENET_LU_PARSED],
+                        help='CoNLL files, or directories of .conll files.')
+    args = parser.parse_args()
+
+    classes = store()
+    if classes is None:
+        parser.error('no WordNet found')
+    files = [filename for path in args.paths
+             for filename in (sorted(path.glob('*.conll')) if path.is_dir()
+                              else [path])]
+    vocabulary = {word for filename in files
+                  for lines in conll_blocks(filename)
+                  for word in conll_columns(lines).forms}
+    missing = sorted(vocabulary - classes.words())
+    # Looked up before writing, not to lock the table meanwhile
+    classes.update([(word, headwordextractor.wordnet_class(word))
+                    for word in missing])
+    print('{} files, {} words, {} new classes in {}'.format(
+        len(files), len(vocabulary), len(missing), classes.filename))
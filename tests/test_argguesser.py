@@ -97,6 +97,22 @@ class ArgGuesserTest(unittest.TestCase):
         self.assertEqual(self.arg_guesser._find_args(treeBuilder.tree_list[0]),
                          args)
 
+    def test_predicates(self):
+        conll_tree = """1	The	the	DT	DT	-	2	NMOD	-	-
+2	others	others	NNS	NNS	-	5	SBJ	-	-
+3	here	here	RB	RB	-	2	LOC	-	-
+4	today	today	RB	RB	-	3	TMP	-	-
+5	walked	walked	VVD	VVD	-	0	ROOT	-	-
+6	elsewhere	elsewhere	RB	RB	-	5	LOC	-	-
+7	.	.	.	.	-	5	P	-	-"""
+        treeBuilder = SyntacticTreeBuilder(conll_tree)
+        frames = list(self.arg_guesser._sentence_predicates_iterator(
+            0, treeBuilder.sentence, treeBuilder.tree_list[0], 'test'))
+        self.assertEqual([frame.predicate.lemma for frame in frames],
+                         ['walked'])
+        # Only the lemma of the verb was looked up
+        self.assertEqual(self.arg_guesser.verbnet_lemmas, {'walked': True})
+
     def test_multiroot_sentence(self):
         conll_tree = """\
 1	because	because	IN	IN	-	15	VMOD	-	-
@@ -5,7 +5,9 @@ import logging
 import sys
 import unittest
 
-from argheuristic import find_args, build_relation_tree # type: ignore
+from argheuristic import (RelationTable, SentenceRelations, # type: ignore
+                          build_relation_tree, find_args, nested,
+                          relation_code)
 from conllreader import SyntacticTreeBuilder # type: ignore
 from options import Options
 
@@ -71,6 +73,31 @@ class ArgHeuristicTest(unittest.TestCase):
 
         self.assertEqual(set([x.word for x in found]), expected)
 
+    def test_relation_table(self):
+        root = self.initial_tree_list[0]
+        relations = SentenceRelations(root)
+        for predicate in root:
+            # The same entries as the relation tree, in the same order
+            table = RelationTable(relations, predicate)
+            self.assertEqual(
+                [(relations.nodes[position], code) for position, code
+                 in zip(table.positions, table.codes)],
+                [(elem.node, relation_code(elem.relation))
+                 for elem in build_relation_tree(predicate)])
+            self.assertEqual(find_args(predicate, relations),
+                             find_args(predicate))
+
+    def test_nested(self):
+        nodes = {node.word: node
+                 for node in self.initial_tree_list[0].preorder()}
+        candidates = [nodes[word] for word in
+                      ["contribution", "Goodwill", "more", "you", "know"]]
+        # contribution contains Goodwill, more contains you and know
+        self.assertEqual(
+            nested([node.preorder_interval() for node in candidates]),
+            [0, 2])
+        self.assertEqual(nested([]), [])
+
 if __name__ == '__main__':
     unittest_args = ArgHeuristicTest.setUpClass()
     unittest.main(argv=[sys.argv[0]] + unittest_args)
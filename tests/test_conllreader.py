@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 import logging
 import sys
+import io
+import tempfile
 import trace
+import types
 import unittest
+from unittest import mock
 import options
 
-from conllreader import SyntacticTreeBuilder
+from conllstore import ConllStore
+import conllreader
+from conllreader import (ConllSemanticAppender, SyntacticTreeBuilder,
+                         conll_blocks, conll_columns)
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.DEBUG)
@@ -43,6 +50,40 @@ class TreeBuilderTest(unittest.TestCase):
         logger.debug('test_tree_flat')
         self.assertEqual(self.tree_list[0].flat(), "The others here today live elsewhere .")
 
+    def test_non_projective_flat(self):
+        logger.debug('test_non_projective_flat')
+        conll_tree = """\
+1	A	a	DT	DT	-	2	NMOD	-	-
+2	hearing	hearing	NN	NN	-	4	SBJ	-	-
+3	is	be	VBZ	VBZ	-	0	ROOT	-	-
+4	scheduled	schedule	VBN	VBN	-	3	VC	-	-
+5	on	on	IN	IN	-	2	NMOD	-	-
+6	it	it	PRP	PRP	-	5	PMOD	-	-"""
+        tree = SyntacticTreeBuilder(conll_tree).tree_list[0]
+        hearing = tree.children[0].children[0]
+        self.assertEqual(hearing.flat(), "A hearing on it")
+        self.assertEqual(hearing.children[1].flat(), "on it")
+        self.assertEqual(tree.flat(), "A hearing is scheduled on it")
+
+    def test_traversals(self):
+        root = self.tree_list[0]
+        # The others here today live elsewhere .
+        self.assertEqual([node.word for node in root.preorder()],
+                         ['live', 'others', 'The', 'here', 'today',
+                          'elsewhere', '.'])
+        others = root.children[0]
+        self.assertEqual([node.word for node in others.preorder()],
+                         ['others', 'The', 'here', 'today'])
+
+        today = others.children[1].children[0]
+        self.assertTrue(today.is_in(others))
+        self.assertTrue(today.is_in(today))
+        self.assertFalse(others.is_in(today))
+        self.assertFalse(root.children[1].is_in(others))
+        # No state shared between calls
+        self.assertEqual(today.fathers(), {root, others, others.children[1]})
+        self.assertEqual(others.fathers(), {root})
+
     def test_tree_contains(self):
         logger.debug('test_tree_contains')
         self.assertTrue(self.tree_list[0].contains("here today"))
@@ -100,6 +141,129 @@ class TreeBuilderTest(unittest.TestCase):
             'Jamaica is not just a destination it is an experience')
 
 
+class ConllBlocksTest(unittest.TestCase):
+
+    def test_blocks(self):
+        content = io.StringIO(
+            "# sent_id = 1\n"
+            "1\tHello\thello\tUH\tUH\t-\t0\tROOT\t-\t-\n"
+            "\n"
+            "  \n"
+            "\n"
+            "# comment only\n"
+            "\n"
+            "1\tBye\tbye\tUH\tUH\t-\t0\tROOT\t-\t-\r\n"
+            "2\t.\t.\t.\t.\t-\t1\tP\t-\t-")
+        self.assertEqual(list(conll_blocks(content)), [
+            ["1\tHello\thello\tUH\tUH\t-\t0\tROOT\t-\t-"],
+            ["1\tBye\tbye\tUH\tUH\t-\t0\tROOT\t-\t-",
+             "2\t.\t.\t.\t.\t-\t1\tP\t-\t-"]])
+
+    def test_columns(self):
+        columns = conll_columns([
+            "# sent_id = 1",
+            "1\tHe\the\tPRP\t_\t_\t2\tSBJ\t_\t_",
+            "  ",
+            "2\tslept\tsleep\tVBD\tVBD\t_\t_\t_\troot\t_\t_",
+            "3\tbadly\tbadly\tRB",
+            "4\t.\t.\t.\t.\t_\t_\t_\tP\t_\t_"])
+        self.assertEqual(columns.word_ids, [1, 2, 4])
+        self.assertEqual(columns.forms, ['He', 'slept', '.'])
+        # 10 columns: no named entity type, "_" POS is the coarse POS
+        self.assertEqual(columns.poses, ['PRP', 'VBD', '.'])
+        self.assertEqual(columns.deprels, ['SBJ', 'ROOT', 'P'])
+        self.assertEqual(columns.heads, [2, 0, None])
+
+
+class ConllSemanticAppenderTest(unittest.TestCase):
+
+    conll = ("1\tHello\thello\tUH\tUH\t-\t0\tROOT\t-\t-\n"
+             "\n"
+             "1\tHe\the\tPRP\tPRP\t-\t2\tSBJ\t-\t-\n"
+             "2\tslept\tsleep\tVBD\tVBD\t-\t0\tROOT\t-\t-\n")
+
+    def test_verbnet_annotation(self):
+        frame = types.SimpleNamespace(
+            sentence_id=1, tokenid=2, roles=[{'Agent', 'Patient'}],
+            args=[types.SimpleNamespace(position=1)],
+            best_classes=lambda: {'sleep-40.4'})
+        hello = "1\tHello\thello\tUH\tUH\t-\t0\tROOT\t-\t-\t_\n"
+        # The sentences are separated by two blank lines
+        expected = (hello +
+                    "\n\n"
+                    "1\tHe\the\tPRP\tPRP\t-\t2\tSBJ\t-\t-\t_\t"
+                    "Agent|Patient\n"
+                    "2\tslept\tsleep\tVBD\tVBD\t-\t0\tROOT\t-\t-\t"
+                    "sleep-40.4\t_\n")
+
+        with tempfile.NamedTemporaryFile('w', suffix='.conll') as conll:
+            conll.write(self.conll)
+            conll.flush()
+            output = io.StringIO()
+            appender = ConllSemanticAppender(conll.name, output)
+            appender.add_verbnet_frame_annotation(frame)
+            # The first sentence is written once a later one is annotated
+            self.assertEqual(output.getvalue(), hello)
+            appender.close()
+            self.assertEqual(output.getvalue(), expected)
+
+    def test_stdin(self):
+        frame = types.SimpleNamespace(
+            sentence_id=0, tokenid=1, roles=[], args=[],
+            best_classes=lambda: {'hello-1'})
+        with mock.patch.object(conllreader, '_stdin', None), \
+                mock.patch('sys.stdin', io.StringIO(self.conll)):
+            # The argument identification reads the standard input first
+            with ConllStore('-') as document:
+                self.assertEqual(len(document), 2)
+            output = io.StringIO()
+            appender = ConllSemanticAppender('-', output)
+            appender.add_verbnet_frame_annotation(frame)
+            appender.close()
+        lines = output.getvalue().split('\n')
+        self.assertEqual(lines[0],
+                         "1\tHello\thello\tUH\tUH\t-\t0\tROOT\t-\t-\t"
+                         "hello-1\t_")
+        self.assertEqual(len(lines), 6)
+
+    def test_file_object(self):
+        output = io.StringIO()
+        ConllSemanticAppender(io.StringIO(self.conll), output).close()
+        self.assertEqual(output.getvalue(),
+                         self.conll.replace('\n', '\t_\n')
+                         .replace('\t_\n\t_\n', '\t_\n\n\n'))
+
+    def test_order(self):
+        def frame(sentence_id):
+            return types.SimpleNamespace(
+                sentence_id=sentence_id, tokenid=1, roles=[], args=[],
+                best_classes=lambda: {'hello-1'})
+        output = io.StringIO()
+        appender = ConllSemanticAppender(io.StringIO(self.conll), output)
+        appender.add_verbnet_frame_annotation(frame(1))
+        # The first sentence is already written
+        with self.assertLogs('conllreader', 'ERROR'):
+            appender.add_verbnet_frame_annotation(frame(0))
+        with self.assertLogs('conllreader', 'ERROR'):
+            appender.add_verbnet_frame_annotation(frame(2))
+        self.assertEqual(output.getvalue().count('hello-1'), 1)
+
+    def test_token_at(self):
+        appender = ConllSemanticAppender(io.StringIO(self.conll),
+                                         io.StringIO())
+        hello_matrix, sentence_matrix = (
+            [line.split('\t') + ['_'] for line in sentence.split('\n')]
+            for sentence in self.conll.strip().split('\n\n'))
+        # "He slept": the space belongs to the token before it
+        self.assertEqual([appender.token_at(sentence_matrix, char)
+                          for char in range(9)],
+                         [0, 0, 0, 1, 1, 1, 1, 1, 1])
+        self.assertIsNone(appender.token_at(sentence_matrix, 9))
+        # Another sentence has its own positions
+        self.assertIsNone(appender.token_at(hello_matrix, 6))
+        self.assertEqual(appender.token_at(sentence_matrix, 3), 1)
+
+
 if __name__ == '__main__':
     ### NEW Pour comprendre ce qu'il se passe ###
     #tracer = trace.Trace(trace=True, count = False)
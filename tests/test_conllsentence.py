@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from conllreader import SyntacticTreeBuilder
+from conllsentence import ConllSentence, NodeView, StringTable
+from framenetframe import Arg
+
+
+class ConllSentenceTest(unittest.TestCase):
+
+    conll_tree = """\
+1	A	a	DT	DT	-	2	NMOD	-	-
+2	hearing	hearing	NN	NN	-	4	SBJ	-	-
+3	is	be	VBZ	VBZ	-	0	ROOT	-	-
+4	scheduled	schedule	VBN	VBN	-	3	VC	-	-
+5	on	on	IN	IN	-	2	NMOD	-	-
+6	it	it	PRP	_	-	5	PMOD	-	-"""
+
+    attributes = ['word_id', 'word', 'lemma', 'cpos', 'pos', 'deprel',
+                  'head', 'begin_word', 'begin', 'end', 'position',
+                  'first_index', 'last_index', 'subtree_size']
+
+    def setUp(self):
+        self.builder = SyntacticTreeBuilder(self.conll_tree)
+        self.sentence = ConllSentence(self.conll_tree.split('\n'))
+
+    def test_same_as_builder(self):
+        self.assertEqual(self.sentence.sentence, self.builder.sentence)
+        self.assertEqual(self.sentence.tree_list, self.builder.tree_list)
+        for node, view in zip(self.builder.nodes, self.sentence.nodes):
+            for attribute in self.attributes:
+                self.assertEqual(getattr(view, attribute),
+                                 getattr(node, attribute), attribute)
+            self.assertEqual(view.father, node.father)
+            self.assertEqual(view.children, node.children)
+            self.assertEqual(view.flat(), node.flat())
+            self.assertEqual(str(view), str(node))
+            self.assertEqual(list(view.preorder()), list(node.preorder()))
+            self.assertEqual(view.fathers(), node.fathers())
+            self.assertEqual(view.preorder_interval(),
+                             node.preorder_interval())
+            self.assertEqual(view.preorder_node(view.preorder_rank), view)
+
+    def test_views(self):
+        root = self.sentence.tree_list[0]
+        self.assertIsInstance(root, NodeView)
+        self.assertEqual(root.word, 'is')
+        self.assertIsNone(root.father)
+        hearing = root.children[0].children[0]
+        self.assertEqual(hearing.flat(), 'A hearing on it')
+        self.assertEqual(hearing.father.father, root)
+        self.assertEqual(self.sentence.node(5).pos, 'PRP')
+
+    def test_node_at_span(self):
+        def arg(begin, end, text):
+            return Arg(begin, end, text, '', True, '')
+
+        for root in (self.builder.tree_list[0],
+                     self.sentence.tree_list[0]):
+            # The subtrees of scheduled and hearing span the sentence too
+            hearing = root.node_at_span(arg(0, 27, 'A hearing on it'))
+            self.assertEqual(hearing.word, 'hearing')
+            self.assertEqual(root.node_at_span(arg(23, 27, 'on it')).word,
+                             'on')
+            self.assertEqual(
+                root.node_at_span(arg(23, 27, 'on it')),
+                root.closest_match_as_node(arg(23, 27, 'on it')))
+            # Not a phrase, or a span not aligned with the words
+            self.assertIsNone(root.node_at_span(arg(0, 8, 'A hearing')))
+            self.assertIsNone(root.node_at_span(arg(22, 26, 'on it')))
+            # Only the nodes of the subtree
+            self.assertIsNone(hearing.children[0].node_at_span(
+                arg(23, 27, 'on it')))
+
+    def test_string_table(self):
+        strings = StringTable()
+        first = ConllSentence(self.conll_tree.split('\n'), strings)
+        size = len(strings)
+        second = ConllSentence(self.conll_tree.split('\n'), strings)
+        self.assertEqual(len(strings), size)
+        self.assertEqual(first.words, second.words)
+
+
+if __name__ == '__main__':
+    unittest.main()
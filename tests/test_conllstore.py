@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from conllreader import conll_blocks
+import conllstore
+from conllstore import ConllStore, index_file, sentence_offsets
+from framenetallreader import FNAllReader
+import options
+import paths
+
+
+class ConllStoreTest(unittest.TestCase):
+
+    conll = ("# sent_id = 1\n"
+             "1\tHello\thello\tUH\tUH\t-\t0\tROOT\t-\t-\n"
+             "\n"
+             "  \n"
+             "\n"
+             "# comment only\n"
+             "\n"
+             "1\tHe\the\tPRP\tPRP\t-\t2\tSBJ\t-\t-\r\n"
+             "# inside a sentence\n"
+             "2\tslept\tsleep\tVBD\tVBD\t-\t0\tROOT\t-\t-\n"
+             "\n"
+             "1\tBye\tbye\tUH\tUH\t-\t0\tROOT\t-\t-")
+
+    def setUp(self):
+        # Do not keep the indexes of temporary files
+        self.conll_index = options.Options.conll_index
+        self.parse_cache = options.Options.parse_cache
+        options.Options.conll_index = False
+        options.Options.parse_cache = False
+        self.conll_file = tempfile.NamedTemporaryFile(
+            'w', suffix='.conll', newline='')
+        self.conll_file.write(self.conll)
+        self.conll_file.flush()
+
+    def tearDown(self):
+        self.conll_file.close()
+        options.Options.conll_index = self.conll_index
+        options.Options.parse_cache = self.parse_cache
+
+    def test_same_as_blocks(self):
+        with ConllStore(self.conll_file.name) as store:
+            self.assertEqual(len(store), 3)
+            self.assertEqual([store.lines(i) for i in store],
+                             list(conll_blocks(self.conll_file.name)))
+            self.assertEqual(store[1][0].flat(), 'He slept')
+            with self.assertRaises(KeyError):
+                store[3]
+
+    def test_bounded_cache(self):
+        with ConllStore(self.conll_file.name, cache_size=1) as store:
+            sentence = store.sentence(1)
+            self.assertIs(store.sentence(1), sentence)
+            store[2]
+            self.assertIsNot(store.sentence(1), sentence)
+            self.assertEqual(store[1][0].flat(), sentence.tree_list[0].flat())
+            self.assertEqual(store.parsed, 3)
+
+    def test_empty(self):
+        self.assertEqual(len(sentence_offsets(b'')), 0)
+        with tempfile.NamedTemporaryFile(suffix='.conll') as empty:
+            with ConllStore(empty.name) as store:
+                self.assertEqual(list(store), [])
+
+
+class IndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.conll_index = options.Options.conll_index
+        self.parse_cache = options.Options.parse_cache
+        options.Options.conll_index = True
+        options.Options.parse_cache = False
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache, paths.Paths.CACHE = (paths.Paths.CACHE,
+                                         pathlib.Path(self.cache_dir.name))
+        self.conll_dir = tempfile.TemporaryDirectory()
+        self.conll_file = pathlib.Path(self.conll_dir.name) / 'file.conll'
+        self.conll_file.write_text(ConllStoreTest.conll)
+
+    def tearDown(self):
+        options.Options.conll_index = self.conll_index
+        options.Options.parse_cache = self.parse_cache
+        paths.Paths.CACHE = self.cache
+        self.cache_dir.cleanup()
+        self.conll_dir.cleanup()
+
+    def test_index(self):
+        with ConllStore(self.conll_file) as store:
+            self.assertEqual(len(store), 3)
+        # Nothing is written next to the file
+        self.assertEqual(os.listdir(self.conll_dir.name), ['file.conll'])
+        self.assertEqual(
+            list(pathlib.Path(self.cache_dir.name).glob('indexes/*')),
+            [index_file(self.conll_file)])
+        # Read from the index file this time
+        with mock.patch.object(conllstore, 'sentence_offsets') as offsets:
+            with ConllStore(self.conll_file) as store:
+                self.assertEqual(store.lines(2), ['1\tBye\tbye\tUH\tUH\t-\t0'
+                                                  '\tROOT\t-\t-'])
+            offsets.assert_not_called()
+        # Indexed again once the file changes
+        self.conll_file.write_text(ConllStoreTest.conll + '\n\n' +
+                                   ConllStoreTest.conll)
+        with ConllStore(self.conll_file) as store:
+            self.assertEqual(len(store), 6)
+
+    def test_disabled(self):
+        options.Options.conll_index = False
+        with ConllStore(self.conll_file) as store:
+            self.assertEqual(len(store), 3)
+        self.assertFalse(index_file(self.conll_file).exists())
+
+
+class SharedDocumentTest(unittest.TestCase):
+
+    def setUp(self):
+        # The index and the parse cache of the file go to a temporary cache
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache, paths.Paths.CACHE = (paths.Paths.CACHE,
+                                         pathlib.Path(self.cache_dir.name))
+
+    def tearDown(self):
+        paths.Paths.CACHE = self.cache
+        self.cache_dir.cleanup()
+
+    def test_parsed_once(self):
+        parse_file = paths.Paths.FRAMENET_PARSED / 'ANC__110CYL067.conll'
+        annotation_file = (paths.Paths.framenet_path('eng') / 'fulltext' /
+                           'ANC__110CYL067.xml')
+        with ConllStore(parse_file, cache_size=None) as document:
+            # What the argument identification reads
+            sentences = {sentence_id for sentence_id, _, _
+                         in document.sentence_trees()}
+            frames = list(FNAllReader().iter_frames(
+                annotation_file, parse_file, document))
+            self.assertEqual(sentences, set(document))
+            self.assertTrue(frames)
+            self.assertEqual(document.parsed, len(document))
+        self.assertFalse(parse_file.with_name(parse_file.name +
+                                              '.idx').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import pathlib
+import tempfile
+import unittest
+
+import framenet
+import paths
+
+
+class FrameNetReaderTest(unittest.TestCase):
+    '''Compares the lazy and the eager FrameNet readers'''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.old_cache = paths.Paths.CACHE
+        paths.Paths.CACHE = pathlib.Path(cls.tmpdir.name)
+
+        cls.eager = framenet.FrameNet()
+        framenet.FrameNetReader(paths.Paths.framenet_path("eng"), cls.eager)
+
+    @classmethod
+    def tearDownClass(cls):
+        paths.Paths.CACHE = cls.old_cache
+        cls.tmpdir.cleanup()
+
+    def test_lazy(self):
+        lazy = framenet.FrameNet()
+        framenet.FrameNetReader(paths.Paths.framenet_path("eng"), lazy,
+                                lazy=True)
+
+        self.assertEqual(set(lazy.frames), set(self.eager.frames))
+        self.assertEqual(lazy.lexical_unit_names,
+                         self.eager.lexical_unit_names)
+        self.assertTrue(lazy.has_lexical_unit("Ingestion", "eat.v"))
+        self.assertFalse(lazy.has_lexical_unit("Ingestion", "abandon.v"))
+        self.assertEqual(lazy.frames_for_verb, self.eager.frames_for_verb)
+
+        # Nothing but the name is known before the definition is used
+        frame = lazy.frames["Ingestion"]
+        self.assertNotIn("elements", frame.__dict__)
+        self.assertEqual(frame.id, self.eager.frames["Ingestion"].id)
+        self.assertEqual(set(frame.elements),
+                         set(self.eager.frames["Ingestion"].elements))
+        self.assertEqual(set(frame.lexicalUnits),
+                         set(self.eager.frames["Ingestion"].lexicalUnits))
+
+        # The second time, the index comes from the cache
+        cached = framenet.FrameNet()
+        framenet.FrameNetReader(paths.Paths.framenet_path("eng"), cached,
+                                lazy=True)
+        self.assertEqual(cached.lexical_unit_names, lazy.lexical_unit_names)
+
+    def test_frames_with_verb(self):
+        self.assertIn("Ingestion", self.eager.frames_with_verb("eat"))
+        self.assertNotIn("Ingestion", self.eager.frames_with_verb("abandon"))
+        self.assertEqual(self.eager.frames_with_verb("not_a_verb"), set())
+        for frame_name, frame in self.eager.frames.items():
+            for lexical_unit_name in frame.lexicalUnits:
+                if lexical_unit_name.endswith(".v"):
+                    self.assertIn(frame_name, self.eager.frames_with_verb(
+                        lexical_unit_name[:-2]))
+
+    def test_parallel(self):
+        parallel = framenet.FrameNet()
+        framenet.FrameNetReader(paths.Paths.framenet_path("eng"), parallel,
+                                jobs=2)
+
+        self.assertEqual(list(parallel.frames), list(self.eager.frames))
+        self.assertEqual(parallel.lexical_unit_names,
+                         self.eager.lexical_unit_names)
+        self.assertEqual(set(parallel.frames["Ingestion"].elements),
+                         set(self.eager.frames["Ingestion"].elements))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,5 +23,14 @@ class CoreArgsFinderTest(unittest.TestCase):
         with self.assertRaises(NoSuchFrameError):
             core_args_finder.is_core_role("Agent", "Non_existing_frame")
 
+    def test_parallel(self):
+        core_args_finder = CoreArgsFinder()
+        core_args_finder.load_data_from_xml(paths.Paths.framenet_frames("eng"))
+        parallel_finder = CoreArgsFinder()
+        parallel_finder.load_data_from_xml(
+            paths.Paths.framenet_frames("eng"), jobs=2)
+
+        self.assertEqual(parallel_finder.core_args, core_args_finder.core_args)
+
 if __name__ == '__main__':
     unittest.main()
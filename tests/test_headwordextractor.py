@@ -5,6 +5,8 @@ import logging
 import sys
 import random
 import unittest
+from collections import Counter
+from unittest import mock
 
 import framenetreader  # type: ignore
 import headwordextractor  # type: ignore
@@ -12,6 +14,8 @@ import paths  # type: ignore
 import probabilitymodel
 
 from conllparsedreader import ConllParsedReader  # type: ignore
+from conllreader import SyntacticTreeBuilder
+from framenetframe import Arg
 from options import Options
 
 logging.basicConfig(level=logging.INFO)
@@ -61,6 +65,32 @@ class HeadWordExtractorTest(unittest.TestCase):
         # get_class should return None for words out of WordNet
         self.assertEqual(headwordextractor.get_class("abcde"), None)
 
+    def test_lookups(self):
+        tree = SyntacticTreeBuilder(
+            "1\tA\ta\tDT\tDT\t-\t2\tNMOD\t-\t-\n"
+            "2\thearing\thearing\tNN\tNN\t-\t3\tSBJ\t-\t-\n"
+            "3\tis\tbe\tVBZ\tVBZ\t-\t0\tROOT\t-\t-\n"
+            "4\ton\ton\tIN\tIN\t-\t2\tNMOD\t-\t-\n"
+            "5\tit\tit\tPRP\t_\t-\t4\tPMOD\t-\t-").tree_list[0]
+        on_it = Arg(13, 17, 'on it', '', True, '')
+        # Not aligned with the words
+        misaligned = Arg(12, 16, 'on it', '', True, '')
+        loglevel = Options.loglevel
+        try:
+            with mock.patch.object(headwordextractor, 'lookups',
+                                   Counter()) as lookups:
+                Options.loglevel = logging.DEBUG
+                for arg in (on_it, misaligned, on_it):
+                    self.assertEqual(
+                        headwordextractor.headword(arg, tree)['top_headword'],
+                        ('IN', 'on'))
+                # Only counted in debug mode
+                Options.loglevel = logging.WARNING
+                headwordextractor.headword(on_it, tree)
+        finally:
+            Options.loglevel = loglevel
+        self.assertEqual(lookups, {'span': 2, 'closest match': 1})
+
     def test_1(self):
         filename = "ANC__110CYL067"
         fnparsed_reader = ConllParsedReader()
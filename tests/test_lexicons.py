@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+import lexicons
+import options
+import paths
+import semanticrolelabeler
+
+VNCLASS = """<?xml version="1.0" encoding="UTF-8"?>
+<VNCLASS ID="{vnclass}">
+  <MEMBERS><MEMBER name="{member}"/></MEMBERS>
+  <THEMROLES><THEMROLE type="Agent"><SELRESTRS/></THEMROLE></THEMROLES>
+  <FRAMES>
+    <FRAME>
+      <DESCRIPTION primary="NP V"/>
+      <SYNTAX><NP value="Agent"><SYNRESTRS/></NP><VERB/></SYNTAX>
+    </FRAME>
+  </FRAMES>
+  <SUBCLASSES/>
+</VNCLASS>"""
+
+
+class LexiconsTest(unittest.TestCase):
+    '''Each resource must be loaded once and shared'''
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.old_cache = paths.Paths.CACHE
+        paths.Paths.CACHE = pathlib.Path(self.tmpdir.name)
+        self.old_language = options.Options.language
+        self.old_framelexicon = options.Options.framelexicon
+        lexicons.clear()
+
+    def tearDown(self):
+        lexicons.clear()
+        options.Options.language = self.old_language
+        options.Options.framelexicon = self.old_framelexicon
+        paths.Paths.CACHE = self.old_cache
+        self.tmpdir.cleanup()
+
+    def test_shared(self):
+        options.Options.framelexicon = options.FrameLexicon.FrameNet
+        frameNet = lexicons.framenet("eng")
+        role_matcher = lexicons.role_matcher("eng")
+        core_args_finder = lexicons.core_args_finder("eng")
+
+        self.assertIs(lexicons.framenet("eng"), frameNet)
+        self.assertIs(lexicons.role_matcher("eng"), role_matcher)
+        self.assertIs(lexicons.core_args_finder("eng"), core_args_finder)
+        self.assertIs(role_matcher.frameNet, frameNet)
+        self.assertTrue(core_args_finder.is_core_role(
+            "Agent", "Activity_abandoned_state"))
+
+        lexicons.clear()
+        self.assertIsNot(lexicons.role_matcher("eng"), role_matcher)
+
+    def test_verbnet_output(self):
+        options.Options.framelexicon = options.FrameLexicon.VerbNet
+        role_matcher = lexicons.role_matcher("eng")
+        self.assertEqual(role_matcher.frameNet.frames, {})
+        self.assertNotIn(('FrameNet', 'eng'), lexicons._instances)
+        self.assertIs(lexicons.role_matcher("eng"), role_matcher)
+
+        # The FrameNet of a language is loaded at first use
+        verbnet = pathlib.Path(self.tmpdir.name) / 'eng'
+        verbnet.mkdir()
+        (verbnet / 'snooze-40.4.xml').write_text(
+            VNCLASS.format(vnclass='snooze-40.4', member='snooze'))
+        with mock.patch.object(paths.Paths, 'verbnet_path',
+                               lambda language: verbnet):
+            lexicons_eng = lexicons.for_language("eng")
+        self.assertIs(lexicons_eng.role_matcher, role_matcher)
+        self.assertNotIn(('FrameNet', 'eng'), lexicons._instances)
+        self.assertIs(lexicons_eng.frameNet, lexicons.framenet("eng"))
+
+    def test_languages(self):
+        # A small VerbNet for each language, and the English FrameNet for both
+        verbnets = {}
+        for language, vnclass, member in [('eng', 'snooze-40.4', 'snooze'),
+                                          ('fre', 'dormir-40.4', 'dormir')]:
+            verbnets[language] = pathlib.Path(self.tmpdir.name) / language
+            verbnets[language].mkdir()
+            (verbnets[language] / (vnclass + '.xml')).write_text(
+                VNCLASS.format(vnclass=vnclass, member=member))
+        framenet_path = paths.Paths.framenet_path('eng')
+
+        with mock.patch.object(paths.Paths, 'verbnet_path', verbnets.get), \
+                mock.patch.object(paths.Paths, 'framenet_path',
+                                  lambda language: framenet_path):
+            srl = semanticrolelabeler.SemanticRoleLabeler('eng', ['fre'])
+            self.assertEqual(set(srl.lexicons), {'eng', 'fre'})
+            self.assertEqual(set(srl.lexicons_for().frames_for_verb),
+                             {'snooze'})
+            self.assertEqual(set(srl.lexicons_for('fre').frames_for_verb),
+                             {'dormir'})
+
+            # No reload, whatever the labeller
+            other_srl = semanticrolelabeler.SemanticRoleLabeler('fre')
+            self.assertIs(other_srl.lexicons_for('fre'),
+                          srl.lexicons_for('fre'))
+            self.assertIs(other_srl.lexicons_for('eng'),
+                          srl.lexicons_for('eng'))
+            self.assertIs(srl.lexicons_for('fre'),
+                          lexicons.for_language('fre'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from conllparsedreader import ConllParsedReader
+import options
+import parsecache
+import paths
+
+
+class ParseCacheTest(unittest.TestCase):
+
+    conll = ("1\tHello\thello\tUH\tUH\t-\t0\tROOT\t-\t-\n"
+             "\n"
+             "# comment\n"
+             "1\tHe\the\tPRP\tPRP\t-\t2\tSBJ\t-\t-\n"
+             "2\tslept\tsleep\tVBD\tVBD\t-\t0\tROOT\t-\t-\n")
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache, paths.Paths.CACHE = (paths.Paths.CACHE,
+                                         pathlib.Path(self.cache_dir.name))
+        self.parse_cache = options.Options.parse_cache
+        self.conll_file = tempfile.NamedTemporaryFile('w', suffix='.conll')
+        self.conll_file.write(self.conll)
+        self.conll_file.flush()
+
+    def tearDown(self):
+        self.conll_file.close()
+        options.Options.parse_cache = self.parse_cache
+        paths.Paths.CACHE = self.cache
+        self.cache_dir.cleanup()
+
+    def trees(self):
+        return [(sentence_id, sentence, tree.flat(), tree.lemma)
+                for sentence_id, sentence, tree
+                in ConllParsedReader().sentence_trees(self.conll_file.name)]
+
+    def test_same_trees(self):
+        options.Options.parse_cache = False
+        expected = self.trees()
+        options.Options.parse_cache = True
+        self.assertEqual(self.trees(), expected)
+        cached = list(pathlib.Path(self.cache_dir.name).glob('parses/*'))
+        self.assertEqual(len(cached), 1)
+        # Read from the cache file this time
+        self.assertEqual(self.trees(), expected)
+        self.assertEqual(expected[1], (1, 'He slept', 'He slept', 'sleep'))
+
+    def test_unreadable_cache(self):
+        parsed = parsecache.load(self.conll_file.name)
+        self.assertEqual(len(parsed), 2)
+        cached = parsecache.cache_file(self.conll_file.name)
+        with open(str(cached), 'r+b') as cache:
+            cache.truncate(cached.stat().st_size - 1)
+        with self.assertRaises(ValueError):
+            parsecache.ParsedFile.open(cached)
+        with self.assertLogs('parsecache', 'WARNING'):
+            self.assertEqual(len(parsecache.load(self.conll_file.name)), 2)
+
+    def test_changed_file(self):
+        self.assertEqual(len(parsecache.load(self.conll_file.name)), 2)
+        # Unchanged: the content is not even hashed
+        with mock.patch.object(parsecache, 'content_hash') as content_hash:
+            self.assertEqual(len(parsecache.load(self.conll_file.name)), 2)
+            content_hash.assert_not_called()
+        # Touched only
+        os.utime(self.conll_file.name, ns=(0, 0))
+        with mock.patch.object(parsecache, 'encode') as encode:
+            self.assertEqual(len(parsecache.load(self.conll_file.name)), 2)
+            encode.assert_not_called()
+        # The cache file records the new modification time
+        with mock.patch.object(parsecache, 'content_hash') as content_hash:
+            self.assertEqual(len(parsecache.load(self.conll_file.name)), 2)
+            content_hash.assert_not_called()
+        self.conll_file.write('\n1\tBye\tbye\tUH\tUH\t-\t0\tROOT\t-\t-\n')
+        self.conll_file.flush()
+        self.assertEqual(len(parsecache.load(self.conll_file.name)), 3)
+        # The cache file of the former content is replaced
+        cached = list(pathlib.Path(self.cache_dir.name).glob('parses/*'))
+        self.assertEqual(cached, [parsecache.cache_file(self.conll_file.name)])
+
+    def test_prune(self):
+        parsecache.load(self.conll_file.name)
+        with tempfile.NamedTemporaryFile('w', suffix='.conll') as other:
+            other.write(self.conll)
+            other.flush()
+            parsecache.load(other.name)
+        index = (pathlib.Path(self.cache_dir.name) / 'indexes' /
+                 (parsecache.cache_name(other.name) + '.idx'))
+        index.parent.mkdir()
+        index.write_bytes(b'')
+        self.assertEqual(parsecache.prune([pathlib.Path(
+            self.conll_file.name)]), 2)
+        cached = list(pathlib.Path(self.cache_dir.name).glob('*/*'))
+        self.assertEqual(cached, [parsecache.cache_file(self.conll_file.name)])
+
+
+if __name__ == '__main__':
+    unittest.main()
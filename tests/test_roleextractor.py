@@ -7,6 +7,7 @@ import probabilitymodel
 ###OLD ###
 
 import unittest
+from unittest import mock
 import framenet
 import paths
 from framenetframe import FrameInstance, Predicate, Arg
@@ -47,6 +48,13 @@ class RoleExtractorTest(unittest.TestCase):
         self.assertEqual(frame.predicate, final_predicate)
         self.assertEqual(frame.args, final_args)
 
+    def test_language(self):
+        with mock.patch('roleextractor.FNAllReader') as reader:
+            reader.return_value.iter_frames.return_value = []
+            self.assertEqual(fill_gold_roles([], [None], [None], {}, None,
+                                             language='fra'), [])
+        self.assertEqual(reader.call_args.kwargs['language'], 'fra')
+
 if __name__ == "__main__":
     import verbnetreader
     from argguesser import ArgGuesser
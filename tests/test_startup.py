@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import os
+import pathlib
+import subprocess
+import sys
+import unittest
+
+SRC = pathlib.Path(__file__).resolve().parent.parent / 'src'
+
+# Import time budget of semanticrolelabeler, in microseconds. It is about
+# 0.1s without NLTK, and more than 0.3s with it.
+IMPORT_BUDGET = 1000000
+
+# Only needed to annotate raw CoNLL files, see argguesser and
+# headwordextractor
+HEAVY_MODULES = ['nltk', 'distance']
+
+
+def import_times(*args):
+    """Run python -X importtime and return the cumulative import time of each
+    module, in microseconds"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [str(SRC)] + ([env['PYTHONPATH']] if 'PYTHONPATH' in env else []))
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + list(args),
+        cwd=str(SRC), env=env, check=True, universal_newlines=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+class StartupTest(unittest.TestCase):
+    '''Tracks the time needed to import the labeler'''
+
+    def test_import(self):
+        times = import_times('-c', 'import semanticrolelabeler')
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, times)
+        self.assertLess(times['semanticrolelabeler'], IMPORT_BUDGET)
+
+    def test_help(self):
+        times = import_times('knowledgesrl.py', '--help')
+        self.assertNotIn('semanticrolelabeler', times)
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, times)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import pickle
 import sys
 import unittest
 
@@ -68,5 +69,52 @@ class VerbnetOfficialFrameTest(unittest.TestCase):
                 {'elem': 'V'}, {'elem': 'by'},
                 {'elem': 'NP', 'role': 'Agent', 'restr': 'a'}])])
 
+    def test_precomputed(self):
+        frame = VerbnetOfficialFrame('XX', [
+            {'elem': 'NP', 'role': 'Agent', 'restr': 'a'},
+            {'elem': 'V'},
+            {'elem': 'that'}, {'elem': 'S', 'role': 'Topic', 'restr': 'b'},
+            {'elem': {'to', 'for'}}, {'elem': 'NP', 'role': 'Recipient',
+                                      'restr': 'c'}])
+
+        self.assertEqual(frame.roles(), ('Agent', 'Topic', 'Recipient'))
+        self.assertEqual(frame.selrestrs(), ('a', 'b', 'c'))
+        self.assertEqual(frame.num_slots, 3)
+        self.assertEqual(frame.num_slots_before_v, 1)
+        self.assertEqual(frame.index_v, 1)
+        self.assertEqual(frame.elements[4], frozenset({'to', 'for'}))
+        self.assertTrue(frame.has('that'))
+        with self.assertRaises(AttributeError):
+            frame.vnclass = 'YY'
+
+        without_that = frame.without('that')
+        self.assertFalse(without_that.has('that'))
+        self.assertTrue(frame.has('that'))
+        self.assertEqual(without_that.roles(), frame.roles())
+
+        self.assertEqual(pickle.loads(pickle.dumps(frame)), frame)
+        self.assertEqual(hash(pickle.loads(pickle.dumps(frame))), hash(frame))
+
+    def test_variants(self):
+        frame = VerbnetOfficialFrame('XX', [
+            {'elem': 'NP', 'role': 'Agent', 'restr': 'a'},
+            {'elem': 'V'},
+            {'elem': 'NP', 'role': 'Recipient', 'restr': 'b'},
+            {'elem': 'that'}, {'elem': 'S', 'role': 'Topic', 'restr': 'c'}])
+        frame.precompute_variants()
+
+        self.assertEqual(frame.without_that(), frame.without('that'))
+        self.assertIs(frame.without_that(), frame.without_that())
+        self.assertEqual(list(frame.passivized()), frame.passivize())
+        self.assertIs(frame.passivized(), frame.passivized())
+        without_that = frame.without_that()
+        self.assertIs(without_that.without_that(), without_that)
+
+        unpickled = pickle.loads(pickle.dumps(frame))
+        self.assertEqual(unpickled.without_that(), frame.without_that())
+        self.assertEqual(unpickled.passivized(), frame.passivized())
+        self.assertEqual(unpickled.passivized()[0].without_that(),
+                         frame.passivized()[0].without('that'))
+
 if __name__ == '__main__':
     unittest.main()
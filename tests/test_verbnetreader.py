@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 
+import os
+import pathlib
 import sys
+import tempfile
 import unittest
 import xml.etree.ElementTree as ET
 
-from verbnetreader import VerbnetReader
+from verbnetreader import VerbnetReader, candidate_frames, init_verbnet
 import paths
 from verbnetframe import VerbnetOfficialFrame
 from verbnetrestrictions import VNRestriction
@@ -109,5 +112,90 @@ class VerbnetReaderTest(unittest.TestCase):
 
         self.assertEqual(reader.frames_for_verb, expected_result)
 
+
+class VerbnetSnapshotTest(unittest.TestCase):
+    '''init_verbnet must reuse its snapshot until VerbNet changes'''
+
+    vnclass = """<?xml version="1.0" encoding="UTF-8"?>
+<VNCLASS ID="snooze-40.4">
+  <MEMBERS>{members}</MEMBERS>
+  <THEMROLES>
+    <THEMROLE type="Agent">
+      <SELRESTRS><SELRESTR Value="+" type="animate"/></SELRESTRS>
+    </THEMROLE>
+  </THEMROLES>
+  <FRAMES>
+    <FRAME>
+      <DESCRIPTION primary="NP V"/>
+      <SYNTAX><NP value="Agent"><SYNRESTRS/></NP><VERB/></SYNTAX>
+    </FRAME>
+  </FRAMES>
+  <SUBCLASSES/>
+</VNCLASS>"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.verbnet = pathlib.Path(self.tmpdir.name) / 'verbnet'
+        self.verbnet.mkdir()
+        self.old_cache = paths.Paths.CACHE
+        paths.Paths.CACHE = pathlib.Path(self.tmpdir.name) / 'cache'
+        self.write_class(['snooze'])
+
+    def tearDown(self):
+        paths.Paths.CACHE = self.old_cache
+        self.tmpdir.cleanup()
+
+    def write_class(self, members, mtime=None):
+        filename = self.verbnet / 'snooze-40.4.xml'
+        filename.write_text(self.vnclass.format(members=''.join(
+            '<MEMBER name="{}"/>'.format(m) for m in members)))
+        if mtime is not None:
+            os.utime(str(filename), (mtime, mtime))
+
+    def test_snapshot(self):
+        frames_for_verb, classes = init_verbnet(self.verbnet)
+        self.assertEqual(classes, {'snooze': ['snooze-40.4']})
+        self.assertEqual(len(list(paths.Paths.CACHE.glob('verbnet-*'))), 1)
+
+        # Warm start: same content, read from the snapshot
+        warm_frames_for_verb, warm_classes = init_verbnet(self.verbnet)
+        self.assertEqual(warm_frames_for_verb, frames_for_verb)
+        self.assertEqual(warm_classes, classes)
+
+        # Any change to VerbNet invalidates the snapshot
+        self.write_class(['snooze', 'nap'], mtime=1)
+        frames_for_verb, classes = init_verbnet(self.verbnet)
+        self.assertEqual(set(classes), {'snooze', 'nap'})
+        self.assertEqual(frames_for_verb['nap'], frames_for_verb['snooze'])
+
+    def test_parallel(self):
+        (self.verbnet / 'nap-40.4.xml').write_text(
+            self.vnclass.replace('snooze-40.4', 'nap-40.4').format(
+                members='<MEMBER name="nap"/><MEMBER name="snooze"/>'))
+        reader = VerbnetReader(self.verbnet)
+        parallel_reader = VerbnetReader(self.verbnet, jobs=2)
+        self.assertEqual(parallel_reader.frames_for_verb,
+                         reader.frames_for_verb)
+        self.assertEqual(parallel_reader.classes, reader.classes)
+        self.assertEqual(parallel_reader.cnames, reader.cnames)
+
+    def test_candidate_frames(self):
+        transitive = VerbnetOfficialFrame('hit-18.1', [
+            {'elem': 'NP', 'role': 'Agent'}, {'elem': 'V'},
+            {'elem': 'NP', 'role': 'Patient'}])
+        intransitive = VerbnetOfficialFrame('hit-18.1', [
+            {'elem': 'NP', 'role': 'Agent'}, {'elem': 'V'}])
+        # Inherited twice, from a class and its subclass
+        table = candidate_frames(
+            {'hit': [transitive, intransitive, transitive]})
+
+        # As many times as they were inherited
+        self.assertEqual(table['hit'].active,
+                         (intransitive, transitive, transitive))
+        self.assertEqual(
+            table['hit'].passive,
+            intransitive.passivized() + transitive.passivized() +
+            transitive.passivized())
+
 if __name__ == '__main__':
     unittest.main()
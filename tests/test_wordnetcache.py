@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+import pathlib
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import headwordextractor
+import options
+import wordnetcache
+
+
+class ClassStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.filename = pathlib.Path(self.cache_dir.name) / 'classes.sqlite'
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test_classes(self):
+        classes = wordnetcache.ClassStore(self.filename)
+        self.assertEqual(classes.get('soda'), (False, None))
+        classes.put('soda', 'abstraction.n.06')
+        classes.put('abcde', None)
+        self.assertEqual(classes.get('soda'), (True, 'abstraction.n.06'))
+        # Not in WordNet, but known
+        self.assertEqual(classes.get('abcde'), (True, None))
+        classes.close()
+
+    def test_shared(self):
+        writer = wordnetcache.ClassStore(self.filename)
+        reader = wordnetcache.ClassStore(self.filename)
+        writer.update([('dog', 'physical_entity.n.01'), ('abcde', None)])
+        self.assertEqual(reader.words(), {'dog', 'abcde'})
+        self.assertEqual(reader.get('dog'), (True, 'physical_entity.n.01'))
+        self.assertEqual(len(reader), 2)
+        writer.close()
+        reader.close()
+
+    def test_disabled(self):
+        wordnet_cache = options.Options.wordnet_cache
+        options.Options.wordnet_cache = False
+        try:
+            self.assertIsNone(wordnetcache.store())
+        finally:
+            options.Options.wordnet_cache = wordnet_cache
+
+
+class GetClassTest(unittest.TestCase):
+
+    def setUp(self):
+        headwordextractor.get_class.cache_clear()
+
+    def tearDown(self):
+        headwordextractor.get_class.cache_clear()
+
+    def test_store_errors(self):
+        classes = mock.Mock(filename='classes.sqlite')
+        locked = sqlite3.OperationalError('database is locked')
+        with mock.patch.object(wordnetcache, 'store', return_value=classes), \
+                mock.patch.object(headwordextractor, 'wordnet_class',
+                                  return_value='abstraction.n.06'):
+            classes.get.side_effect = locked
+            with self.assertLogs('headwordextractor', 'WARNING'):
+                self.assertEqual(headwordextractor.get_class('soda'),
+                                 'abstraction.n.06')
+            classes.get.side_effect = None
+            classes.get.return_value = (False, None)
+            classes.put.side_effect = locked
+            with self.assertLogs('headwordextractor', 'WARNING'):
+                self.assertEqual(headwordextractor.get_class('pop'),
+                                 'abstraction.n.06')
+
+
+if __name__ == '__main__':
+    unittest.main()